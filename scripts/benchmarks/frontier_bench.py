@@ -0,0 +1,138 @@
+"""Deep-crawl discovery benchmark on a synthetic site served from localhost.
+
+Builds a random link graph (default 5,000 pages x 10 links = 50,000 links),
+then measures:
+
+1. frontier bookkeeping alone, old list queue vs ``Frontier``, on that graph;
+2. a full ``DeepCrawl`` discovery of the graph over HTTP.
+
+    python scripts/benchmarks/frontier_bench.py [--pages 5000] [--links 10] [--skip-http]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.discovery import DeepCrawl  # noqa: E402
+from llmstxt.frontier import Frontier  # noqa: E402
+from llmstxt.profiles import SiteProfile  # noqa: E402
+
+
+def make_graph(pages, links, seed=0):
+    """page index -> list of linked page indexes; page 0 reaches everything."""
+    rng = random.Random(seed)
+    graph = {}
+    for i in range(pages):
+        # A chain guarantees every page is reachable; the rest are random links
+        targets = [(i + 1) % pages] + [rng.randrange(pages) for _ in range(links - 1)]
+        graph[i] = targets
+    return graph
+
+
+def page_url(base, i):
+    # Mixed trailing slashes and fragments exercise normalization
+    return f"{base}/docs/p{i}" + ("/" if i % 2 else "") + ("#top" if i % 3 == 0 else "")
+
+
+def old_frontier(graph, base):
+    """The original convert_chartjs.py loop: list queue, pop(0), `in queue`."""
+    queue = [page_url(base, 0)]
+    visited = {}
+    while queue:
+        current = queue.pop(0)
+        if current in visited:
+            continue
+        visited[current] = True
+        i = int(current.split('/p')[-1].split('/')[0].split('#')[0])
+        for j in graph[i]:
+            url = page_url(base, j).split('#')[0]
+            if url not in visited and url not in queue:
+                queue.append(url)
+    return len(visited)
+
+
+def new_frontier(graph, base):
+    frontier = Frontier([page_url(base, 0)])
+    visited = 0
+    while frontier:
+        current, depth = frontier.pop()
+        visited += 1
+        i = int(current.split('/p')[-1].split('/')[0].split('#')[0])
+        for j in graph[i]:
+            frontier.add(page_url(base, j), depth + 1)
+    return visited
+
+
+def serve(graph):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            try:
+                i = int(self.path.split('/p')[-1].strip('/'))
+                targets = graph[i]
+            except (ValueError, KeyError):
+                self.send_error(404)
+                return
+            links = "".join(f'<a href="{page_url("", j)}">p{j}</a>' for j in targets)
+            body = f"<html><body><nav>{links}</nav><article><h1>Page {i}</h1></article></body></html>"
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 128   # DeepCrawl connects concurrently; a backlog of 5 drops connections
+
+    server = Server(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5000)
+    parser.add_argument("--links", type=int, default=10, help="links per page")
+    parser.add_argument("--skip-http", action="store_true", help="only benchmark the frontier structures")
+    args = parser.parse_args()
+
+    graph = make_graph(args.pages, args.links)
+    base = "http://127.0.0.1"
+    print(f"Graph: {args.pages} pages, {args.pages * args.links} links")
+
+    for name, func in (("list frontier", old_frontier), ("Frontier", new_frontier)):
+        start = time.perf_counter()
+        visited = func(graph, base)
+        print(f"  {name:<14} {time.perf_counter() - start:8.3f}s  ({visited} pages)")
+
+    if args.skip_http:
+        return
+
+    server = serve(graph)
+    base = f"http://127.0.0.1:{server.server_port}"
+    profile = SiteProfile("bench", "Bench", os.devnull, DeepCrawl(base + "/docs/p0"),
+                          base_url=base, include_prefixes=["/docs/"], rate=0)
+    start = time.perf_counter()
+    # Silence the per-page progress lines
+    stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        with profile.discovery.crawl(profile) as store:
+            found = len(store)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    elapsed = time.perf_counter() - start
+    print(f"  DeepCrawl over HTTP {elapsed:8.3f}s  ({found} pages, {found / elapsed:.0f} pages/s)")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Tree-walk time of the single-pass Markdown converter against the old per-element loop.
+
+Parses the Proxmox VE Administration Guide once with html.parser, then times
+converting its ``id="content"`` div with the loop ``convert.py`` used to carry
+(``get_text()`` and ``find_parent(s)`` per element) and with
+``MarkdownConverter`` as ``convert.py`` configures it. Parsing is timed
+separately, as it dominates an end-to-end run.
+
+    python scripts/benchmarks/markdown_bench.py [--repeat 5] [path/to/guide.html]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import bs4
+from bs4 import BeautifulSoup
+
+SCRIPTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS)
+
+from convert import CONVERTER  # noqa: E402
+
+GUIDE = os.path.join(os.path.dirname(SCRIPTS), 'json-and-html', 'Proxmox VE Administration Guide.html')
+
+
+def clean_text(text):
+    if not text:
+        return ""
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    return text.strip()
+
+
+def old_loop(content_div):
+    """The element loop of the original convert.py (same logic, comments dropped)."""
+    output = []
+    for element in content_div.descendants:
+        if isinstance(element, bs4.element.NavigableString):
+            continue
+        if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            level = int(element.name[1])
+            text = element.get_text(strip=True).replace("Permalink to this heading", "")
+            output.append(f"\n\n{'#' * level} {text}\n")
+        elif element.name == 'p':
+            if element.find_parent(['td', 'li']):
+                continue
+            text = clean_text(element.get_text())
+            if text:
+                output.append(f"\n{text}\n")
+        elif element.name == 'pre' or (element.name == 'div' and 'listingblock' in element.get('class', [])):
+            code_text = element.get_text()
+            if code_text.strip():
+                output.append(f"\n```\n{code_text}\n```\n")
+        elif element.name == 'li':
+            parents = len(element.find_parents(['ul', 'ol'])) - 1
+            indent = "  " * parents
+            prefix = "1." if element.parent.name == 'ol' else "*"
+            text = clean_text(element.get_text(strip=True))
+            if text:
+                output.append(f"{indent}{prefix} {text}\n")
+        elif element.name == 'div' and 'admonitionblock' in element.get('class', []):
+            role_div = element.find('td', class_='icon')
+            content_cell = element.find('td', class_='content')
+            if role_div and content_cell:
+                role = role_div.get_text(strip=True) or "Note"
+                text = clean_text(content_cell.get_text())
+                output.append(f"\n> **{role.upper()}:** {text}\n")
+    return clean_text("".join(output))
+
+
+def new_walk(content_div):
+    return clean_text(CONVERTER.convert(content_div))
+
+
+def best_of(func, arg, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", nargs="?", default=GUIDE)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per converter; the best is reported")
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        html = f.read()
+    print(f"{os.path.basename(args.input)}: {len(html) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    soup = BeautifulSoup(html, 'html.parser')
+    print(f"  html.parser parse     {time.perf_counter() - start:6.2f}s")
+    content = soup.find('div', id='content') or soup.body
+
+    for name, func in (("old convert.py loop", old_loop), ("MarkdownConverter", new_walk)):
+        seconds, text = best_of(func, content, args.repeat)
+        print(f"  {name:<21} {seconds:6.2f}s  ({len(text) / 1e6:.2f} MB out, best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
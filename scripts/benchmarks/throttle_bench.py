@@ -0,0 +1,103 @@
+"""Fetch-scheduler check against a local stand-in server that throttles.
+
+The server answers 429 (with ``Retry-After``) when more than ``--max-inflight``
+requests are in progress or more than ``--max-rps`` arrived in the last
+second, and fails a random ``--error-rate`` of requests with a bare 503.
+The crawl must still come back complete; the report shows how many requests
+were throttled and the throughput the scheduler settled on.
+
+    python scripts/benchmarks/throttle_bench.py [--pages 400] [--max-inflight 6] [--max-rps 60]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.fetch import iter_pages  # noqa: E402
+
+
+def serve(max_inflight, max_rps, error_rate, latency):
+    lock = threading.Lock()
+    state = {'inflight': 0, 'ok': 0, 'throttled': 0, 'errors': 0, 'peak': 0}
+    arrivals = deque()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            now = time.monotonic()
+            with lock:
+                while arrivals and arrivals[0] < now - 1:
+                    arrivals.popleft()
+                arrivals.append(now)
+                state['inflight'] += 1
+                state['peak'] = max(state['peak'], state['inflight'])
+                too_busy = state['inflight'] > max_inflight or len(arrivals) > max_rps
+            try:
+                if too_busy:
+                    with lock:
+                        state['throttled'] += 1
+                    self.reply(429, b"slow down", {'Retry-After': '1'})
+                elif random.random() < error_rate:
+                    with lock:
+                        state['errors'] += 1
+                    self.reply(503, b"try again")
+                else:
+                    time.sleep(latency)
+                    with lock:
+                        state['ok'] += 1
+                    self.reply(200, f"<html><body><article>{self.path}</article></body></html>".encode())
+            finally:
+                with lock:
+                    state['inflight'] -= 1
+
+        def reply(self, status, body, headers=None):
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--max-inflight", type=int, default=6)
+    parser.add_argument("--max-rps", type=int, default=60)
+    parser.add_argument("--error-rate", type=float, default=0.03)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per successful response")
+    args = parser.parse_args()
+
+    server, state = serve(args.max_inflight, args.max_rps, args.error_rate, args.latency)
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/page/{i}" for i in range(args.pages)]
+
+    start = time.perf_counter()
+    pages = list(iter_pages(urls, concurrency=2, max_concurrency=32, rate=None, retries=10))
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    complete = sum(1 for page in pages if page.status == 200)
+    print(f"\n{complete}/{len(urls)} pages fetched in {elapsed:.1f}s ({complete / elapsed:.0f} pages/s)")
+    print(f"server: {state['throttled']} throttled (429), {state['errors']} injected 503s, "
+          f"peak {state['peak']} in flight (limit {args.max_inflight})")
+    if complete != len(urls):
+        raise SystemExit("incomplete crawl")
+
+
+if __name__ == "__main__":
+    main()
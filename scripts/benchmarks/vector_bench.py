@@ -0,0 +1,70 @@
+"""Query latency of the embedding store at corpus scale.
+
+Writes a synthetic store of ``--rows`` random unit vectors (int8 or float16,
+as ``llms.py embed`` would) to a temporary directory and times top-k
+queries against the memory-mapped copy, one at a time and in batches.
+
+    python scripts/benchmarks/vector_bench.py [--rows 50000] [--dim 384] [--dtype int8]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.embed import META_NAME, SCALES_NAME, VECTORS_NAME, VectorStore, normalize, quantize  # noqa: E402
+
+
+def write_store(directory, rows, dim, dtype):
+    rng = np.random.default_rng(0)
+    vectors = normalize(rng.standard_normal((rows, dim)).astype(np.float32))
+    if dtype == 'int8':
+        stored, scales = quantize(vectors)
+    else:
+        stored, scales = vectors.astype(dtype), np.ones(rows, dtype=np.float32)
+    np.save(os.path.join(directory, VECTORS_NAME), stored)
+    np.save(os.path.join(directory, SCALES_NAME), scales)
+    with open(os.path.join(directory, META_NAME), 'w') as f:
+        json.dump({'encoder': f'hash:{dim}', 'dim': dim, 'dtype': dtype, 'count': rows,
+                   'index': {'docs': rows, 'size': 0}}, f)
+    return vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--dtype", choices=("int8", "float16"), default="int8")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        exact = write_store(directory, args.rows, args.dim, args.dtype)
+        store = VectorStore(directory)
+        queries = exact[:32] + np.random.default_rng(1).standard_normal((32, args.dim)).astype(np.float32) * 0.01
+
+        store.search_vectors(queries[:1])   # warm the page cache
+        start = time.perf_counter()
+        for i in range(args.repeat):
+            (ids, _), = store.search_vectors(queries[i % len(queries)], k=10)
+        single = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        results = store.search_vectors(queries, k=10)
+        batched = (time.perf_counter() - start) / len(queries)
+
+        # Each query is a perturbed copy of a stored row, which should come back first
+        recall = sum(ids[0] == i for i, (ids, _) in enumerate(results)) / len(results)
+        del store
+
+    print(f"{args.rows} x {args.dim} {args.dtype}: {single * 1000:.1f} ms per single query, "
+          f"{batched * 1000:.2f} ms per query in batches of {len(queries)}, top-1 recall {recall:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,8 @@
-import json
 import sys
 import os
-
-def clean_text(text):
-    if not text: return ""
-    return " ".join(str(text).split())
+from llmstxt.jsonstream import JsonDocument
+from llmstxt.openapi import OpenApi, clean_text
+from llmstxt.report import write_report
 
 def main():
     # 1. Determine input file from command line or default
@@ -25,57 +23,34 @@ def main():
 
     print(f"Reading {input_filename}...")
     try:
-        with open(input_filename, 'r', encoding='utf-8') as f:
-            spec = json.load(f)
+        # Memory-mapped and decoded one path item at a time; the spec is never fully loaded
+        spec = JsonDocument(input_filename)
+        api = OpenApi(spec, appendix=True)
+        info = api.info()
     except Exception as e:
         print(f"Failed to parse JSON: {e}")
         return
 
-    output = []
-    
-    # Header
-    info = spec.get('info', {})
-    output.append(f"# {info.get('title', 'API Documentation')}")
-    output.append(f"Description: {clean_text(info.get('description', ''))}\n")
-
-    paths = spec.get('paths', {})
-    print(f"Processing {len(paths)} endpoints...")
-
-    for path, path_item in paths.items():
-        for method_name, details in path_item.items():
-            # Skip non-dict items (safety check for Emby/Jellyfin quirks)
-            if not isinstance(details, dict):
-                continue
-            
-            method_str = method_name.upper()
-            summary = clean_text(details.get('summary', ''))
-            description = clean_text(details.get('description', ''))
-            
-            output.append(f"## {method_str} {path}")
-            if summary: output.append(f"**Summary**: {summary}")
-            if description and description != summary:
-                output.append(f"**Details**: {description}")
-
-            # Parameters
-            params = details.get('parameters', [])
-            if params:
-                output.append("**Parameters**:")
-                for p in params:
-                    if not isinstance(p, dict): continue
-                    name = p.get('name', '?')
-                    loc = p.get('in', '?') 
-                    type_hint = p.get('schema', {}).get('type', '')
-                    desc = clean_text(p.get('description', ''))
-                    required = "*" if p.get('required') else ""
-                    
-                    output.append(f"- `{name}`{required} ({loc} {type_hint}): {desc}")
-
-            output.append("") 
-
-    print(f"Writing to {output_filename}...")
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        f.write("\n".join(output))
-    
+    print(f"Processing endpoints, writing to {output_filename}...")
+    count = 0
+    with spec, open(output_filename, 'w', encoding='utf-8') as f:
+        # Header
+        f.write(f"# {info.get('title', 'API Documentation')}\n")
+        f.write(f"Description: {clean_text(info.get('description', ''))}\n")
+
+        for path, path_item in api.paths():
+            count += 1
+            # Each endpoint is written as soon as it's rendered
+            for section in api.endpoint_sections(path, path_item):
+                f.write("\n" + "\n".join(section))
+
+        # Each model used above, once, instead of expanded in every endpoint
+        for section in api.appendix_sections():
+            f.write("\n" + "\n".join(section))
+
+    print(f"Processed {count} endpoints.")
+    print(api.savings_report())
+    write_report(output_filename)
     print("Success!")
 
 if __name__ == "__main__":
@@ -1,49 +1,64 @@
+import asyncio
+import sys
 import time
-from playwright.sync_api import sync_playwright
+from urllib.parse import urlparse
+from llmstxt.browser import BrowserPool
+from llmstxt.report import write_report
+from llmstxt.summary import write_llms_txt
 
 START_URL = "https://docs.nestjs.com/"
 OUTPUT_FILE = "nestjs_full.txt"
+# Pages rendered in parallel (one browser context each)
+POOL_SIZE = 4
+
+async def get_links(page, start_url):
+    print("Loading homepage to find links...")
+    await page.goto(start_url)
+    await page.wait_for_selector("app-menu") # Wait for sidebar
+
+    # Extract all sidebar links
+    return await page.eval_on_selector_all("app-menu a", "elements => elements.map(e => e.href)")
+
+async def extract(page, url):
+    await page.goto(url, wait_until="domcontentloaded")
+    # specific wait for content to ensure it's loaded
+    await page.wait_for_selector(".content", timeout=5000)
+
+    # Extract text content from the main article div
+    # We use innerText to get readable text (strips tags automatically)
+    content = await page.inner_text(".content")
+    title = await page.title()
+    return title, content
+
+async def run(start_url):
+    host = urlparse(start_url).netloc
+    start = time.perf_counter()
+
+    async with BrowserPool(size=POOL_SIZE) as pool:
+        links = await pool.run(get_links, start_url)
 
-def run():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        print("Loading homepage to find links...")
-        page.goto(START_URL)
-        page.wait_for_selector("app-menu") # Wait for sidebar
-        
-        # Extract all sidebar links
-        links = page.eval_on_selector_all("app-menu a", "elements => elements.map(e => e.href)")
-        
         # Filter links
-        urls = sorted(list(set([l for l in links if "docs.nestjs.com" in l and not "support" in l])))
+        urls = sorted(list(set([l for l in links if host in l and not "support" in l])))
         print(f"Found {len(urls)} pages.")
-        
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            f.write("# NestJS Docs\n\n")
-            
-            for i, url in enumerate(urls):
-                print(f"[{i+1}/{len(urls)}] Processing {url}")
-                try:
-                    page.goto(url)
-                    # specific wait for content to ensure it's loaded
-                    page.wait_for_selector(".content", timeout=5000)
-                    
-                    # Extract text content from the main article div
-                    # We use innerText to get readable text (strips tags automatically)
-                    # Or we can get HTML and parse with BS4 if we want formatting.
-                    # Here we grab text for speed and cleanliness:
-                    content = page.inner_text(".content")
-                    
-                    title = page.title()
-                    f.write(f"# {title}\nSource: {url}\n\n{content}\n\n{'='*80}\n\n")
-                    
-                except Exception as e:
-                    print(f"Error on {url}: {e}")
-
-        browser.close()
-        print("Done.")
+
+        # Results come back in URL order even though pages render concurrently
+        results = await pool.map(urls, extract)
+
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write("# NestJS Docs\n\n")
+
+        for i, (url, result) in enumerate(zip(urls, results)):
+            print(f"[{i+1}/{len(urls)}] Processing {url}")
+            if isinstance(result, Exception):
+                print(f"Error on {url}: {result}")
+                continue
+            title, content = result
+            f.write(f"# {title}\nSource: {url}\n\n{content}\n\n{'='*80}\n\n")
+
+    print(f"Done in {time.perf_counter() - start:.1f}s.")
+    write_report(OUTPUT_FILE)
+    write_llms_txt(OUTPUT_FILE)
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    # Pass a URL to extract from another copy of the site, e.g. a locally served mirror
+    asyncio.run(run(sys.argv[1] if len(sys.argv) > 1 else START_URL))
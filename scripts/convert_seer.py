@@ -1,6 +1,9 @@
+import asyncio
 import json
-import time
-from playwright.sync_api import sync_playwright
+from llmstxt.browser import BrowserPool
+from llmstxt.openapi import OpenApi, clean_text
+from llmstxt.report import write_report
+from llmstxt.specs import discover_spec
 
 # --- Configuration ---
 TARGET_URL = "http://192.168.86.116:5055/api-docs/"
@@ -9,95 +12,95 @@ OUTPUT_TXT = "llms-api.txt"
 
 def json_to_markdown(spec):
     """Converts the JSON spec to a simplified text format for LLMs."""
-    output = []
-    
-    info = spec.get('info', {})
-    output.append(f"# {info.get('title', 'API Documentation')}")
-    output.append(f"Description: {info.get('description', '')}\n")
-    
-    paths = spec.get('paths', {})
-    for path, methods in paths.items():
-        for method, details in methods.items():
-            summary = details.get('summary', 'No summary')
-            desc = details.get('description', '')
-            output.append(f"## {method.upper()} {path}")
-            output.append(f"**Summary**: {summary}")
-            if desc:
-                # Truncate long descriptions to save tokens
-                clean_desc = desc.split('\n')[0][:200]
-                output.append(f"**Details**: {clean_desc}")
-            
-            # Parameters
-            params = details.get('parameters', [])
-            if params:
-                param_list = []
-                for p in params:
-                    req = "*" if p.get('required') else ""
-                    param_list.append(f"{p['name']}{req} ({p.get('in','')})")
-                output.append(f"**Params**: {', '.join(param_list)}")
-            
-            output.append("") # Spacer
+    api = OpenApi(spec)
+    info = api.info()
+    output = [f"# {info.get('title', 'API Documentation')}",
+              f"Description: {clean_text(info.get('description', ''))}\n"]
+
+    for path, path_item in api.paths():
+        for section in api.endpoint_sections(path, path_item):
+            output.extend(section)
 
     return "\n".join(output)
 
-def run():
+SPEC_FROM_UI = """() => {
+    if (window.ui && window.ui.specSelectors && window.ui.specSelectors.specJson) {
+        // specJson() returns an Immutable.js object, we convert it to standard JS
+        return window.ui.specSelectors.specJson().toJS();
+    }
+    return null;
+}"""
+
+SPEC_LOADED = """() => window.ui && window.ui.specSelectors && window.ui.specSelectors.specJson
+    && window.ui.specSelectors.specJson().size > 0"""
+
+async def extract_spec(page, url):
+    await page.goto(url, wait_until="domcontentloaded")
+
+    # Wait for the Swagger UI element to actually appear on screen
+    print("Waiting for Swagger UI to load...")
+    await page.wait_for_selector(".swagger-ui", timeout=10000)
+
+    # Wait until Swagger UI has the spec in memory instead of sleeping a fixed time
+    try:
+        await page.wait_for_function(SPEC_LOADED, timeout=10000)
+    except Exception:
+        pass
+
+    print("Extracting spec from browser memory...")
+    # We execute JavaScript inside the browser to get the data from the Global 'ui' object
+    # standard Swagger UI exposes 'window.ui'
+    spec = await page.evaluate(SPEC_FROM_UI)
+
+    if not spec:
+        print("Failed to find 'window.ui' object. Trying fallback (network interception)...")
+        # Fallback: Sometimes it's not in window.ui, but we can grab the 'openapi' object if it exists
+        spec = await page.evaluate("() => window.openapi || window.swaggerDoc || null")
+
+    if not spec:
+        print("Debug: Taking screenshot...")
+        await page.screenshot(path="debug_error.png")
+    return spec
+
+def save(spec):
+    print("Success! Extracted API Specification.")
+
+    # 1. Save JSON
+    with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
+        json.dump(spec, f, indent=2)
+    print(f"-> Saved raw JSON to {OUTPUT_JSON}")
+
+    # 2. Convert to Markdown
+    print("Converting to AI-friendly format...")
+    md_text = json_to_markdown(spec)
+    with open(OUTPUT_TXT, 'w', encoding='utf-8') as f:
+        f.write(md_text)
+    print(f"-> Saved context to {OUTPUT_TXT}")
+    write_report(OUTPUT_TXT)
+
+async def run():
+    # Most Swagger UI deployments serve the spec at a fetchable URL; no browser needed.
+    # The probes are blocking HTTP calls, so they run off the event loop.
+    spec, source = await asyncio.to_thread(discover_spec, TARGET_URL)
+    if spec:
+        print(f"Found spec at {source}")
+        save(spec)
+        return
+
     print(f"Launching headless browser to inspect {TARGET_URL}...")
-    
-    with sync_playwright() as p:
-        # Launch Chromium (headless means no visible UI)
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
-        try:
-            page.goto(TARGET_URL)
-            
-            # Wait for the Swagger UI element to actually appear on screen
-            print("Waiting for Swagger UI to load...")
-            page.wait_for_selector(".swagger-ui", timeout=10000)
-            
-            # Give it a moment to finish processing (Swagger UI can be slow to hydrate)
-            time.sleep(2)
-            
-            print("Extracting spec from browser memory...")
-            # We execute JavaScript inside the browser to get the data from the Global 'ui' object
-            # standard Swagger UI exposes 'window.ui'
-            spec = page.evaluate("""() => {
-                if (window.ui && window.ui.specSelectors && window.ui.specSelectors.specJson) {
-                    // specJson() returns an Immutable.js object, we convert it to standard JS
-                    return window.ui.specSelectors.specJson().toJS();
-                }
-                return null;
-            }""")
-            
-            if not spec:
-                print("Failed to find 'window.ui' object. Trying fallback (network interception)...")
-                # Fallback: Sometimes it's not in window.ui, but we can grab the 'openapi' object if it exists
-                spec = page.evaluate("() => window.openapi || window.swaggerDoc || null")
-
-            if spec:
-                print("Success! Extracted API Specification.")
-                
-                # 1. Save JSON
-                with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-                    json.dump(spec, f, indent=2)
-                print(f"-> Saved raw JSON to {OUTPUT_JSON}")
-                
-                # 2. Convert to Markdown
-                print("Converting to AI-friendly format...")
-                md_text = json_to_markdown(spec)
-                with open(OUTPUT_TXT, 'w', encoding='utf-8') as f:
-                    f.write(md_text)
-                print(f"-> Saved context to {OUTPUT_TXT}")
-                
-            else:
-                print("CRITICAL: Could not find API spec object in browser memory.")
-                print("Debug: Taking screenshot...")
-                page.screenshot(path="debug_error.png")
-
-        except Exception as e:
-            print(f"An error occurred: {e}")
-        finally:
-            browser.close()
+
+    try:
+        # One page is enough; images/fonts are blocked and a shared browser is reused if running
+        async with BrowserPool(size=1) as pool:
+            spec = await pool.run(extract_spec, TARGET_URL)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return
+
+    if spec:
+        save(spec)
+    else:
+        print("CRITICAL: Could not find API spec object in browser memory.")
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    asyncio.run(run())
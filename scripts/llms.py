@@ -0,0 +1,10 @@
+"""Build llms text files for any registered documentation site.
+
+    python llms.py list
+    python llms.py build lit react-learn
+    python llms.py chunk ../llms --output-dir ../llms/shards
+"""
+from llmstxt.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Shared building blocks for the llms.txt converter scripts.
+
+The scripts in ``scripts/`` import from this package directly (``scripts/`` is
+on ``sys.path`` when a script is run), e.g.::
+
+    from llmstxt.fetch import iter_pages
+
+Site crawlers are declared as profiles in ``llmstxt.sites`` and built with
+``llmstxt.engine.build`` (or ``python llms.py build <site>``).
+"""
+import importlib
+
+# Names are imported on first use, so a script that only needs e.g.
+# ``llmstxt.jsonstream`` doesn't pay for importing requests and BeautifulSoup.
+_EXPORTS = {
+    "HttpCache": "llmstxt.cache",
+    "IncrementalOutput": "llmstxt.incremental",
+    "MarkdownConverter": "llmstxt.markdown",
+    "PROFILES": "llmstxt.sites",
+    "Page": "llmstxt.fetch",
+    "SiteProfile": "llmstxt.profiles",
+    "TokenBucket": "llmstxt.fetch",
+    "build": "llmstxt.engine",
+    "build_all": "llmstxt.orchestrate",
+    "converter_version": "llmstxt.incremental",
+    "fetch_pages": "llmstxt.fetch",
+    "get_profile": "llmstxt.sites",
+    "iter_pages": "llmstxt.fetch",
+    "register": "llmstxt.sites",
+}
+
+__all__ = [
+    "HttpCache",
+    "IncrementalOutput",
+    "MarkdownConverter",
+    "PROFILES",
+    "Page",
+    "SiteProfile",
+    "TokenBucket",
+    "build",
+    "build_all",
+    "converter_version",
+    "fetch_pages",
+    "get_profile",
+    "iter_pages",
+    "register",
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module 'llmstxt' has no attribute {name!r}")
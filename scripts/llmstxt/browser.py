@@ -0,0 +1,137 @@
+"""Pool of Playwright pages for the JS-rendered sites (NestJS, Swagger UI).
+
+``BrowserPool`` opens ``size`` browser contexts, each with one page, and
+hands them out to coroutines so several pages render in parallel. Requests
+for images, fonts, media and common analytics hosts are aborted in every
+context: none of them change the text we extract, and they are most of a
+page's load time.
+
+The browser itself can outlive a script run: start one with
+``python llms.py browser`` and point the scripts at it with
+``LLMSTXT_BROWSER_CDP=http://127.0.0.1:9222``; they then connect over CDP
+instead of launching Chromium, and only close their own contexts.
+"""
+import asyncio
+import os
+import time
+from urllib.parse import urlparse
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CDP_PORT = 9222
+CDP_ENV = 'LLMSTXT_BROWSER_CDP'
+
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'carbonads.net',
+    'carbonads.com',
+    'hotjar.com',
+    'segment.io',
+    'cdn.segment.com',
+    'plausible.io',
+    'sentry.io',
+)
+
+
+def is_blocked(resource_type, url):
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = urlparse(url).hostname or ''
+    return any(host == h or host.endswith('.' + h) for h in BLOCKED_HOSTS)
+
+
+async def _route(route):
+    request = route.request
+    if is_blocked(request.resource_type, request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """Async context manager handing out `size` ready-to-use Playwright pages.
+
+    Usage::
+
+        async with BrowserPool(size=4) as pool:
+            titles = await pool.map(urls, fetch_title)   # async def fetch_title(page, url)
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, cdp_url=None, headless=True):
+        self.size = size
+        self.cdp_url = cdp_url if cdp_url is not None else os.environ.get(CDP_ENV)
+        self.headless = headless
+        self.playwright = None
+        self.browser = None
+        self.contexts = []
+        self.pages = None
+
+    async def __aenter__(self):
+        from playwright.async_api import async_playwright
+
+        self.playwright = await async_playwright().start()
+        try:
+            if self.cdp_url:
+                print(f"Connecting to shared browser at {self.cdp_url}...")
+                self.browser = await self.playwright.chromium.connect_over_cdp(self.cdp_url)
+            else:
+                self.browser = await self.playwright.chromium.launch(headless=self.headless)
+
+            self.pages = asyncio.Queue()
+            for _ in range(self.size):
+                context = await self.browser.new_context()
+                self.contexts.append(context)
+                await context.route("**/*", _route)
+                self.pages.put_nowait(await context.new_page())
+        except BaseException:
+            # Don't leave the Playwright driver (or a launched browser) running
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Closes whatever was opened so far: contexts, our own browser, the driver."""
+        for context in self.contexts:
+            await context.close()
+        self.contexts = []
+        # A shared browser belongs to whoever started it
+        if self.browser is not None and not self.cdp_url:
+            await self.browser.close()
+        self.browser = None
+        if self.playwright is not None:
+            await self.playwright.stop()
+        self.playwright = None
+
+    async def run(self, func, *args):
+        """Calls `await func(page, *args)` with a page from the pool."""
+        page = await self.pages.get()
+        try:
+            return await func(page, *args)
+        finally:
+            self.pages.put_nowait(page)
+
+    async def map(self, items, func, return_exceptions=True):
+        """Runs `func(page, item)` for every item, `size` at a time; results keep the item order."""
+        return await asyncio.gather(*(self.run(func, item) for item in items),
+                                    return_exceptions=return_exceptions)
+
+
+def serve(port=DEFAULT_CDP_PORT):
+    """Keeps a headless Chromium running for `LLMSTXT_BROWSER_CDP` until interrupted."""
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=[f"--remote-debugging-port={port}"])
+        print(f"Shared browser running. In another shell:\n  export {CDP_ENV}=http://127.0.0.1:{port}")
+        print("Press Ctrl+C to stop.")
+        try:
+            while browser.is_connected():
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        browser.close()
@@ -0,0 +1,114 @@
+"""Persistent on-disk HTTP cache with conditional revalidation.
+
+Layout under the cache root::
+
+    meta/<sha256(url)>.json     {"url", "etag", "last_modified", "sha256",
+                                 "validated", "max_age"}
+    bodies/<sha256(body)>       raw response body (content-addressed)
+
+On a re-run the fetch engine sends ``If-None-Match`` / ``If-Modified-Since``
+from the stored validators and, when the server answers ``304 Not Modified``,
+reuses the cached body instead of downloading the page again. Identical
+bodies served under different URLs are stored once.
+
+Entries still fresh (validated less than ``max_age`` seconds ago, or within the
+server's ``Cache-Control: max-age``) are served without any request at all.
+"""
+import json
+import os
+import re
+import time
+
+from llmstxt.util import atomic_write, sha256_hex
+
+DEFAULT_CACHE_DIR = os.environ.get('LLMSTXT_CACHE_DIR', '.http_cache')
+
+
+def _max_age(response_headers):
+    """Parses `Cache-Control: max-age=N`; no-cache/no-store count as 0."""
+    cache_control = (response_headers.get('Cache-Control') or '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return 0
+    match = re.search(r'max-age=(\d+)', cache_control)
+    return int(match.group(1)) if match else 0
+
+
+class HttpCache:
+    """URL-keyed cache of response bodies plus their ETag/Last-Modified validators.
+
+    `max_age` (seconds) treats entries validated that recently as fresh even if
+    the server sent no Cache-Control; the default of 0 always revalidates.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_age=0):
+        self.root = root
+        self.max_age = max_age
+        self.meta_dir = os.path.join(root, 'meta')
+        self.body_dir = os.path.join(root, 'bodies')
+        os.makedirs(self.meta_dir, exist_ok=True)
+        os.makedirs(self.body_dir, exist_ok=True)
+
+    def _meta_path(self, url):
+        return os.path.join(self.meta_dir, sha256_hex(url) + '.json')
+
+    def _body_path(self, digest):
+        return os.path.join(self.body_dir, digest)
+
+    def lookup(self, url):
+        """Returns the stored entry for `url`, or None if missing or its body is gone."""
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self._body_path(entry.get('sha256', ''))):
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        """True if the entry can be used without revalidating it."""
+        age = time.time() - entry.get('validated', 0)
+        return age < max(self.max_age, entry.get('max_age', 0))
+
+    def conditional_headers(self, entry):
+        """Builds the revalidation headers for a stored entry."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_body(self, entry):
+        try:
+            with open(self._body_path(entry['sha256']), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url, response_headers, content):
+        """Saves a 200 response body and its validators."""
+        digest = sha256_hex(content)
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            atomic_write(body_path, content)
+        entry = {
+            'url': url,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'sha256': digest,
+            'validated': time.time(),
+            'max_age': _max_age(response_headers),
+        }
+        atomic_write(self._meta_path(url), json.dumps(entry).encode('utf-8'))
+        return entry
+
+    def revalidated(self, url, entry, response_headers):
+        """Records a 304 for `entry`, picking up any refreshed validators."""
+        entry = dict(entry)
+        entry['etag'] = response_headers.get('ETag') or entry.get('etag')
+        entry['last_modified'] = response_headers.get('Last-Modified') or entry.get('last_modified')
+        entry['validated'] = time.time()
+        entry['max_age'] = _max_age(response_headers)
+        atomic_write(self._meta_path(url), json.dumps(entry).encode('utf-8'))
+        return entry
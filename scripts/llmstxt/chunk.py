@@ -0,0 +1,292 @@
+"""Split llms output files into retrieval-sized shards under a token budget.
+
+Runs after conversion, on any of the text files in ``llms/``::
+
+    python scripts/llms.py chunk llms/ --max-tokens 2000 --output-dir llms/shards
+
+A file is cut into blocks first: paragraphs, with fenced code blocks always
+kept inside a single block and a heading always kept with the text that
+follows it. Blocks are grouped into pages (a heading followed by
+``Source: <url>``, a ``# Page: <url>`` or ``# [Title](<url>)`` heading, or a
+``----``/``====`` separator line), and a shard never spans two pages.
+
+A page that fits the budget is one shard. A larger page is split at its
+``#`` headings, then ``##``, and so on, packing neighbouring sections into a
+shard while they fit (the OpenAPI outputs split at their ``## METHOD /path``
+endpoints this way). Below the last heading level, paragraphs are packed
+one by one. A code block that is larger than the budget becomes a shard on
+its own rather than being cut; other oversized paragraphs (an endpoint's
+long parameter list) are cut between lines.
+
+Shards are exact byte slices of their source file, so concatenating a file's
+shards gives the file back. ``manifest.json`` in the output directory lists,
+per shard: the source file, shard path, byte offset and length, token count,
+page URL (``null`` outside pages) and heading path.
+"""
+import json
+import os
+import re
+from collections import namedtuple
+
+from llmstxt.tokens import count_batch, tokenizer_name
+from llmstxt.util import atomic_write
+
+DEFAULT_MAX_TOKENS = 2000
+MANIFEST_NAME = 'manifest.json'
+SHARD_NAME = re.compile(r'\d{4,}\.txt')
+LLMS_TXT_SUFFIX = '.llms.txt'    # the llms.txt indexes written by llmstxt.summary
+COMPACT_SUFFIX = '.compact.txt'  # the compact copies written by llmstxt.compact
+
+HEADING = re.compile(rb'(#{1,6})[ \t]+(.*?)[ \t#]*\r?\n?$')
+FENCE = re.compile(rb'^ {0,3}(`{3,}|~{3,})', re.MULTILINE)
+SEPARATOR = re.compile(rb'(?:-{20,}|={20,})\s*$')
+SOURCE_LINE = re.compile(rb'(?:Source|URL):\s*(https?://\S+)')
+PAGE_HEADING = re.compile(rb'#[ \t]+(?:Page:\s*(https?://\S+)|\[[^\]]*\]\((https?://[^)\s]+)\))')
+
+# One paragraph/code block/heading run: data[start:end]
+Block = namedtuple('Block', 'start end level page source path tokens')
+Shard = namedtuple('Shard', 'start end tokens source path')
+
+
+def scan_blocks(data):
+    """Splits `data` (bytes) into Blocks, without token counts; see the module docstring."""
+    blocks = []
+    stack = []              # (level, title) of the enclosing headings
+    source = None
+    start = pos = 0
+    level = 0               # smallest heading level in the block's leading heading run
+    page = True
+    body = False            # the block has text beyond its headings
+    fence = None
+
+    def close(end):
+        blocks.append(Block(start, end, level, page, source, tuple(t for _, t in stack), 0))
+
+    for line in data.splitlines(keepends=True):
+        end = pos + len(line)
+        if fence:
+            if line.lstrip().startswith(fence):
+                fence = None
+        elif FENCE.match(line):
+            fence = FENCE.match(line).group(1)[:3]
+            body = True
+        elif not line.strip():
+            if body:
+                close(end)
+                start, level, page, body = end, 0, False, False
+        elif SEPARATOR.match(line):
+            # Closes the current page; the separator stays with it
+            close(end)
+            start, level, page, body = end, 0, True, False
+            source = None
+        else:
+            heading = HEADING.match(line)
+            if heading:
+                if body:
+                    close(pos)
+                    start, level, page, body = pos, 0, False, False
+                depth = len(heading.group(1))
+                level = min(level, depth) if level else depth
+                while stack and stack[-1][0] >= depth:
+                    stack.pop()
+                stack.append((depth, heading.group(2).decode('utf-8', 'replace')))
+                page_url = PAGE_HEADING.match(line)
+                if page_url:
+                    page, source = True, (page_url.group(1) or page_url.group(2)).decode()
+            elif not body and level and SOURCE_LINE.match(line):
+                # "# Title" + "Source: <url>" opens a page
+                page, source = True, SOURCE_LINE.match(line).group(1).decode()
+            else:
+                body = True
+        pos = end
+    if pos > start:
+        close(pos)
+    return blocks
+
+
+def parse_blocks(data, max_tokens=DEFAULT_MAX_TOKENS):
+    """Blocks of `data` (bytes) with their token counts.
+
+    Text blocks larger than `max_tokens` are cut between lines; code blocks never are.
+    """
+    blocks = scan_blocks(data)
+    counts = count_batch([_text(data, block.start, block.end) for block in blocks])
+    counted = []
+    for block, tokens in zip(blocks, counts):
+        block = block._replace(tokens=tokens)
+        if block.tokens > max_tokens and not FENCE.search(data, block.start, block.end):
+            # e.g. an endpoint with a hundred parameters: cut between lines rather than overflow
+            counted.extend(_split_lines(data, block, max_tokens))
+        else:
+            counted.append(block)
+    return counted
+
+
+def _text(data, start, end):
+    return data[start:end].decode('utf-8', 'replace')
+
+
+def _split_lines(data, block, max_tokens):
+    """Cuts an oversized text block between lines into blocks of at most `max_tokens`."""
+    pieces = []
+    start = pos = block.start
+    tokens = 0
+    lines = data[block.start:block.end].splitlines(keepends=True)
+    for line, line_tokens in zip(lines, count_batch([line.decode('utf-8', 'replace') for line in lines])):
+        if pos > start and tokens + line_tokens > max_tokens:
+            pieces.append(block._replace(start=start, end=pos, tokens=tokens))
+            start, tokens = pos, 0
+        tokens += line_tokens
+        pos += len(line)
+    pieces.append(block._replace(start=start, end=pos, tokens=tokens))
+    # Only the first piece starts at the block's heading (and possibly a page)
+    return pieces[:1] + [piece._replace(level=0, page=False) for piece in pieces[1:]]
+
+
+def _total(blocks):
+    return sum(block.tokens for block in blocks)
+
+
+def _shard(blocks):
+    first = blocks[0]
+    return Shard(first.start, blocks[-1].end, _total(blocks), first.source, first.path)
+
+
+def _pack(blocks, max_tokens, level=1):
+    """Yields Shards for `blocks` (one page), splitting at headings of `level` and deeper."""
+    if _total(blocks) <= max_tokens or len(blocks) == 1:
+        yield _shard(blocks)
+        return
+    if level > 6:
+        groups = [[block] for block in blocks]
+    else:
+        groups = []
+        for block in blocks:
+            if not groups or 0 < block.level <= level:
+                groups.append([])
+            groups[-1].append(block)
+        if len(groups) == 1:
+            yield from _pack(blocks, max_tokens, level + 1)
+            return
+
+    current, tokens = [], 0
+    for group in groups:
+        group_tokens = _total(group)
+        if current and tokens + group_tokens > max_tokens:
+            yield _shard(current)
+            current, tokens = [], 0
+        if group_tokens > max_tokens:
+            yield from _pack(group, max_tokens, level + 1)
+            continue
+        current.extend(group)
+        tokens += group_tokens
+    if current:
+        yield _shard(current)
+
+
+def split_shards(data, max_tokens=DEFAULT_MAX_TOKENS):
+    """Shards of `data` (bytes), in file order."""
+    pages = []
+    for block in parse_blocks(data, max_tokens):
+        if block.page or not pages:
+            pages.append([])
+        pages[-1].append(block)
+    shards = []
+    for blocks in pages:
+        shards.extend(_pack(blocks, max_tokens))
+    return shards
+
+
+def _previous_shards(output_dir):
+    """{stem: [manifest entries]} of the shards an earlier run wrote to `output_dir`."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    shards = {}
+    for entry in manifest.get('shards', []):
+        stem, _, shard = entry.get('shard', '').partition('/')
+        if SHARD_NAME.fullmatch(shard):
+            shards.setdefault(stem, []).append(entry)
+    return shards
+
+
+def chunk_file(path, output_dir, max_tokens=DEFAULT_MAX_TOKENS, previous=()):
+    """Writes the shards of `path` to `output_dir/<name>/NNNN.txt`; returns manifest entries.
+
+    `previous` are the manifest entries of the shards the last run wrote there;
+    those files are removed first. Raises ValueError instead of overwriting
+    any other files in the way.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    name = os.path.basename(path)
+    stem = os.path.splitext(name)[0]
+    shard_dir = os.path.join(output_dir, stem)
+    # Shards from a previous run (possibly with another budget) would be stale
+    for entry in previous:
+        try:
+            os.remove(os.path.join(output_dir, entry['shard']))
+        except FileNotFoundError:
+            pass
+    if os.path.isdir(shard_dir) and os.listdir(shard_dir):
+        raise ValueError(f"{shard_dir} exists and holds files that aren't shards from {MANIFEST_NAME}; "
+                         f"move it or pick another --output-dir")
+    os.makedirs(shard_dir, exist_ok=True)
+
+    entries = []
+    for i, shard in enumerate(split_shards(data, max_tokens), 1):
+        shard_name = f"{stem}/{i:04d}.txt"
+        with open(os.path.join(output_dir, shard_name), 'wb') as f:
+            f.write(data[shard.start:shard.end])
+        entries.append({
+            'file': name,
+            'shard': shard_name,
+            'offset': shard.start,
+            'length': shard.end - shard.start,
+            'tokens': shard.tokens,
+            'source': shard.source,
+            'headings': list(shard.path),
+        })
+    return entries
+
+
+def input_files(paths):
+    """The .txt files named by `paths`, with directories expanded (not recursively).
+
+    llms.txt indexes and compact copies in a directory are skipped: they only
+    summarize or repeat the outputs.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith('.txt') and not name.endswith((LLMS_TXT_SUFFIX, COMPACT_SUFFIX))
+                         and os.path.isfile(os.path.join(path, name)))
+        else:
+            files.append(path)
+    return files
+
+
+def chunk_paths(paths, output_dir, max_tokens=DEFAULT_MAX_TOKENS):
+    """Chunks every file under `paths` and writes `output_dir/manifest.json`."""
+    os.makedirs(output_dir, exist_ok=True)
+    previous = _previous_shards(output_dir)
+    shards = []
+    for path in input_files(paths):
+        stem = os.path.splitext(os.path.basename(path))[0]
+        entries = chunk_file(path, output_dir, max_tokens, previous.pop(stem, ()))
+        over = sum(1 for entry in entries if entry['tokens'] > max_tokens)
+        tokens = sum(entry['tokens'] for entry in entries)
+        print(f"{os.path.basename(path):<40} {len(entries):>5} shards {tokens:>9,} tokens"
+              + (f"  ({over} code blocks over budget)" if over else ""))
+        shards.extend(entries)
+
+    # Shards of files not chunked this time stay on disk, so they stay in the manifest
+    for entries in previous.values():
+        shards.extend(entries)
+    manifest = {'max_tokens': max_tokens, 'tokenizer': tokenizer_name(), 'shards': shards}
+    atomic_write(os.path.join(output_dir, MANIFEST_NAME), json.dumps(manifest, indent=1).encode('utf-8'))
+    print(f"{len(shards)} shards -> {os.path.join(output_dir, MANIFEST_NAME)}")
+    return shards
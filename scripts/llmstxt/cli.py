@@ -0,0 +1,223 @@
+"""Command line interface: ``python scripts/llms.py <command> ...``."""
+import argparse
+import os
+import time
+
+from llmstxt.browser import DEFAULT_CDP_PORT
+from llmstxt.chunk import DEFAULT_MAX_TOKENS
+from llmstxt.search import INDEX_NAME
+from llmstxt.summary import DEFAULT_MAX_TOKENS as LLMS_TXT_TOKENS
+from llmstxt.engine import build
+from llmstxt.orchestrate import build_all
+from llmstxt.sites import PROFILES, get_profile
+
+
+def cmd_list(args):
+    for name in sorted(PROFILES):
+        profile = PROFILES[name]
+        print(f"{name:<20} {profile.output_file:<32} {profile.title}")
+
+
+def check_sites(names):
+    # Validate every name before starting a long crawl
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise SystemExit(f"Unknown site(s): {', '.join(unknown)}. Known sites: {', '.join(sorted(PROFILES))}")
+
+
+def cmd_build(args):
+    check_sites(args.sites)
+    for name in args.sites:
+        build(get_profile(name), output_dir=args.output_dir, jobs=args.jobs, llms_txt_tokens=args.llms_txt_tokens,
+              compact=args.compact)
+    if args.index:
+        from llmstxt.search import build_index
+        build_index([args.output_dir])
+
+
+def cmd_build_all(args):
+    check_sites(args.sites)
+    results = build_all(args.sites, output_dir=args.output_dir, jobs=args.jobs,
+                        llms_txt_tokens=args.llms_txt_tokens, compact=args.compact)
+    if args.index:
+        from llmstxt.search import build_index
+        build_index([args.output_dir])
+    if any(r.error for r in results):
+        raise SystemExit(1)
+
+
+def cmd_browser(args):
+    from llmstxt.browser import serve
+    serve(args.port)
+
+
+def cmd_chunk(args):
+    from llmstxt.chunk import chunk_paths
+    try:
+        chunk_paths(args.paths, args.output_dir, max_tokens=args.max_tokens)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+
+def cmd_tokens(args):
+    from llmstxt.report import report_paths
+    report_paths(args.paths, args.tokenizer, top=args.top)
+
+
+def cmd_llmstxt(args):
+    from llmstxt.summary import write_paths
+    write_paths(args.paths, max_tokens=args.max_tokens)
+
+
+def cmd_compact(args):
+    from llmstxt.compact import compact_paths
+    compact_paths(args.paths)
+
+
+def cmd_index(args):
+    from llmstxt.search import build_index
+    build_index(args.paths, args.output)
+
+
+def _numpy_required(command):
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        raise SystemExit(f"'llms.py {command}' needs numpy: pip install numpy")
+
+
+def cmd_embed(args):
+    _numpy_required("embed")
+    from llmstxt.embed import embed_index, get_encoder
+    embed_index(args.index, get_encoder(args.encoder), dtype=args.dtype, jobs=args.jobs)
+
+
+def cmd_search(args):
+    from llmstxt.search import SearchIndex
+    if args.semantic:
+        _numpy_required("search --semantic")
+        from llmstxt.embed import VectorStore
+        store = VectorStore(os.path.dirname(os.path.abspath(args.index)))
+        store.encoder  # load the model before timing the query
+    start = time.perf_counter()
+    with SearchIndex(args.index) as index:
+        if args.semantic:
+            store.check(index)
+            (ids, scores), = store.search([args.query], k=args.k)
+            hits = [index.hit(doc, score) for doc, score in zip(ids, scores)]
+        else:
+            hits = index.search(args.query, k=args.k)
+        elapsed = time.perf_counter() - start
+        for rank, hit in enumerate(hits, 1):
+            print(f"{rank}. [{hit.score:.2f}] {hit.source or hit.file} :: {' > '.join(hit.headings)}")
+            text = index.text(hit)
+            print(text if args.full else "   " + " ".join(text.split())[:240])
+            print()
+    print(f"{len(hits)} results in {elapsed * 1000:.1f} ms")
+
+
+def cmd_serve(args):
+    from llmstxt.server import serve
+    serve(args.index, http_port=args.http, host=args.host)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build llms text files from documentation sites.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="list the registered sites")
+    list_parser.set_defaults(func=cmd_list)
+
+    build_parser = subparsers.add_parser("build", help="crawl and convert one or more sites")
+    build_parser.add_argument("sites", nargs="+", metavar="site", help="site name (see 'list')")
+    build_parser.add_argument("--output-dir", default=".", help="directory for the output files")
+    build_parser.add_argument("--jobs", "-j", type=int, default=None,
+                              help="page conversion processes (default: CPU count)")
+    build_parser.add_argument("--index", action="store_true",
+                              help="rebuild the search index of the output directory afterwards")
+    build_parser.add_argument("--llms-txt-tokens", type=int, default=LLMS_TXT_TOKENS,
+                              help="token budget of the llms.txt index written next to each output")
+    build_parser.add_argument("--compact", action="store_true",
+                              help="also write a compact copy (<stem>.compact.txt) of each output")
+    build_parser.set_defaults(func=cmd_build)
+
+    build_all_parser = subparsers.add_parser(
+        "build-all", help="crawl sites concurrently and convert them in a process pool")
+    build_all_parser.add_argument("sites", nargs="*", metavar="site", help="site names (default: all)")
+    build_all_parser.add_argument("--output-dir", default=".", help="directory for the output files")
+    build_all_parser.add_argument("--jobs", "-j", type=int, default=None,
+                                  help="conversion processes (default: CPU count)")
+    build_all_parser.add_argument("--index", action="store_true",
+                                  help="rebuild the search index of the output directory afterwards")
+    build_all_parser.add_argument("--llms-txt-tokens", type=int, default=LLMS_TXT_TOKENS,
+                                  help="token budget of the llms.txt index written next to each output")
+    build_all_parser.add_argument("--compact", action="store_true",
+                                  help="also write a compact copy (<stem>.compact.txt) of each output")
+    build_all_parser.set_defaults(func=cmd_build_all)
+
+    browser_parser = subparsers.add_parser(
+        "browser", help="keep a headless Chromium running for the Playwright scripts to share")
+    browser_parser.add_argument("--port", type=int, default=DEFAULT_CDP_PORT, help="remote debugging port")
+    browser_parser.set_defaults(func=cmd_browser)
+
+    chunk_parser = subparsers.add_parser(
+        "chunk", help="split llms output files into shards under a token budget")
+    chunk_parser.add_argument("paths", nargs="+", metavar="path", help="output files or directories of them")
+    chunk_parser.add_argument("--max-tokens", type=int, default=DEFAULT_MAX_TOKENS, help="token budget per shard")
+    chunk_parser.add_argument("--output-dir", default="shards", help="directory for the shards and manifest.json")
+    chunk_parser.set_defaults(func=cmd_chunk)
+
+    tokens_parser = subparsers.add_parser(
+        "tokens", help="write the per-section token report (<file>.tokens.json) of llms output files")
+    tokens_parser.add_argument("paths", nargs="+", metavar="path", help="output files or directories of them")
+    tokens_parser.add_argument("--tokenizer", default=None,
+                               help="estimate, tiktoken:<encoding> or hf:<name> "
+                                    "(default: $LLMSTXT_TOKENIZER, else tiktoken:cl100k_base if installed)")
+    tokens_parser.add_argument("--top", type=int, default=10, help="number of heaviest sections to list")
+    tokens_parser.set_defaults(func=cmd_tokens)
+
+    llmstxt_parser = subparsers.add_parser(
+        "llmstxt", help="write the llms.txt index (<stem>.llms.txt) of llms output files")
+    llmstxt_parser.add_argument("paths", nargs="+", metavar="path", help="output files or directories of them")
+    llmstxt_parser.add_argument("--max-tokens", type=int, default=LLMS_TXT_TOKENS, help="token budget of each index")
+    llmstxt_parser.set_defaults(func=cmd_llmstxt)
+
+    compact_parser = subparsers.add_parser(
+        "compact", help="write compact copies (<stem>.compact.txt) with repeated code blocks collapsed")
+    compact_parser.add_argument("paths", nargs="+", metavar="path", help="output files or directories of them")
+    compact_parser.set_defaults(func=cmd_compact)
+
+    index_parser = subparsers.add_parser("index", help="build the BM25 search index over llms output files")
+    index_parser.add_argument("paths", nargs="+", metavar="path", help="output files or directories of them")
+    index_parser.add_argument("--output", "-o", default=None,
+                              help=f"index file (default: {INDEX_NAME} in the first directory)")
+    index_parser.set_defaults(func=cmd_index)
+
+    search_parser = subparsers.add_parser("search", help="query the search index")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--index", default=os.path.join("llms", INDEX_NAME), help="index file")
+    search_parser.add_argument("-k", type=int, default=5, help="number of results")
+    search_parser.add_argument("--full", action="store_true", help="print whole sections, not snippets")
+    search_parser.add_argument("--semantic", action="store_true",
+                               help="rank by embedding similarity (needs 'llms.py embed' first)")
+    search_parser.set_defaults(func=cmd_search)
+
+    embed_parser = subparsers.add_parser("embed", help="embed the indexed sections for --semantic search")
+    embed_parser.add_argument("--index", default=os.path.join("llms", INDEX_NAME), help="index file")
+    embed_parser.add_argument("--encoder", default="hash",
+                              help="hash (dependency-free stub), st:<sentence-transformers model> "
+                                   "or fastembed:<model>")
+    embed_parser.add_argument("--dtype", choices=("int8", "float16"), default="int8")
+    embed_parser.add_argument("--jobs", "-j", type=int, default=None,
+                              help="encoder processes for the hash encoder (default: CPU count)")
+    embed_parser.set_defaults(func=cmd_embed)
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="doc search server (MCP tools over stdio, or HTTP with --http PORT)")
+    serve_parser.add_argument("--index", default=os.path.join("llms", INDEX_NAME), help="index file")
+    serve_parser.add_argument("--http", type=int, metavar="PORT", default=None, help="serve HTTP instead of stdio")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.set_defaults(func=cmd_serve)
+
+    args = parser.parse_args(argv)
+    args.func(args)
@@ -0,0 +1,223 @@
+"""Shared pooled HTTP client with per-request timing.
+
+The crawlers used to call the module-level ``requests.get`` for every page,
+paying a new TCP (and TLS) handshake each time. ``HttpClient`` keeps one
+connection pool per host instead:
+
+* keep-alive: connections are reused across pages and across scripts in the
+  same process (``get_client`` hands out shared instances);
+* per-host connection limit: at most ``max_per_host`` sockets per host, extra
+  requests wait for a free one instead of opening more;
+* compression: ``Accept-Encoding`` advertises gzip/deflate, plus brotli and
+  zstd when the ``brotli``/``zstandard`` packages are installed;
+* HTTP/2: used when ``httpx`` and ``h2`` are installed (set
+  ``LLMSTXT_HTTP2=0`` to stay on HTTP/1.1 via requests).
+
+Every response carries a ``Timing`` (DNS, connect, TLS, time to first byte,
+download) and ``TimingStats`` sums them, so a crawl can report where its time
+went.
+"""
+import os
+import socket
+import threading
+import time
+from collections import namedtuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import h2  # noqa: F401
+    import httpx
+except ImportError:
+    httpx = None
+
+DEFAULT_MAX_PER_HOST = 4
+
+# Seconds spent in each phase of one request. `dns`, `connect` and `tls` are 0
+# when the request reused a kept-alive connection (`reused` is then True).
+Timing = namedtuple('Timing', ['dns', 'connect', 'tls', 'ttfb', 'download', 'bytes', 'reused', 'http_version'])
+
+# What `HttpClient.get` returns: requests-like fields plus the timing
+Response = namedtuple('Response', ['url', 'status_code', 'headers', 'content', 'timing'])
+
+
+def http2_available():
+    return httpx is not None and os.environ.get('LLMSTXT_HTTP2', '1') != '0'
+
+
+# --- HTTP/1.1 backend: requests + urllib3 with connection-level timing ---
+
+class _TimedConnectionMixin:
+    """Records DNS and TCP connect time when urllib3 opens a new socket."""
+
+    connect_timing = None   # (dns, connect, tls) of the last new socket, consumed by the response
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        infos = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        resolved = time.perf_counter()
+
+        # Connect to the resolved addresses so the lookup isn't repeated
+        dns_host, error = self._dns_host, None
+        try:
+            for info in infos:
+                self._dns_host = info[4][0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except Exception as e:
+                    error = e
+            else:
+                raise error
+        finally:
+            self._dns_host = dns_host
+
+        self.connect_timing = (resolved - start, time.perf_counter() - resolved, 0.0)
+        return sock
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        dns, tcp, _ = self.connect_timing
+        self.connect_timing = (dns, tcp, max(0.0, time.perf_counter() - start - dns - tcp))
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class HttpClient:
+    """Thread-safe pooled client; `get` returns a `Response` with a `Timing`."""
+
+    def __init__(self, max_per_host=DEFAULT_MAX_PER_HOST, http2=None):
+        self.max_per_host = max_per_host
+        self.http2 = http2_available() if http2 is None else (http2 and httpx is not None)
+        if self.http2:
+            limits = httpx.Limits(max_connections=None, max_keepalive_connections=max_per_host * 8)
+            self.session = httpx.Client(http2=True, limits=limits, follow_redirects=True,
+                                        headers={'Accept-Encoding': ACCEPT_ENCODING})
+        else:
+            self.session = requests.Session()
+            # pool_block: never more than max_per_host sockets to one host
+            adapter = _TimedAdapter(pool_connections=32, pool_maxsize=max_per_host, pool_block=True)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+    def get(self, url, headers=None, timeout=None):
+        if self.http2:
+            return self._get_http2(url, headers, timeout)
+
+        start = time.perf_counter()
+        resp = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        headers_at = time.perf_counter()
+        try:
+            conn = getattr(resp.raw, '_connection', None) or getattr(resp.raw, 'connection', None)
+            connect_timing = getattr(conn, 'connect_timing', None)
+            if conn is not None:
+                conn.connect_timing = None
+            content = resp.content
+        finally:
+            resp.close()
+        done = time.perf_counter()
+
+        dns, tcp, tls = connect_timing or (0.0, 0.0, 0.0)
+        timing = Timing(dns, tcp, tls, max(0.0, headers_at - start - dns - tcp - tls), done - headers_at,
+                        len(content), connect_timing is None, 'HTTP/1.1')
+        return Response(resp.url, resp.status_code, resp.headers, content, timing)
+
+    def _get_http2(self, url, headers, timeout):
+        marks = {}
+
+        def trace(event, info):
+            marks.setdefault(event, time.perf_counter())
+
+        start = time.perf_counter()
+        with self.session.stream('GET', url, headers=headers, timeout=timeout,
+                                 extensions={'trace': trace}) as resp:
+            headers_at = time.perf_counter()
+            content = resp.read()
+        done = time.perf_counter()
+
+        def span(phase):
+            started, complete = marks.get(phase + '.started'), marks.get(phase + '.complete')
+            return complete - started if started and complete else 0.0
+
+        # httpcore resolves the host inside connect_tcp, so DNS is counted there
+        tcp, tls = span('connection.connect_tcp'), span('connection.start_tls')
+        timing = Timing(0.0, tcp, tls, max(0.0, headers_at - start - tcp - tls), done - headers_at,
+                        len(content), 'connection.connect_tcp.started' not in marks, resp.http_version)
+        return Response(str(resp.url), resp.status_code, resp.headers, content, timing)
+
+    def close(self):
+        self.session.close()
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(max_per_host=DEFAULT_MAX_PER_HOST):
+    """Process-wide shared client for a given per-host connection limit."""
+    with _clients_lock:
+        if max_per_host not in _clients:
+            _clients[max_per_host] = HttpClient(max_per_host)
+        return _clients[max_per_host]
+
+
+class TimingStats:
+    """Running totals of request timings for a crawl summary."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.bytes = 0
+        self.totals = dict.fromkeys(('dns', 'connect', 'tls', 'ttfb', 'download'), 0.0)
+        self.versions = set()
+
+    def add(self, timing):
+        if timing is None:
+            return
+        with self.lock:
+            self.requests += 1
+            self.new_connections += not timing.reused
+            self.bytes += timing.bytes
+            for phase in self.totals:
+                self.totals[phase] += getattr(timing, phase)
+            self.versions.add(timing.http_version)
+
+    def summary(self):
+        if not self.requests:
+            return "No requests made."
+        total = sum(self.totals.values()) or 1
+        phases = ", ".join(f"{phase} {seconds:.1f}s ({seconds / total:.0%})"
+                           for phase, seconds in self.totals.items())
+        return (f"{self.requests} requests over {self.new_connections} new connections "
+                f"({'/'.join(sorted(self.versions))}), {self.bytes / 1e6:.1f} MB, "
+                f"avg TTFB {self.totals['ttfb'] / self.requests * 1000:.0f} ms. Time spent: {phases}")
@@ -0,0 +1,161 @@
+"""Compact copy of an llms output file for smaller LLM contexts.
+
+``python scripts/llms.py compact llms/`` (or ``build --compact``) writes
+``<output stem>.compact.txt`` next to each output. Prose is kept as it is;
+the savings come from the code blocks, which dominate the large outputs:
+
+* Fence info strings are cut to a short language tag: ``ts twoslash`` and
+  ``ts showLineNumbers=false`` become ``ts``, ``javascript`` and
+  ``typescript`` become ``js`` and ``ts``. Blocks tagged with a profile's
+  default language (``jsx`` on react.dev) that are plainly JSON or shell
+  commands are retagged (``llmstxt.markdown.guess_language``).
+* A code block identical to an earlier one (same language, same lines once
+  trailing whitespace is ignored) is replaced by a pointer to the first one:
+  its page and the heading it sits under. Blocks shorter than their pointer
+  are left in place, unless they directly follow their copy, and every
+  distinct snippet is kept in full where it first appears.
+* Trailing whitespace is stripped, whitespace-only lines become empty, and
+  runs of blank lines are squeezed to one, in prose and in code.
+
+Token counts before and after are measured with the default tokenizer
+(``llmstxt.tokens``) and printed per file.
+"""
+import os
+import re
+from collections import namedtuple
+
+from llmstxt.chunk import COMPACT_SUFFIX, FENCE, HEADING, PAGE_HEADING, SOURCE_LINE, input_files
+from llmstxt.markdown import guess_language
+from llmstxt.summary import clean_markdown
+from llmstxt.tokens import count_batch
+from llmstxt.util import atomic_write
+
+# Long spellings of common languages, and tags that mean "no language"
+LANGUAGE_ALIASES = {
+    'javascript': 'js', 'typescript': 'ts', 'plaintext': '', 'text': '', 'txt': '', 'none': '',
+    'plain': '', 'shell': 'bash', 'sh': 'bash', 'zsh': 'bash', 'yml': 'yaml',
+}
+# Tags that are profile defaults as often as real labels: only these are retagged by content
+DEFAULT_TAGS = {'', 'js', 'jsx', 'ts', 'tsx'}
+INFO_LANGUAGE = re.compile(r'[\w+#.-]*')
+
+CompactResult = namedtuple('CompactResult', 'text blocks repeated retagged tokens_before tokens_after')
+
+
+def language(info, code):
+    """The short language tag for a fence `info` string and its `code`."""
+    lang = INFO_LANGUAGE.match(info.strip()).group(0).lower()
+    lang = LANGUAGE_ALIASES.get(lang, lang)
+    if lang in DEFAULT_TAGS:
+        lang = guess_language(code) or lang
+    return lang
+
+
+def _squeeze(lines):
+    """`lines` without trailing whitespace, blank runs squeezed to one blank line."""
+    result = []
+    for line in lines:
+        line = line.rstrip()
+        if line or (result and result[-1]):
+            result.append(line)
+    return result
+
+
+def _pointer(lang, first, source):
+    """The text replacing a repeated block whose first occurrence is `first` (source URL, heading)."""
+    first_source, heading = first
+    where = f' under "{heading}"' if heading else ""
+    where += " above" if first_source == source or not first_source else f" in {first_source}"
+    return f"(Same {lang + ' ' if lang else ''}code as the block{where}.)"
+
+
+def compact_text(text):
+    """Compacts the Markdown `text` (see the module docstring).
+
+    Returns (compacted text, code blocks, blocks replaced by a pointer, blocks retagged).
+    """
+    out = []
+    seen = {}           # (language, code) -> (source URL, heading) of its first occurrence
+    source = heading = None
+    blocks = repeated = retagged = 0
+    fence = None        # [fence marker, info string, code lines] inside a code block
+    last = (None, 0)    # (language, code) of the last block written, and where it ended in `out`
+
+    for line in text.splitlines():
+        if fence:
+            marker, info, lines = fence
+            if not (line.lstrip().startswith(marker) and not line.strip().strip(marker[0])):
+                lines.append(line)
+                continue
+            fence = None
+            blocks += 1
+            code = _squeeze(lines)
+            while code and not code[-1]:
+                code.pop()
+            code = "\n".join(code)
+            lang = language(info, code)
+            spelled = INFO_LANGUAGE.match(info.strip()).group(0).lower()
+            retagged += lang != LANGUAGE_ALIASES.get(spelled, spelled)
+            first = seen.get((lang, code))
+            pointer = _pointer(lang, first, source) if first else None
+            if last[0] == (lang, code) and not any(out[last[1]:]):
+                repeated += 1   # the same block twice in a row (e.g. a listing and its copy)
+            elif pointer and len(pointer) < len(code):
+                out.append(pointer)
+                repeated += 1
+            else:
+                seen.setdefault((lang, code), (source, heading))
+                out.extend((marker + lang, code, marker) if code else (marker + lang, marker))
+                last = ((lang, code), len(out))
+            continue
+
+        encoded = line.encode('utf-8')
+        match = FENCE.match(encoded)
+        if match:
+            marker = match.group(1).decode()
+            fence = [marker, line.strip()[len(marker):], []]
+            continue
+        if HEADING.match(encoded):
+            page = PAGE_HEADING.match(encoded)
+            if page:
+                source = (page.group(1) or page.group(2)).decode()
+            heading = clean_markdown(HEADING.match(encoded).group(2).decode('utf-8', 'replace'))
+        elif SOURCE_LINE.match(encoded):
+            source = SOURCE_LINE.match(encoded).group(1).decode()
+        out.append(line)
+
+    if fence:
+        # Unclosed block: keep it as it is
+        out.append(fence[0] + fence[1])
+        out.extend(fence[2])
+    return "\n".join(_squeeze(out)).strip("\n") + "\n", blocks, repeated, retagged
+
+
+def compact_file(path):
+    """The `CompactResult` for the output file at `path`."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    compacted, blocks, repeated, retagged = compact_text(text)
+    before, after = count_batch([text, compacted])
+    return CompactResult(compacted, blocks, repeated, retagged, before, after)
+
+
+def write_compact(path):
+    """Writes `<stem>.compact.txt` next to the output file at `path`; returns the `CompactResult`."""
+    result = compact_file(path)
+    compact_path = os.path.splitext(path)[0] + COMPACT_SUFFIX
+    atomic_write(compact_path, result.text.encode('utf-8'))
+    saved = result.tokens_before - result.tokens_after
+    print(f"{os.path.basename(compact_path)}: {result.tokens_before:,} -> {result.tokens_after:,} tokens "
+          f"(-{saved / (result.tokens_before or 1):.1%}); {result.repeated} of {result.blocks} code blocks "
+          f"were repeats, {result.retagged} retagged")
+    return result
+
+
+def compact_paths(paths):
+    """Writes the compact copy of every output file under `paths`."""
+    results = [write_compact(path) for path in input_files(paths)]
+    before = sum(r.tokens_before for r in results)
+    after = sum(r.tokens_after for r in results)
+    print(f"\n{before:,} -> {after:,} tokens in {len(results)} files (-{(before - after) / (before or 1):.1%})")
+    return results
@@ -0,0 +1,197 @@
+"""Cross-page boilerplate and near-duplicate removal for crawled outputs.
+
+Runs in ``llmstxt.engine`` on a site's converted pages before the output is
+written. Noise selectors and ``exclude_patterns`` catch most of the chrome,
+but not all of it: "Edit this page" links, version banners and cookie
+notices that aren't in a recognisable element, and versioned or localized
+copies of a page under URLs no substring filter anticipated.
+
+* Boilerplate blocks: every paragraph outside code blocks gets a 64-bit
+  fingerprint of its normalized text (case, digits and link targets
+  ignored, so "React Native 0.72" and "0.73" banners match). A paragraph
+  found on at least ``BOILERPLATE_MIN_PAGES`` pages and on
+  ``BOILERPLATE_SHARE`` of them is dropped everywhere, provided it sits
+  under different headings on different pages: page chrome follows
+  whatever heading came last, while a repeated prop description ("Function
+  to execute on press.") sits under the same prop heading everywhere and
+  is content. Headings, code, inline code, images and short labels are
+  never dropped.
+* Near-duplicate pages: each page is sketched with bottom-k MinHash (the
+  ``SKETCH_SIZE`` smallest hashes of its 5-word shingles). Pages sharing
+  enough sketch values with an earlier page are compared, and a page whose
+  estimated Jaccard similarity with one is ``NEAR_DUPLICATE`` or more is
+  replaced by its title and a pointer to the earlier page.
+
+The incremental manifest caches pages as converted, before this cleanup
+(``IncrementalOutput.rewrite``), so every build counts the paragraphs and
+compares the pages afresh: a block stops being dropped once it is no longer
+repeated, and a stub never points at a page that changed or left the crawl.
+"""
+import hashlib
+import re
+from collections import Counter, namedtuple
+
+from llmstxt.chunk import FENCE, HEADING, SEPARATOR
+from llmstxt.tokens import count_batch
+
+BOILERPLATE_MIN_PAGES = 3
+BOILERPLATE_SHARE = 0.3
+MIN_WORDS = 3           # shorter paragraphs ("Note", "Returns") are labels, not boilerplate
+SHINGLE_WORDS = 5
+SKETCH_SIZE = 128
+MIN_SHINGLES = 50       # pages shorter than this are never called duplicates
+NEAR_DUPLICATE = 0.9
+HEADING_VARIETY = 0.5   # distinct headings per page a boilerplate paragraph was found on
+
+LINK_TARGET = re.compile(r'\]\([^)]*\)')
+DIGITS = re.compile(r'\d+')
+WORD = re.compile(r'\w+')
+KEEP = re.compile(r'`|!\[')    # inline code and images are content
+
+DedupResult = namedtuple('DedupResult', 'sections fingerprints blocks duplicates tokens_before tokens_after')
+
+
+def fingerprint(text):
+    normalized = " ".join(DIGITS.sub('0', LINK_TARGET.sub(']', text.lower())).split())
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def paragraphs(text):
+    """Splits `text` into (paragraph, droppable, heading) triples that join back to `text`.
+
+    A paragraph runs to the end of its blank lines; `heading` is the last
+    heading line before it. Fenced code, headings, separator lines, inline
+    code, images and short label paragraphs are not droppable.
+    """
+    result = []
+    current = []
+    droppable = True
+    heading = last_heading = ''
+    fence = None
+    for line in text.splitlines(keepends=True):
+        if fence:
+            if line.lstrip().startswith(fence):
+                fence = None
+            current.append(line)
+            continue
+        if not line.strip():
+            current.append(line)
+            continue
+        if current and not current[-1].strip():
+            # First line after a blank line starts a new paragraph
+            result.append(("".join(current), droppable, heading))
+            current, droppable, heading = [], True, last_heading
+        current.append(line)
+        encoded = line.encode('utf-8')
+        if FENCE.match(encoded):
+            fence = FENCE.match(encoded).group(1)[:3].decode()
+            droppable = False
+        elif HEADING.match(encoded):
+            droppable = False
+            last_heading = line.strip()
+        elif SEPARATOR.match(encoded):
+            droppable = False
+    if current:
+        result.append(("".join(current), droppable, heading))
+    return [(paragraph, droppable and not KEEP.search(paragraph) and len(WORD.findall(paragraph)) >= MIN_WORDS,
+             heading) for paragraph, droppable, heading in result]
+
+
+def boilerplate(pages):
+    """Fingerprints of the droppable paragraphs repeated across `pages` (lists of `paragraphs`)."""
+    counts = Counter()
+    headings = {}       # fingerprint -> the headings it was found under
+    for page in pages:
+        found = {fingerprint(paragraph): heading for paragraph, droppable, heading in page if droppable}
+        counts.update(found.keys())
+        for fp, heading in found.items():
+            headings.setdefault(fp, set()).add(fingerprint(heading))
+    needed = max(BOILERPLATE_MIN_PAGES, BOILERPLATE_SHARE * len(pages))
+    return {fp for fp, pages_with in counts.items()
+            if pages_with >= needed and len(headings[fp]) >= HEADING_VARIETY * pages_with}
+
+
+def sketch(text):
+    """The `SKETCH_SIZE` smallest shingle hashes of `text` (all of them for short texts), or None."""
+    words = WORD.findall(text.lower())
+    shingles = {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    hashes = sorted(int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+                    for s in shingles)
+    return frozenset(hashes[:SKETCH_SIZE])
+
+
+def similarity(a, b):
+    """Jaccard estimate of the texts behind two sketches."""
+    union = sorted(a | b)[:SKETCH_SIZE]
+    return sum(1 for h in union if h in a and h in b) / len(union)
+
+
+def near_duplicates(sketches):
+    """{page index: index of the earlier page it duplicates} for a list of sketches (or None)."""
+    owners = {}         # sketch value -> pages kept so far that have it
+    duplicates = {}
+    for i, current in enumerate(sketches):
+        if current is None:
+            continue
+        shared = Counter(j for h in current for j in owners.get(h, ()))
+        for j, count in shared.most_common():
+            if count < NEAR_DUPLICATE * len(current) / 2:
+                break
+            if similarity(current, sketches[j]) >= NEAR_DUPLICATE:
+                duplicates[i] = j
+                break
+        else:
+            for h in current:
+                owners.setdefault(h, []).append(i)
+    return duplicates
+
+
+def _matches(pattern, paragraph):
+    return any(pattern.match(line.encode('utf-8')) for line in paragraph.splitlines())
+
+
+def _stub(page, url):
+    """The page's paragraphs up to its title heading, a pointer to `url` and the trailing separator."""
+    head = []
+    for paragraph, _, _ in page:
+        head.append(paragraph)
+        if _matches(HEADING, paragraph):
+            break
+    tail = page[-1][0] if len(page) > len(head) and _matches(SEPARATOR, page[-1][0]) else ""
+    return "".join(head) + f"Near-duplicate of {url}, included earlier in this file.\n\n" + tail
+
+
+def dedup_sections(sections):
+    """Removes boilerplate and near-duplicate pages from (url, digest, bytes) output sections.
+
+    Sections without a URL (the header) are left alone. Returns a `DedupResult`
+    with the new sections.
+    """
+    pages = [i for i, (url, _, _) in enumerate(sections) if url]
+    texts = {i: sections[i][2].decode('utf-8') for i in pages}
+    split = {i: paragraphs(texts[i]) for i in pages}
+    fingerprints = boilerplate([split[i] for i in pages])
+
+    blocks = 0
+    cleaned = {}
+    for i in pages:
+        kept = [part for part in split[i] if not (part[1] and fingerprint(part[0]) in fingerprints)]
+        blocks += len(split[i]) - len(kept)
+        split[i] = kept
+        cleaned[i] = "".join(paragraph for paragraph, _, _ in kept)
+
+    duplicates = near_duplicates([sketch(cleaned[i]) for i in pages])
+    for n, j in duplicates.items():
+        cleaned[pages[n]] = _stub(split[pages[n]], sections[pages[j]][0])
+
+    changed = [i for i in pages if cleaned[i] != texts[i]]
+    before = sum(count_batch([texts[i] for i in changed])) if changed else 0
+    after = sum(count_batch([cleaned[i] for i in changed])) if changed else 0
+    result = list(sections)
+    for i in changed:
+        url, digest, _ = sections[i]
+        result[i] = (url, digest, cleaned[i].encode('utf-8'))
+    return DedupResult(result, fingerprints, blocks, {sections[pages[n]][0]: sections[pages[j]][0]
+                                                      for n, j in duplicates.items()}, before, after)
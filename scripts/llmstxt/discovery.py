@@ -0,0 +1,234 @@
+"""URL discovery strategies for site profiles.
+
+Each strategy finds the pages of a documentation site and hands them to the
+fetch engine. ``Sitemap``, ``SidebarLinks`` and ``TocJson`` produce a URL
+list up front; ``DeepCrawl`` discovers pages while fetching them, for SPA
+sidebars that only render their links once a page is loaded.
+"""
+import asyncio
+import json
+import xml.etree.ElementTree as ET
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from llmstxt.client import TimingStats, get_client
+from llmstxt.fetch import DEFAULT_HEADERS, DEFAULT_TIMEOUT, Fetcher, Page, iter_pages
+from llmstxt.frontier import Frontier, normalize_url
+from llmstxt.pagestore import DEFAULT_MAX_PAGES, PageStore
+
+SITEMAP_NS = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+
+
+def _get(url, profile):
+    response = get_client().get(url, headers=profile.headers or DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
+    if response.status_code != 200:
+        raise Exception(f"HTTP {response.status_code} for {url}")
+    return response.content
+
+
+def _strip_fragment(url):
+    return url.split('#')[0]
+
+
+class Discovery:
+    """Base strategy: `urls(profile)` returns the pages to fetch, in output order."""
+
+    sort = True
+    source = None   # URL recorded in the output header
+
+    def urls(self, profile):
+        raise NotImplementedError
+
+    def order(self, urls):
+        """Deduplicates (see ``normalize_url``), then sorts or keeps first-seen order."""
+        unique = {}
+        for url in urls:
+            unique.setdefault(normalize_url(url), url)
+        if self.sort:
+            return sorted(unique.values())
+        return list(unique.values())
+
+    def pages(self, profile, cache=None, ahead=None):
+        """Returns (number of pages, iterator of `Page` in output order).
+
+        With `ahead`, fetching stays at most that many pages ahead of the
+        consumer (see ``iter_pages``).
+        """
+        urls = self.urls(profile)
+        return len(urls), iter_pages(urls, concurrency=profile.concurrency, rate=profile.rate,
+                                     headers=profile.headers, cache=cache,
+                                     max_concurrency=profile.max_concurrency, ahead=ahead)
+
+
+class Sitemap(Discovery):
+    """Every ``<loc>`` of an XML sitemap accepted by the profile's URL filters."""
+
+    def __init__(self, url, sort=True):
+        self.url = url
+        self.source = url
+        self.sort = sort
+
+    def urls(self, profile):
+        print(f"Fetching sitemap: {self.url}...")
+        try:
+            root = ET.fromstring(_get(self.url, profile))
+        except Exception as e:
+            print(f"Error fetching sitemap: {e}")
+            return []
+        urls = [loc.text.strip() for loc in root.findall('ns:url/ns:loc', SITEMAP_NS) if loc.text]
+        accepted = self.order(u for u in urls if profile.accepts(u))
+        print(f"Found {len(accepted)} relevant URLs (filtered from {len(urls)}).")
+        return accepted
+
+
+class SidebarLinks(Discovery):
+    """Links found on a single start page, preferably inside its sidebar.
+
+    `selectors` are tried in order; if none matches, every link on the page
+    is considered. With `sort=False` the sidebar order (e.g. a curriculum) is kept.
+    """
+
+    def __init__(self, start_url, selectors=(), sort=True):
+        self.start_url = start_url
+        self.source = start_url
+        self.selectors = selectors
+        self.sort = sort
+
+    def urls(self, profile):
+        print(f"Fetching sidebar links from: {self.start_url}...")
+        try:
+            soup = BeautifulSoup(_get(self.start_url, profile), 'html.parser')
+        except Exception as e:
+            print(f"Error fetching initial page: {e}")
+            return []
+
+        sidebar = None
+        for selector in self.selectors:
+            sidebar = soup.select_one(selector)
+            if sidebar:
+                break
+        if not sidebar:
+            if self.selectors:
+                print("Could not identify specific sidebar. Scanning all internal doc links...")
+            sidebar = soup
+
+        urls = []
+        for a in sidebar.find_all('a', href=True):
+            url = _strip_fragment(urljoin(self.start_url, a['href']))
+            if profile.accepts(url):
+                urls.append(url)
+        return self.order(urls)
+
+
+class TocJson(Discovery):
+    """Every ``href`` in a nested JSON table of contents (MS Learn ``toc.json``)."""
+
+    def __init__(self, url, base_url, sort=False):
+        self.url = url
+        self.source = url
+        self.base_url = base_url
+        self.sort = sort
+
+    def urls(self, profile):
+        print(f"Fetching TOC JSON: {self.url}...")
+        try:
+            data = json.loads(_get(self.url, profile))
+        except Exception as e:
+            print(f"Error fetching TOC JSON: {e}")
+            return []
+
+        urls = []
+        stack = list(reversed(data.get('items', [])))
+        while stack:
+            item = stack.pop()
+            # Some items are just headers (no href)
+            if 'href' in item:
+                # MS Learn hrefs are relative and may point at the .md source
+                full_url = urljoin(self.base_url, item['href'].replace('.md', ''))
+                url = full_url.split('?')[0].split('#')[0]
+                if profile.accepts(url):
+                    urls.append(url)
+            stack.extend(reversed(item.get('children', [])))
+        return self.order(urls)
+
+
+class DeepCrawl(Discovery):
+    """Breadth-first crawl from `start_url`, following links the profile accepts.
+
+    `max_depth` stops following links that many clicks from the start page;
+    `by_depth` always fetches the shallowest pending page first.
+
+    Pages are kept from the crawl so nothing is fetched twice, then yielded in
+    sorted URL order (so /api/ comes before /api/interfaces/). Only
+    `max_pages_in_memory` bodies stay in RAM; the rest spill to a compressed
+    temporary file (see ``PageStore``).
+    """
+
+    def __init__(self, start_url, max_pages_in_memory=DEFAULT_MAX_PAGES, max_depth=None, by_depth=False):
+        self.start_url = start_url
+        self.source = start_url
+        self.max_pages_in_memory = max_pages_in_memory
+        self.max_depth = max_depth
+        self.by_depth = by_depth
+
+    def urls(self, profile):
+        with self.crawl(profile) as store:
+            return store.urls()
+
+    def crawl(self, profile, cache=None):
+        """Returns a ``PageStore`` holding every page reached from `start_url`.
+
+        Pages are fetched in batches popped from the frontier, through the
+        same per-host scheduler as ``iter_pages`` (concurrency, rate limit,
+        retries and backoff from the profile).
+        """
+        return asyncio.run(self._crawl(profile, cache))
+
+    async def _crawl(self, profile, cache):
+        frontier = Frontier([self.start_url], max_depth=self.max_depth, by_depth=self.by_depth)
+        store = PageStore(self.max_pages_in_memory)
+        stats = TimingStats()
+        fetcher = Fetcher(profile.concurrency, profile.rate, profile.headers, cache=cache,
+                          max_concurrency=profile.max_concurrency)
+        batch_size = profile.max_concurrency or profile.concurrency * 4
+
+        print("Deep crawling to discover links that only render inside pages...")
+        with fetcher:
+            while frontier:
+                # The normalized URL is fetched and stored; links on the page resolve against the one linked
+                batch = [frontier.pop_link() for _ in range(min(batch_size, len(frontier)))]
+                for current_url, _, _ in batch:
+                    print(f"  Fetching: {current_url}")
+                pages = await asyncio.gather(*(fetcher.fetch(url) for url, _, _ in batch))
+
+                for (current_url, depth, link), page in zip(batch, pages):
+                    stats.add(page.timing)
+                    if page.error:
+                        print(f"    {current_url}: Error: {page.error}")
+                        continue
+                    if page.status != 200:
+                        print(f"    {current_url}: Failed with status {page.status}")
+                        continue
+                    store.add(current_url, page.content)
+
+                    soup = BeautifulSoup(page.content, 'html.parser')
+                    for a in soup.find_all('a', href=True):
+                        clean_url = _strip_fragment(urljoin(link, a['href']))
+                        if profile.accepts(clean_url):
+                            frontier.add(clean_url, depth + 1)
+
+        if stats.requests:
+            print(f"Fetch timing: {stats.summary()}")
+        return store
+
+    def pages(self, profile, cache=None, ahead=None):
+        # The crawl has to finish before the sorted order is known; `store` bounds the memory instead
+        store = self.crawl(profile, cache)
+
+        def stream():
+            with store:
+                for url, content in store.items():
+                    yield Page(url, 200, content, None)
+
+        return len(store), stream()
@@ -0,0 +1,225 @@
+"""Optional semantic retrieval: embeddings of the search-index sections.
+
+Keyword search misses paraphrases ("subscribe to row changes" vs. "Postgres
+Changes"). This stage embeds every section of ``search.idx`` and stores the
+vectors next to it, so section ids are shared with the BM25 index and the
+doc server::
+
+    python scripts/llms.py embed --encoder st:sentence-transformers/all-MiniLM-L6-v2
+    python scripts/llms.py search "how do I subscribe to row changes" --semantic
+
+Needs numpy. Encoders are pluggable (``get_encoder``):
+
+* ``hash`` — dependency-free stub: signed feature hashing of words and word
+  pairs. Lexical, not semantic, but deterministic and instant; useful for
+  testing the pipeline;
+* ``st:<model>`` — sentence-transformers on the CPU;
+* ``fastembed:<model>`` — fastembed (ONNX runtime, CPU).
+
+Vectors are L2-normalized and stored quantized in ``vectors.npy``:
+``int8`` (default) with one float32 scale per row in ``vectors.scale.npy``,
+or ``float16``. ``vectors.json`` records the encoder, dtype and which index
+they belong to. Queries memory-map the store and score it in row blocks
+(``BLOCK_ROWS``), several queries per pass, then take the top-k with
+``argpartition``; converting int8 blocks to float32 is several times cheaper
+than converting float16 ones, which is why int8 is the default.
+"""
+import json
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from llmstxt.search import SearchIndex, tokenize
+
+VECTORS_NAME = 'vectors.npy'
+SCALES_NAME = 'vectors.scale.npy'
+META_NAME = 'vectors.json'
+BATCH_SIZE = 64
+BLOCK_ROWS = 8192
+HASH_DIM = 384
+MAX_CHARS = 4000        # text per section handed to the encoder
+
+
+class HashingEncoder:
+    """Feature-hashing stand-in for a real model (see the module docstring)."""
+
+    parallel = True     # pure function of the text: batches can go to worker processes
+
+    def __init__(self, dim=HASH_DIM):
+        self.name = f'hash:{dim}'
+        self.dim = dim
+
+    def encode(self, texts):
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = tokenize(text)
+            for feature in words + [a + ' ' + b for a, b in zip(words, words[1:])]:
+                h = zlib.crc32(feature.encode('utf-8'))
+                out[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        return out
+
+
+class SentenceTransformerEncoder:
+    parallel = False    # the model already uses every core
+
+    def __init__(self, model):
+        from sentence_transformers import SentenceTransformer
+        self.name = f'st:{model}'
+        self.model = SentenceTransformer(model, device='cpu')
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts):
+        return self.model.encode(texts, batch_size=len(texts), convert_to_numpy=True,
+                                 show_progress_bar=False).astype(np.float32)
+
+
+class FastEmbedEncoder:
+    parallel = False
+
+    def __init__(self, model):
+        from fastembed import TextEmbedding
+        self.name = f'fastembed:{model}'
+        self.model = TextEmbedding(model_name=model)
+        self.dim = len(next(iter(self.model.embed(["probe"]))))
+
+    def encode(self, texts):
+        return np.asarray(list(self.model.embed(texts, batch_size=len(texts))), dtype=np.float32)
+
+
+def get_encoder(spec):
+    """`hash`, `st:<model>` or `fastembed:<model>`."""
+    kind, _, model = spec.partition(':')
+    if kind == 'hash':
+        return HashingEncoder(int(model) if model else HASH_DIM)
+    if kind == 'st' and model:
+        return SentenceTransformerEncoder(model)
+    if kind == 'fastembed' and model:
+        return FastEmbedEncoder(model)
+    raise ValueError(f"Unknown encoder {spec!r}: use hash, st:<model> or fastembed:<model>")
+
+
+def normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def quantize(vectors):
+    """int8 rows plus the float32 scale that restores them (symmetric, per row)."""
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+
+
+def _hash_batch(args):
+    dim, texts = args
+    return HashingEncoder(dim).encode(texts)
+
+
+def _section_batches(index, batch_size):
+    texts = []
+    for doc in range(index.docs):
+        hit = index.hit(doc)
+        texts.append(" ".join(hit.headings) + "\n" + index.text(hit)[:MAX_CHARS])
+        if len(texts) == batch_size:
+            yield texts
+            texts = []
+    if texts:
+        yield texts
+
+
+def embed_index(index_path, encoder, dtype='int8', jobs=None, batch_size=BATCH_SIZE):
+    """Embeds every section of `index_path` and writes the vector store next to it."""
+    directory = os.path.dirname(os.path.abspath(index_path))
+    start = time.perf_counter()
+    with SearchIndex(index_path) as index:
+        count = index.docs
+        vectors = np.lib.format.open_memmap(os.path.join(directory, VECTORS_NAME + '.tmp'), mode='w+',
+                                            dtype=np.dtype(dtype), shape=(count, encoder.dim))
+        scales = np.ones(count, dtype=np.float32)
+        batches = _section_batches(index, batch_size)
+        if encoder.parallel and (jobs or os.cpu_count() or 1) > 1:
+            pool = ProcessPoolExecutor(max_workers=jobs)
+            encoded = pool.map(_hash_batch, ((encoder.dim, texts) for texts in batches), chunksize=4)
+        else:
+            pool = None
+            encoded = (encoder.encode(texts) for texts in batches)
+
+        row = 0
+        try:
+            for batch in encoded:
+                batch = normalize(np.asarray(batch, dtype=np.float32))
+                end = row + len(batch)
+                if dtype == 'int8':
+                    vectors[row:end], scales[row:end] = quantize(batch)
+                else:
+                    vectors[row:end] = batch.astype(dtype)
+                row = end
+        finally:
+            if pool:
+                pool.shutdown()
+        vectors.flush()
+        del vectors
+        index_info = {'docs': index.docs, 'size': os.path.getsize(index_path)}
+
+    os.replace(os.path.join(directory, VECTORS_NAME + '.tmp'), os.path.join(directory, VECTORS_NAME))
+    np.save(os.path.join(directory, SCALES_NAME), scales)
+    with open(os.path.join(directory, META_NAME), 'w', encoding='utf-8') as f:
+        json.dump({'encoder': encoder.name, 'dim': encoder.dim, 'dtype': dtype, 'count': count,
+                   'index': index_info}, f, indent=1)
+    print(f"Embedded {count} sections with {encoder.name} ({dtype}, dim {encoder.dim}) "
+          f"in {time.perf_counter() - start:.1f}s -> {os.path.join(directory, VECTORS_NAME)}")
+
+
+class VectorStore:
+    """Memory-mapped vectors for the sections of one search index."""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, META_NAME), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.vectors = np.load(os.path.join(directory, VECTORS_NAME), mmap_mode='r')
+        self.scales = np.load(os.path.join(directory, SCALES_NAME))
+        self._encoder = None
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            self._encoder = get_encoder(self.meta['encoder'])
+        return self._encoder
+
+    def check(self, index):
+        """Raises if the vectors were built for another version of `index` or don't match the encoder."""
+        stored = self.meta['index']
+        if stored['docs'] != index.docs or stored['size'] != os.path.getsize(index.path):
+            raise ValueError("vectors.npy is out of date with the search index; rebuild with 'llms.py embed'")
+        if self.meta['dim'] != self.vectors.shape[1] or self.meta['dim'] != self.encoder.dim:
+            raise ValueError(f"vectors.npy has {self.vectors.shape[1]} dimensions but {self.meta['encoder']} "
+                             f"encodes {self.encoder.dim}; rebuild with 'llms.py embed'")
+
+    def search_vectors(self, queries, k=10):
+        """Top-k (section ids, scores) per row of `queries` (m x dim), best first."""
+        queries = normalize(np.atleast_2d(np.asarray(queries, dtype=np.float32))).T
+        count = len(self.vectors)
+        k = min(k, count)
+        if k <= 0:
+            return [([], []) for _ in range(queries.shape[1])]
+        scores = np.empty((count, queries.shape[1]), dtype=np.float32)
+        for start in range(0, count, BLOCK_ROWS):
+            block = self.vectors[start:start + BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ queries
+        if self.meta['dtype'] == 'int8':
+            scores *= self.scales[:, None]
+
+        results = []
+        for column in scores.T:
+            top = np.argpartition(-column, k - 1)[:k]
+            top = top[np.argsort(-column[top])]
+            results.append((top.tolist(), column[top].tolist()))
+        return results
+
+    def search(self, queries, k=10):
+        """Like `search_vectors`, encoding the query strings first (one batch)."""
+        return self.search_vectors(self.encoder.encode(list(queries)), k)
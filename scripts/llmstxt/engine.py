@@ -0,0 +1,196 @@
+"""Crawl a site profile and write its llms file.
+
+This is the loop every ``convert_*.py`` crawler used to carry its own copy of:
+discover the pages, fetch them through the shared engine, strip the noise,
+convert the content and write it incrementally.
+
+Fetching and converting are decoupled: pages arrive from the fetch engine on
+this thread, pages that need converting are handed to a process pool (one
+BeautifulSoup parse per core), and the Markdown is reassembled in URL order.
+At most ``jobs * PIPELINE_DEPTH`` pages wait for conversion, and the fetch
+engine runs at most as many pages ahead of this thread (``iter_pages``'s
+`ahead`), so a slow conversion holds the crawl back instead of buffering the
+whole site.
+Before the file is written, boilerplate blocks and near-duplicate pages are
+removed across the whole site (``llmstxt.dedup``).
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from bs4 import BeautifulSoup
+
+from llmstxt.cache import HttpCache
+from llmstxt.compact import write_compact
+from llmstxt.dedup import dedup_sections
+from llmstxt.incremental import IncrementalOutput, converter_version
+from llmstxt.markdown import MarkdownConverter
+from llmstxt.report import write_report
+from llmstxt.sites import get_profile
+from llmstxt.summary import DEFAULT_MAX_TOKENS as LLMS_TXT_TOKENS, write_llms_txt
+
+PIPELINE_DEPTH = 4   # pages in flight per conversion process
+
+_worker_profile = None
+
+
+def select_content(profile, soup):
+    """The first element matching one of the profile's content selectors, or None."""
+    for selector in profile.content_selectors:
+        content = soup.select_one(selector)
+        if content:
+            return content
+    return None
+
+
+def html_to_markdown(profile, html_content, url):
+    """Converts one page: title and source line, then the cleaned content."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    content = select_content(profile, soup)
+    if not content:
+        return f"\n\n--- FAILED TO PARSE: {url} ---\n\n"
+
+    # Remove noise
+    if profile.noise:
+        for tag in content.select(profile.noise):
+            tag.decompose()
+
+    output = []
+
+    # Title
+    title = soup.find('h1')
+    title_text = title.get_text(strip=True) if title else url.rstrip('/').split('/')[-1]
+    output.append(f"\n\n# {title_text}\n")
+    output.append(f"Source: {url}\n\n")
+
+    output.append(profile.converter.convert(content))
+
+    return "".join(output)
+
+
+def _init_worker(profile):
+    global _worker_profile
+    _worker_profile = profile
+
+
+def _convert_page(url, content, separator):
+    return html_to_markdown(_worker_profile, content, url) + separator
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def write_output(profile, pages, count, output_dir='.', jobs=1, llms_txt_tokens=LLMS_TXT_TOKENS, compact=False):
+    """Converts crawled `pages` (in output order) and writes the profile's file.
+
+    With `jobs` > 1, pages whose HTML changed are converted in a pool of that
+    many processes while later pages are still being fetched. The token report
+    and the llms.txt index (at most `llms_txt_tokens`) are written next to it,
+    and with `compact` its compact copy (``llmstxt.compact``).
+
+    Returns (output path, number of pages that could not be fetched or
+    converted, tokens saved by deduplication).
+    """
+    output_file = os.path.join(output_dir, profile.output_file)
+    separator = f"\n{profile.separator}\n"
+    version = converter_version(html_to_markdown, MarkdownConverter, get_profile)
+    failed = []
+
+    pool = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(profile,))
+    # (url, source digest, reused bytes or Future) in output order
+    pending = deque()
+
+    def drain(limit):
+        while len(pending) > limit:
+            url, digest, item = pending.popleft()
+            try:
+                data = item.result() if isinstance(item, Future) else item
+            except Exception as e:
+                failed.append(url)
+                print(f"  Failed: {url}: {e}")
+                continue
+            f.add_section(url, digest, data)
+
+    try:
+        with IncrementalOutput(output_file, version) as f:
+            f.write_header(f"# {profile.title}\n")
+            f.write_header(f"Source: {profile.discovery.source}\n\n")
+
+            for i, page in enumerate(pages):
+                url = page.url
+                print(f"[{i+1}/{count}] Crawling: {url}")
+                if page.error:
+                    failed.append(url)
+                    print(f"  Failed: {page.error}")
+                    continue
+                if page.status != 200:
+                    failed.append(url)
+                    print(f"  Error {page.status}")
+                    continue
+
+                digest, data = f.cached_section(url, page.content)
+                if data is None:
+                    if pool:
+                        data = pool.submit(_convert_page, url, page.content, separator)
+                    else:
+                        try:
+                            data = html_to_markdown(profile, page.content, url) + separator
+                        except Exception as e:
+                            failed.append(url)
+                            print(f"  Failed: {e}")
+                            continue
+                pending.append((url, digest, data))
+                drain(jobs * PIPELINE_DEPTH)
+
+            drain(0)
+
+            # Runs on the sections as converted (reused ones too), so it starts from the current pages
+            deduped = dedup_sections(f.sections)
+            f.rewrite([data for _, _, data in deduped.sections])
+            saved = deduped.tokens_before - deduped.tokens_after
+            print(f"Dedup: dropped {deduped.blocks} boilerplate blocks ({len(deduped.fingerprints)} distinct) "
+                  f"and {len(deduped.duplicates)} near-duplicate pages, saving {saved:,} tokens")
+            for url, original in deduped.duplicates.items():
+                print(f"  {url} duplicates {original}")
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    if failed:
+        print(f"\nWARNING: {len(failed)} pages are missing from {output_file} after retries:")
+        for url in failed:
+            print(f"  {url}")
+    print(f"\nDone! Saved to {output_file}")
+    write_report(output_file)
+    write_llms_txt(output_file, llms_txt_tokens)
+    if compact:
+        write_compact(output_file)
+    return output_file, len(failed), saved
+
+
+def build(profile, output_dir='.', cache=None, jobs=None, llms_txt_tokens=LLMS_TXT_TOKENS, compact=False):
+    """Crawls `profile` (a SiteProfile or registered name) and writes its output file.
+
+    Conversion runs in `jobs` processes (default: one per CPU). With `compact`,
+    a compact copy is written next to the output as well.
+
+    Returns the output path, or None if discovery found no pages.
+    """
+    if isinstance(profile, str):
+        profile = get_profile(profile)
+    if cache is None:
+        cache = HttpCache()
+
+    jobs = jobs or default_jobs()
+    count, pages = profile.discovery.pages(profile, cache, ahead=jobs * PIPELINE_DEPTH)
+    if not count:
+        print(f"[{profile.name}] No URLs found. The site structure might have changed.")
+        return None
+
+    print(f"[{profile.name}] Found {count} pages.")
+    output_file, _, _ = write_output(profile, pages, count, output_dir, jobs, llms_txt_tokens, compact)
+    return output_file
@@ -0,0 +1,366 @@
+"""Concurrent, rate-limited fetch engine shared by the crawler scripts.
+
+The crawlers used to loop over their URL list with a blocking ``requests.get``
+followed by a fixed ``time.sleep``. Here every page is fetched from an asyncio
+event loop instead, with:
+
+* a bounded number of in-flight requests per host, starting at
+  ``concurrency`` and adapted to how the host copes (see ``HostScheduler``),
+* a per-host token bucket (``rate`` requests per second) replacing the sleep,
+* retries of 429/5xx responses and connection errors with jittered
+  exponential backoff, honoring ``Retry-After``.
+
+``iter_pages`` yields the results back in the original URL order, so the
+scripts can keep writing their output files page by page exactly as before.
+Pass an ``llmstxt.cache.HttpCache`` as ``cache`` to revalidate pages from a
+previous run instead of downloading them again; fresh entries skip the request
+(and the rate limiter) entirely.
+
+Requests go through the shared pooled client in ``llmstxt.client``
+(keep-alive, compression, per-host connection limit) and every fetched
+``Page`` carries the request's ``Timing``.
+"""
+import asyncio
+import email.utils
+import queue
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from llmstxt.client import TimingStats, get_client
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+DEFAULT_CONCURRENCY = 4   # in-flight requests per host
+DEFAULT_RATE = 5.0        # requests per second per host (None = unlimited)
+DEFAULT_TIMEOUT = 30      # seconds
+DEFAULT_RETRIES = 5       # extra attempts for 429/5xx/connection errors
+BACKOFF_BASE = 1.0        # seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_MAX = 60.0
+RETRY_AFTER_MAX = 300.0   # ignore absurd Retry-After values
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+# One fetched page. `status` is None and `error` is set when the request
+# itself failed (DNS, timeout, connection reset...). `cached` is True when the
+# body came from the HTTP cache after a 304 revalidation. `timing` is the
+# request's `llmstxt.client.Timing` (None if no request was made) and
+# `headers` its response headers.
+Page = namedtuple('Page', ['url', 'status', 'content', 'error', 'cached', 'timing', 'headers'],
+                  defaults=(False, None, None))
+
+
+def should_retry(page):
+    return page.status is None or page.status in RETRY_STATUSES
+
+
+def retry_after(page):
+    """Seconds the server asked us to wait (`Retry-After`), or None."""
+    value = (page.headers or {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(0.0, seconds), RETRY_AFTER_MAX)
+
+
+def retry_delay(attempt, page):
+    """Delay before retry number `attempt` (0-based): Retry-After, else full-jitter backoff."""
+    delay = retry_after(page)
+    if delay is not None:
+        return delay
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per second.
+
+    Up to `burst` tokens can be saved up while the bucket is idle.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostScheduler:
+    """Adaptive in-flight limit, rate limiter and cooldown for one host.
+
+    The limit grows additively (about +1 per round trip) while responses
+    come back no slower than twice the fastest seen, and halves on
+    429/503/5xx, together with the request rate. A `Retry-After` pauses
+    every request to the host, not just the one that got it. The rate
+    climbs back towards the configured value as requests succeed again.
+    """
+
+    def __init__(self, concurrency, max_concurrency, rate):
+        self.limit = float(concurrency)
+        self.max_limit = max(concurrency, max_concurrency)
+        self.inflight = 0
+        self.condition = asyncio.Condition()
+        self.max_rate = rate
+        self.bucket = TokenBucket(rate)
+        self.resume_at = 0.0
+        self.best_latency = None
+        self.throttled_count = 0
+
+    async def acquire(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.inflight < int(self.limit))
+            self.inflight += 1
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.bucket.acquire()
+
+    async def release(self):
+        async with self.condition:
+            self.inflight -= 1
+            self.condition.notify_all()
+
+    def succeeded(self, latency):
+        if self.best_latency is None or latency < self.best_latency:
+            self.best_latency = latency
+        if latency <= 2 * self.best_latency + 0.05:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        if self.max_rate and self.bucket.rate < self.max_rate:
+            self.bucket.rate = min(self.max_rate, self.bucket.rate * 1.05)
+
+    def throttled(self, delay):
+        self.throttled_count += 1
+        self.limit = max(1.0, self.limit / 2)
+        if self.bucket.rate:
+            self.bucket.rate = max(self.max_rate / 16, self.bucket.rate / 2)
+        self.resume_at = max(self.resume_at, time.monotonic() + delay)
+
+
+class _HostLimits:
+    """One `HostScheduler` per host, created on first use."""
+
+    def __init__(self, concurrency, max_concurrency, rate):
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.hosts = {}
+
+    def get(self, url):
+        host = urlparse(url).netloc.lower()
+        if host not in self.hosts:
+            self.hosts[host] = HostScheduler(self.concurrency, self.max_concurrency, self.rate)
+        return self.hosts[host]
+
+
+class FetchWindow:
+    """Lets page `index` start only once it is less than `size` pages past the last one consumed.
+
+    The consumer calls `consumed()` (from any thread) as it takes each page,
+    in URL order, so a slow consumer holds the fetches back instead of the
+    finished pages piling up.
+    """
+
+    def __init__(self, size):
+        self.size = max(1, size)
+        self.count = 0
+        self.loop = None
+        self.changed = None
+
+    async def wait(self, index):
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+            self.changed = asyncio.Event()
+        while index >= self.count + self.size:
+            await self.changed.wait()
+
+    def consumed(self, count=1):
+        self.count += count
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._notify)
+
+    def _notify(self):
+        # Wakes every waiter; each re-checks its index and waits on the new event
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+def _fresh(url, cache):
+    """Returns a cached Page for `url` if its cache entry needs no revalidation."""
+    entry = cache.lookup(url)
+    if entry and cache.is_fresh(entry):
+        body = cache.load_body(entry)
+        if body is not None:
+            return Page(url, 200, body, None, True)
+    return None
+
+
+def fetch_page(url, headers=None, timeout=DEFAULT_TIMEOUT, cache=None, client=None):
+    """Blocking fetch of a single URL (run on the executor by `fetch_pages`)."""
+    headers = headers or DEFAULT_HEADERS
+    client = client or get_client()
+    try:
+        entry = cache.lookup(url) if cache else None
+        if entry:
+            headers = {**headers, **cache.conditional_headers(entry)}
+        resp = client.get(url, headers=headers, timeout=timeout)
+        if resp.status_code == 304 and entry:
+            body = cache.load_body(entry)
+            if body is not None:
+                cache.revalidated(url, entry, resp.headers)
+                return Page(url, 200, body, None, True, resp.timing, resp.headers)
+        if resp.status_code == 200 and cache:
+            cache.store(url, resp.headers, resp.content)
+        return Page(url, resp.status_code, resp.content, None, False, resp.timing, resp.headers)
+    except Exception as e:
+        return Page(url, None, None, str(e))
+
+
+class Fetcher:
+    """Fetches pages on the running event loop through one `HostScheduler` per host.
+
+    `fetch(url)` retries 429/5xx responses and connection errors, backing the
+    host's scheduler off on throttling. Use it as a context manager: the
+    blocking requests run on its thread pool, which has room for
+    `max_concurrency` requests to each of `hosts` hosts.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, headers=None,
+                 timeout=DEFAULT_TIMEOUT, cache=None, client=None, retries=DEFAULT_RETRIES,
+                 max_concurrency=None, hosts=1):
+        max_concurrency = max_concurrency or concurrency * 4
+        self.limits = _HostLimits(concurrency, max_concurrency, rate)
+        self.headers = headers or DEFAULT_HEADERS
+        self.timeout = timeout
+        self.cache = cache
+        self.client = client or get_client(max_concurrency)
+        self.retries = retries
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency * hosts)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.executor.shutdown()
+
+    async def fetch(self, url):
+        """The `Page` for `url`, after up to `retries` retries."""
+        page = _fresh(url, self.cache) if self.cache else None
+        if page:
+            return page
+        loop = asyncio.get_running_loop()
+        scheduler = self.limits.get(url)
+        for attempt in range(self.retries + 1):
+            await scheduler.acquire()
+            start = time.monotonic()
+            try:
+                page = await loop.run_in_executor(self.executor, fetch_page, url, self.headers, self.timeout,
+                                                  self.cache, self.client)
+            finally:
+                await scheduler.release()
+            if not should_retry(page):
+                scheduler.succeeded(time.monotonic() - start)
+                break
+            if attempt == self.retries:
+                break
+            delay = retry_delay(attempt, page)
+            scheduler.throttled(delay if page.status in THROTTLE_STATUSES else 0.0)
+            print(f"  {url}: {page.status or page.error}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return page
+
+
+async def fetch_pages(urls, on_page, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                      headers=None, timeout=DEFAULT_TIMEOUT, cache=None, client=None,
+                      retries=DEFAULT_RETRIES, max_concurrency=None, window=None):
+    """Fetches every URL concurrently, calling `on_page(index, page)` as each completes.
+
+    Completion order is arbitrary; `index` is the position of the URL in `urls`.
+    Per host, `concurrency` requests start in flight and the scheduler may
+    raise that up to `max_concurrency` (default 4x) while the host keeps up.
+    Pages still failing after `retries` retries are passed on as they are.
+    With a `FetchWindow`, each URL waits for the window before it is fetched.
+    """
+    urls = list(urls)
+    if not urls:
+        return
+    hosts = len({urlparse(u).netloc.lower() for u in urls})
+
+    with Fetcher(concurrency, rate, headers, timeout, cache, client, retries, max_concurrency, hosts) as fetcher:
+        async def worker(index, url):
+            if window:
+                await window.wait(index)
+            on_page(index, await fetcher.fetch(url))
+
+        await asyncio.gather(*(worker(i, url) for i, url in enumerate(urls)))
+
+
+def iter_pages(urls, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+               headers=None, timeout=DEFAULT_TIMEOUT, cache=None, client=None,
+               retries=DEFAULT_RETRIES, max_concurrency=None, ahead=None):
+    """Fetches `urls` concurrently and yields a `Page` for each, in the original order.
+
+    The event loop runs on a background thread; pages that finish early are
+    held until every page before them has been yielded. With `ahead`, no page
+    more than `ahead` places past the last one yielded is fetched, so at most
+    that many pages wait in memory however slowly the caller consumes them.
+    A timing summary is printed once every page has been yielded.
+    """
+    urls = list(urls)
+    done = queue.Queue()
+    stats = TimingStats()
+    window = FetchWindow(ahead) if ahead else None
+
+    def run():
+        try:
+            asyncio.run(fetch_pages(urls, lambda i, page: done.put((i, page)),
+                                    concurrency=concurrency, rate=rate,
+                                    headers=headers, timeout=timeout, cache=cache, client=client,
+                                    retries=retries, max_concurrency=max_concurrency, window=window))
+        except BaseException as e:
+            done.put((None, e))
+
+    thread = threading.Thread(target=run, name='llmstxt-fetch', daemon=True)
+    thread.start()
+
+    pending = {}
+    try:
+        for next_index in range(len(urls)):
+            while next_index not in pending:
+                index, page = done.get()
+                if index is None:
+                    raise page
+                pending[index] = page
+                stats.add(page.timing)
+            page = pending.pop(next_index)
+            if window:
+                window.consumed()
+            yield page
+    finally:
+        if window:
+            # An abandoned iterator must not leave the fetch thread waiting forever
+            window.consumed(len(urls))
+
+    thread.join()
+    if stats.requests:
+        print(f"Fetch timing: {stats.summary()}")
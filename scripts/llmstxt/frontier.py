@@ -0,0 +1,88 @@
+"""Crawl frontier: the queue of URLs still to visit plus everything already seen.
+
+The old deep crawl used a list with ``pop(0)`` and ``url not in queue``, both
+linear, which made discovery quadratic in the number of links. ``Frontier``
+uses a deque (or a heap when ordering by depth) and a set of normalized URLs,
+so every operation is O(1) (O(log n) with depth priority).
+
+``normalize_url`` decides when two links are the same page: scheme and host
+are case-insensitive, default ports, fragments and (by default) queries are
+dropped, and ``/docs/intro/`` is the same page as ``/docs/intro``.
+"""
+import heapq
+from collections import deque
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url, keep_query=False):
+    """Canonical form of `url` used to deduplicate links."""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = parts.query if keep_query else ''
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+class Frontier:
+    """FIFO (breadth-first) queue of URLs with O(1) deduplication.
+
+    `add` returns False for URLs already seen (after normalization) or deeper
+    than `max_depth`. With `by_depth=True` the shallowest pending URL is
+    always popped first, even if deeper links were added earlier.
+    URLs are returned normalized, so the page that is fetched (and written)
+    is the same whichever variant of its URL was linked first. `pop_link`
+    also returns that link, for resolving the relative links on the page.
+    """
+
+    def __init__(self, start_urls=(), max_depth=None, by_depth=False, keep_query=False):
+        self.max_depth = max_depth
+        self.by_depth = by_depth
+        self.keep_query = keep_query
+        self.seen = set()
+        self.queue = [] if by_depth else deque()
+        self.counter = 0   # FIFO tie-break within a depth
+        for url in start_urls:
+            self.add(url, 0)
+
+    def add(self, url, depth=0):
+        if self.max_depth is not None and depth > self.max_depth:
+            return False
+        key = normalize_url(url, self.keep_query)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        if self.by_depth:
+            heapq.heappush(self.queue, (depth, self.counter, key, url))
+            self.counter += 1
+        else:
+            self.queue.append((depth, key, url))
+        return True
+
+    def pop(self):
+        """Returns (normalized url, depth) of the next URL to visit."""
+        url, depth, _ = self.pop_link()
+        return url, depth
+
+    def pop_link(self):
+        """Returns (normalized url, depth, url as it was first linked) of the next URL to visit."""
+        if self.by_depth:
+            depth, _, url, link = heapq.heappop(self.queue)
+        else:
+            depth, url, link = self.queue.popleft()
+        return url, depth, link
+
+    def __contains__(self, url):
+        return normalize_url(url, self.keep_query) in self.seen
+
+    def __len__(self):
+        return len(self.queue)
+
+    def __bool__(self):
+        return bool(self.queue)
@@ -0,0 +1,203 @@
+"""Incremental rebuild of an llms output file.
+
+Next to every output file we keep ``<output>.manifest.json``::
+
+    {
+      "converter": "<hash of the converter script>",
+      "output_sha256": "<hash of the whole output file>",
+      "sections": [
+        {"url": null, "source_sha256": null, "offset": 0, "length": 80},
+        {"url": "https://...", "source_sha256": "...", "offset": 80, "length": 5123},
+        {"url": "https://...", "source_sha256": "...", "offset": 5203, "length": 96,
+         "raw_offset": 0, "raw_length": 4410},
+        ...
+      ],
+      "raw_sha256": "<hash of the .raw file>"
+    }
+
+On a rebuild, a page whose source HTML hash and converter version both match
+the manifest is not converted again: its section is sliced straight out of the
+existing output by offset. Only new or changed pages go through
+``html_to_markdown``. If the result is byte-identical to the existing output
+the file is left untouched.
+
+Post-processing that rewrites sections after conversion (``llmstxt.dedup``)
+hands the final bytes to ``rewrite``. The reused sections must be the pages as
+converted, not as rewritten, so that post-processing can start from the
+current pages on every build. Sections that were rewritten are therefore
+kept as converted in ``<output>.raw``, located by ``raw_offset`` and
+``raw_length``.
+"""
+import inspect
+import json
+import os
+
+from llmstxt.util import atomic_write, sha256_hex
+
+MANIFEST_SUFFIX = '.manifest.json'
+RAW_SUFFIX = '.raw'
+
+
+def converter_version(*objs):
+    """Version string for a converter: the hash of the scripts that define `objs`.
+
+    Any edit to those scripts (selectors, noise filters, formatting) invalidates
+    every page they converted previously.
+    """
+    data = b''
+    for path in dict.fromkeys(inspect.getsourcefile(obj) for obj in objs):
+        with open(path, 'rb') as f:
+            data += f.read()
+    return sha256_hex(data)[:16]
+
+
+class IncrementalOutput:
+    """Drop-in replacement for ``open(OUTPUT_FILE, 'w')`` in the crawler scripts.
+
+    Usage::
+
+        with IncrementalOutput(OUTPUT_FILE, converter_version(html_to_markdown)) as out:
+            out.write_header("# Title\\n\\n")
+            for page in pages:
+                out.write_page(page.url, page.content,
+                               lambda: html_to_markdown(page.content, page.url) + SEPARATOR)
+    """
+
+    def __init__(self, path, converter):
+        self.path = path
+        self.manifest_path = path + MANIFEST_SUFFIX
+        self.raw_path = path + RAW_SUFFIX
+        self.converter = converter
+        self.sections = []   # (url, source_sha256, bytes as converted)
+        self.rewritten = None  # bytes to write per section, if post-processing changed them
+        self.reused = 0
+        self.converted = 0
+        self.manifest_current = False
+        self.previous_raw = b''
+        self.previous, self.previous_sections = self._load()
+
+    def _load(self):
+        """Returns (old output bytes, {url: (source_sha256, section bytes)})."""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except (OSError, ValueError):
+            return None, {}
+        try:
+            with open(self.raw_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = b''
+
+        # Someone edited the output by hand, or it was written by another tool
+        if manifest.get('output_sha256') != sha256_hex(data):
+            return data, {}
+        if manifest.get('converter') != self.converter:
+            return data, {}
+        if manifest.get('raw_sha256', sha256_hex(b'')) != sha256_hex(raw):
+            return data, {}
+
+        self.manifest_current = True
+        self.previous_raw = raw
+        sections = {}
+        for s in manifest.get('sections', []):
+            if not s.get('url'):
+                continue
+            if 'raw_offset' in s:
+                section = raw[s['raw_offset']:s['raw_offset'] + s['raw_length']]
+            else:
+                section = data[s['offset']:s['offset'] + s['length']]
+            sections[s['url']] = (s['source_sha256'], section)
+        return data, sections
+
+    def write_header(self, text):
+        """Adds text that isn't tied to a page (title block, generation date...)."""
+        self.sections.append((None, None, text.encode('utf-8')))
+
+    def write_page(self, url, source, convert):
+        """Adds the section for `url`, calling `convert()` only if `source` changed.
+
+        `source` is the raw page body the section is converted from; `convert`
+        returns the full text to write for the page (including any separator).
+        """
+        digest, data = self.cached_section(url, source)
+        if data is None:
+            data = convert()
+        self.add_section(url, digest, data)
+
+    def cached_section(self, url, source):
+        """Returns (source digest, previous section bytes or None if it must be converted).
+
+        For callers that convert pages elsewhere (e.g. in a process pool) and
+        add them later with `add_section`, in output order.
+        """
+        digest = sha256_hex(source)
+        previous = self.previous_sections.get(url)
+        if previous and previous[0] == digest:
+            return digest, previous[1]
+        return digest, None
+
+    def add_section(self, url, digest, data):
+        """Appends a page section: bytes reused from `cached_section`, or newly converted text."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+            self.converted += 1
+        else:
+            self.reused += 1
+        self.sections.append((url, digest, data))
+
+    def rewrite(self, written):
+        """Sets the bytes to write for each section, in `sections` order.
+
+        The sections as converted are still what the next run reuses.
+        """
+        if len(written) != len(self.sections):
+            raise ValueError("rewrite() needs one entry per section")
+        self.rewritten = list(written)
+
+    def close(self):
+        written = self.rewritten or [section for _, _, section in self.sections]
+        data = b''.join(written)
+        raw = b''.join(section for (_, _, section), out in zip(self.sections, written) if section != out)
+        if data == self.previous and raw == self.previous_raw and self.manifest_current:
+            print(f"{self.path} unchanged ({self.reused} pages reused).")
+            return
+
+        manifest = {
+            'converter': self.converter,
+            'output_sha256': sha256_hex(data),
+            'sections': [],
+            'raw_sha256': sha256_hex(raw),
+        }
+        offset = raw_offset = 0
+        for (url, digest, section), out in zip(self.sections, written):
+            entry = {
+                'url': url,
+                'source_sha256': digest,
+                'offset': offset,
+                'length': len(out),
+            }
+            if section != out:
+                entry['raw_offset'] = raw_offset
+                entry['raw_length'] = len(section)
+                raw_offset += len(section)
+            manifest['sections'].append(entry)
+            offset += len(out)
+
+        if data != self.previous:
+            atomic_write(self.path, data)
+        if raw:
+            atomic_write(self.raw_path, raw)
+        elif os.path.exists(self.raw_path):
+            os.remove(self.raw_path)
+        atomic_write(self.manifest_path, json.dumps(manifest, indent=1).encode('utf-8'))
+        print(f"{self.path}: {self.converted} pages converted, {self.reused} reused.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
@@ -0,0 +1,156 @@
+"""Iterative reader for large JSON documents (OpenAPI specs).
+
+``json.load`` turns a 2 MB spec into tens of megabytes of Python objects
+before the first line of output is written. ``JsonDocument`` memory-maps the
+file instead and scans it with a small byte-level tokenizer that only finds
+where each value starts and ends. Values are decoded one at a time, when
+asked for::
+
+    doc = JsonDocument("jellyfin-openapi-stable.json")
+    info = doc.get("info", default={})
+    for path, item in doc.items("paths"):     # one path item decoded at a time
+        ...
+
+Peak memory is the mapped file (page cache, not heap) plus the largest
+single value decoded. ``span`` exposes raw byte ranges so callers can build
+their own lazy indexes (e.g. of ``components/schemas``).
+"""
+import json
+import mmap
+import re
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+# A whole string or one bracket; strings are consumed so brackets inside them are skipped
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb'[^,}\]\s]+')
+
+_MISSING = object()
+
+
+class JsonDocument:
+    """Read-only, lazily decoded view of a JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.root = self._skip_ws(0)
+        if self.buf[self.root:self.root + 1] != b'{':
+            raise ValueError(f"{path}: top-level JSON value is not an object")
+        self._top = None    # top-level member spans, scanned once on first lookup
+
+    def close(self):
+        self.buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- scanning ---
+
+    def _skip_ws(self, pos):
+        return _WHITESPACE.match(self.buf, pos).end()
+
+    def _string_end(self, pos):
+        """`pos` is just after an opening quote; returns the position after the closing one."""
+        match = _STRING_END.match(self.buf, pos)
+        if not match:
+            raise ValueError(f"{self.path}: unterminated string at byte {pos}")
+        return match.end()
+
+    def _value_end(self, pos):
+        """Returns the position just after the JSON value starting at `pos`."""
+        first = self.buf[pos:pos + 1]
+        if first == b'"':
+            return self._string_end(pos + 1)
+        if first not in (b'{', b'['):
+            match = _SCALAR.match(self.buf, pos)
+            if not match:
+                raise ValueError(f"{self.path}: expected a value at byte {pos}")
+            return match.end()
+
+        depth = 0
+        buf = self.buf
+        for match in _TOKEN.finditer(buf, pos):
+            char = buf[match.start()]
+            if char == 0x22:        # "
+                continue
+            if char in (0x7b, 0x5b):    # { [
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        raise ValueError(f"{self.path}: unterminated container at byte {pos}")
+
+    def _members(self, pos):
+        """Yields (key, value start, value end) for the object starting at `pos`."""
+        if self.buf[pos:pos + 1] != b'{':
+            return
+        pos = self._skip_ws(pos + 1)
+        if self.buf[pos:pos + 1] == b'}':
+            return
+        while True:
+            key_end = self._string_end(pos + 1)
+            key = json.loads(self.buf[pos:key_end])
+            pos = self._skip_ws(key_end)
+            if self.buf[pos:pos + 1] != b':':
+                raise ValueError(f"{self.path}: expected ':' at byte {pos}")
+            start = self._skip_ws(pos + 1)
+            end = self._value_end(start)
+            yield key, start, end
+            pos = self._skip_ws(end)
+            if self.buf[pos:pos + 1] == b'}':
+                return
+            pos = self._skip_ws(pos + 1)
+
+    def span(self, *keys):
+        """(start, end) byte range of the value at `keys` (nested object keys), or None."""
+        if not keys:
+            return self.root, self._value_end(self.root)
+        if self._top is None:
+            self._top = {key: (start, end) for key, start, end in self._members(self.root)}
+        if keys[0] not in self._top:
+            return None
+        start, end = self._top[keys[0]]
+        for key in keys[1:]:
+            for member, value_start, value_end in self._members(start):
+                if member == key:
+                    start, end = value_start, value_end
+                    break
+            else:
+                return None
+        return start, end
+
+    # --- decoding ---
+
+    def decode(self, start, end):
+        return json.loads(self.buf[start:end])
+
+    def get(self, *keys, default=_MISSING):
+        """Decodes the value at `keys`."""
+        span = self.span(*keys)
+        if span is None:
+            if default is _MISSING:
+                raise KeyError('/'.join(keys))
+            return default
+        return self.decode(*span)
+
+    def keys(self, *keys):
+        """Member names of the object at `keys`, without decoding their values."""
+        span = self.span(*keys)
+        return [key for key, _, _ in self._members(span[0])] if span else []
+
+    def spans(self, *keys):
+        """Yields (member name, start, end) for the object at `keys`."""
+        span = self.span(*keys)
+        if span:
+            yield from self._members(span[0])
+
+    def items(self, *keys):
+        """Yields (member name, decoded value) for the object at `keys`, one at a time."""
+        for key, start, end in self.spans(*keys):
+            yield key, self.decode(start, end)
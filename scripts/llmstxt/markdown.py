@@ -0,0 +1,454 @@
+"""Single-pass HTML-to-Markdown converter shared by the converter scripts.
+
+The old per-script ``html_to_markdown`` functions iterated ``content.descendants``
+and called ``get_text()`` on every ``p``, ``li`` and heading, so text inside
+nested lists (or a ``pre`` inside a ``div.listingblock``) was emitted once per
+ancestor and the work grew with nesting depth. ``convert.py`` also called
+``find_parent``/``find_parents`` for every element.
+
+The conversion is driven by plain parse events (``start``/``end``/``data``)
+fed to a ``MarkdownEmitter``. The open list nesting and whether we are inside a
+heading/callout/table cell/``pre`` are kept on explicit stacks, so every text
+node is emitted exactly once and no element ever looks at its ancestors or
+descendants. Two event sources share that emitter:
+
+* ``MarkdownConverter.convert(element)`` walks an existing BeautifulSoup tree
+  (what the crawler scripts use), and
+* ``stream_markdown(fileobj, ...)`` feeds lxml's event-driven HTML parser
+  straight into the emitter without building a tree, for very large inputs.
+"""
+import json
+import re
+
+from bs4.element import NavigableString, PreformattedString
+
+DEFAULT_HEADINGS = {f'h{n}': n for n in range(1, 7)}
+HEADING_TAGS = set(DEFAULT_HEADINGS)
+
+# Never emitted, and their subtrees are not walked
+SKIP_TAGS = {
+    'script', 'style', 'noscript', 'template', 'svg', 'button', 'img', 'head',
+    'iframe', 'input', 'select', 'textarea', 'link', 'meta', 'colgroup', 'col',
+}
+
+# Start and end a block: pending inline text is flushed before and after them
+BLOCK_TAGS = {
+    'p', 'div', 'section', 'article', 'main', 'header', 'footer', 'aside', 'nav',
+    'blockquote', 'figure', 'figcaption', 'dl', 'dt', 'dd', 'table', 'thead',
+    'tbody', 'tfoot', 'caption', 'form', 'fieldset', 'details', 'summary', 'hr',
+    'center', 'address',
+}
+
+CODE_LANG_PREFIXES = ('language-', 'lang-')
+
+# Shiki/twoslash code markup (typescriptlang.org): the language is a label
+# element inside the pre, lines are line elements (divs without newlines in
+# twoslash, spans separated by newline text in plain Shiki), and error popups
+# and "Try" links are repeated inside the code
+CODE_LABEL_CLASS = 'language-id'
+CODE_LINE_CLASS = 'line'
+LINE_END = object()     # end of a line element in the pieces of a pre
+CODE_NOISE_CLASSES = {'error-behind', 'playground-link', 'popover', 'twoslash-popup-container'}
+
+# Unlabeled code that is unmistakably a shell session: every line a prompt, a
+# package manager command or a directory change, and not only the latter
+SHELL_LINE = re.compile(r'\s*(?:\$ |(?:npm|npx|yarn|pnpm|bun|pip|pip3|brew|apt|apt-get|curl|git)\s)')
+SHELL_DIRECTORY_LINE = re.compile(r'\s*(?:cd|mkdir)\s')
+
+# Header permalinks ("#", "¶") that would otherwise leak into heading text
+PERMALINK_TEXT = {'', '#', '¶', '§', '🔗'}
+PERMALINK_CLASSES = ('anchor', 'hash-link', 'permalink', 'headerlink')
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _classes(attrs):
+    return attrs.get('class') or ()
+
+
+class MarkdownConverter:
+    """Converts HTML to Markdown in one pass.
+
+    `headings` maps the heading tags to emit to their Markdown level; heading
+    tags not in the map are dropped with their text (the scripts write the page
+    ``h1`` themselves). `code_lang` is the fence language used when a ``pre``
+    carries no ``language-*``/``lang-*`` class or language label and its code
+    isn't recognisably JSON or shell commands (see `guess_language`).
+
+    Callouts are rendered as ``> **LABEL:** text`` quotes. `callout(name, attrs)`
+    returns the label for elements that start a callout ('' for a plain quote)
+    and None for everything else. Inside a callout, `callout_title(name, attrs)`
+    may return a label taken from the attributes (e.g. an icon's ``alt``), or
+    True to use the element's text as the label instead of quoting it.
+
+    `attrs` is a dict of attributes with ``class`` as a list, as in BeautifulSoup.
+    """
+
+    def __init__(self, headings=None, code_lang='', callout=None, callout_title=None):
+        self.headings = DEFAULT_HEADINGS if headings is None else headings
+        self.code_lang = code_lang
+        self.callout = callout
+        self.callout_title = callout_title
+
+    def code_language(self, pre_attrs, code_attrs, parent_attrs, label='', code=''):
+        """Looks for a language class on the `pre`, its `code` child, or its wrapper div.
+
+        Falls back to the `label` element inside the pre, then to `guess_language`.
+        """
+        for attrs in (pre_attrs, code_attrs, parent_attrs):
+            for c in _classes(attrs or {}):
+                for prefix in CODE_LANG_PREFIXES:
+                    if c.startswith(prefix) and c != CODE_LABEL_CLASS:
+                        return c[len(prefix):]
+        return label or guess_language(code) or self.code_lang
+
+    def convert(self, root):
+        """Converts the children of a BeautifulSoup element."""
+        out = []
+        emitter = MarkdownEmitter(self, out.append)
+        stack = [(child, False) for child in reversed(root.contents)]
+        while stack:
+            node, leaving = stack.pop()
+            if leaving:
+                emitter.end(node.name)
+                continue
+            if isinstance(node, NavigableString):
+                if not isinstance(node, PreformattedString):   # comments, doctypes, CDATA
+                    emitter.data(node)
+                continue
+            if not emitter.start(node.name, node.attrs):
+                continue
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.contents))
+        emitter.close()
+        return ''.join(out)
+
+
+def guess_language(code):
+    """'json' or 'bash' for code that can only be that, else ''."""
+    text = code.strip()
+    if text[:1] in '{[' and text[-1:] in '}]':
+        try:
+            json.loads(text)
+            return 'json'
+        except ValueError:
+            pass
+    lines = [line for line in text.splitlines() if line.strip() and not line.lstrip().startswith('#')]
+    commands = sum(1 for line in lines if SHELL_LINE.match(line))
+    if commands and all(SHELL_LINE.match(line) or SHELL_DIRECTORY_LINE.match(line) for line in lines):
+        return 'bash'
+    return ''
+
+
+class MarkdownEmitter:
+    """Turns start/end/data parse events into Markdown, passed to `write` block by block.
+
+    `start` returns False when the element's subtree must be skipped; the event
+    source must then deliver no events for it, including its `end`.
+    """
+
+    def __init__(self, converter, write):
+        self.converter = converter
+        self.write = write
+        self.buf = []          # inline text pieces of the current block
+        self.sinks = []        # nested text buffers (inline code, heading anchors, callout titles)
+        self.actions = []      # per open element: what to do at its end
+        self.attrs = []        # per open element: its attributes (for a pre's wrapper)
+        self.capture = []      # open heading/callout/cell contexts
+        self.callouts = []     # [label] per open callout
+        self.lists = []        # [ordered, next number] per open ul/ol
+        self.items = []        # [indent, marker, first line emitted] per open li
+        self.row = None        # cells of the current table row
+        self.row_header = False
+        self.pre = None        # [text pieces, pre attrs, code attrs, wrapper attrs, label,
+                               #  open line elements, newline text between lines] inside a pre
+
+    def text(self):
+        text = ' '.join(''.join(self.buf).split())
+        self.buf = []
+        return text
+
+    def flush(self):
+        """Emits pending inline text as a paragraph or list item line."""
+        text = self.text()
+        if not text:
+            return
+        if self.items:
+            item = self.items[-1]
+            if item[2]:
+                self.write(f"{item[0]}  {text}\n")
+            else:
+                self.write(f"{item[0]}{item[1]} {text}\n")
+                item[2] = True
+        else:
+            self.write(f"{text}\n\n")
+
+    def data(self, text):
+        if self.pre is not None:
+            self.pre[0].append(text)
+            if not self.pre[5] and '\n' in text:
+                self.pre[6] = True
+        elif self.sinks:
+            self.sinks[-1].append(text)
+        else:
+            self.buf.append(text)
+
+    def _inline(self, text):
+        """Adds finished inline text to whatever encloses it."""
+        (self.sinks[-1] if self.sinks else self.buf).append(text)
+
+    def _open(self, attrs, action):
+        self.actions.append(action)
+        self.attrs.append(attrs)
+        return True
+
+    def start(self, name, attrs):
+        converter = self.converter
+
+        if self.pre is not None:
+            # Everything inside a pre is raw code; only note the code tag's language
+            if name == 'code' and self.pre[2] is None:
+                self.pre[2] = attrs
+            classes = _classes(attrs)
+            if CODE_NOISE_CLASSES.intersection(classes):
+                return False
+            if CODE_LABEL_CLASS in classes:
+                self.sinks.append(self.pre[0])
+                self.pre[0] = []
+                return self._open(attrs, ('label',))
+            if CODE_LINE_CLASS in classes:
+                self.pre[5] += 1
+                return self._open(attrs, ('line',))
+            return self._open(attrs, None)
+
+        if self.callouts and converter.callout_title:
+            title = converter.callout_title(name, attrs)
+            if title is True:
+                self.sinks.append([])
+                return self._open(attrs, ('title',))
+            if title:
+                self.callouts[-1][0] = title
+                return False
+
+        if name in SKIP_TAGS:
+            return False
+
+        if converter.callout and not self.capture:
+            label = converter.callout(name, attrs)
+            if label is not None:
+                self.flush()
+                self.capture.append('callout')
+                self.callouts.append([label])
+                return self._open(attrs, ('callout',))
+
+        if name in HEADING_TAGS:
+            if name not in converter.headings:
+                return False
+            self.flush()
+            self.capture.append('heading')
+            return self._open(attrs, ('heading', converter.headings[name]))
+
+        if name == 'pre' and not self.capture:
+            self.flush()
+            self.pre = [[], attrs, None, self.attrs[-1] if self.attrs else None, '', 0, False]
+            return self._open(attrs, ('pre',))
+
+        if name == 'code' or name == 'pre':
+            self.sinks.append([])
+            return self._open(attrs, ('code',))
+
+        if name == 'a' and self.capture and self.capture[-1] == 'heading':
+            if any(p in c for c in _classes(attrs) for p in PERMALINK_CLASSES):
+                return False
+            self.sinks.append([])
+            return self._open(attrs, ('anchor',))
+
+        if name == 'br':
+            self.buf.append(' ')
+            return False
+
+        if self.capture:
+            # Everything inside a heading/callout/cell is one line of text
+            if name in BLOCK_TAGS or name in ('ul', 'ol', 'li', 'tr', 'td', 'th'):
+                self._inline(' ')
+            return self._open(attrs, None)
+
+        if name in ('ul', 'ol'):
+            self.flush()
+            self.lists.append([name == 'ol', 1])
+            return self._open(attrs, ('list',))
+
+        if name == 'li':
+            self.flush()
+            indent = '  ' * max(0, len(self.lists) - 1)
+            marker = '-'
+            if self.lists and self.lists[-1][0]:
+                marker = f"{self.lists[-1][1]}."
+                self.lists[-1][1] += 1
+            self.items.append([indent, marker, False])
+            return self._open(attrs, ('item',))
+
+        if name == 'tr':
+            self.flush()
+            self.row = []
+            self.row_header = True
+            return self._open(attrs, ('row',))
+
+        if name in ('td', 'th'):
+            self.flush()
+            if name == 'td':
+                self.row_header = False
+            self.capture.append('cell')
+            return self._open(attrs, ('cell',))
+
+        if name in BLOCK_TAGS:
+            self.flush()
+            return self._open(attrs, ('block', name))
+        return self._open(attrs, None)
+
+    def end(self, name):
+        action = self.actions.pop()
+        self.attrs.pop()
+        if action is None:
+            return
+        kind = action[0]
+
+        if kind == 'pre':
+            pieces, pre_attrs, code_attrs, wrapper_attrs, label, _, newlines = self.pre
+            self.pre = None
+            # Line ends are only added when the markup doesn't already separate lines with newlines
+            code = ''.join('' if piece is LINE_END and newlines else '\n' if piece is LINE_END else piece
+                           for piece in pieces).strip('\n')
+            if code.strip():
+                lang = self.converter.code_language(pre_attrs, code_attrs, wrapper_attrs, label, code)
+                self.write(f"```{lang}\n{code}\n```\n\n")
+        elif kind == 'label':
+            self.pre[4] = ''.join(self.pre[0]).strip()
+            self.pre[0] = self.sinks.pop()
+        elif kind == 'line':
+            self.pre[5] -= 1
+            self.pre[0].append(LINE_END)
+        elif kind == 'code':
+            code = ' '.join(''.join(self.sinks.pop()).split())
+            if code:
+                self._inline(f"`{code}`")
+        elif kind == 'anchor':
+            text = ''.join(self.sinks.pop())
+            if text.strip() not in PERMALINK_TEXT:
+                self._inline(text)
+        elif kind == 'title':
+            title = ' '.join(''.join(self.sinks.pop()).split())
+            if title:
+                self.callouts[-1][0] = title
+        elif kind == 'heading':
+            self.capture.pop()
+            text = self.text()
+            if text:
+                self.write(f"\n{'#' * action[1]} {text}\n\n")
+        elif kind == 'callout':
+            self.capture.pop()
+            label = self.callouts.pop()[0]
+            text = self.text()
+            if text:
+                label = f"**{label.upper()}:** " if label else ""
+                self.write(f"> {label}{text}\n\n")
+        elif kind == 'list':
+            self.flush()
+            self.lists.pop()
+            if not self.lists:
+                self.write("\n")
+        elif kind == 'item':
+            self.flush()
+            self.items.pop()
+        elif kind == 'cell':
+            self.capture.pop()
+            if self.row is not None:
+                self.row.append(self.text().replace('|', '\\|'))
+            else:
+                self.flush()
+        elif kind == 'row':
+            cells, self.row = self.row, None
+            if cells and any(cells):
+                self.write(f"| {' | '.join(cells)} |\n")
+                if self.row_header:
+                    self.write(f"|{' --- |' * len(cells)}\n")
+        else:
+            self.flush()
+            if action[1] == 'table':
+                self.write("\n")
+
+    def close(self):
+        self.flush()
+
+
+class _LxmlTarget:
+    """lxml parser target forwarding the events inside the root element to an emitter.
+
+    `root(name, attrs)` picks the element whose content is converted (None
+    converts the whole document). Subtrees the emitter skips are swallowed here.
+    """
+
+    def __init__(self, emitter, root=None):
+        self.emitter = emitter
+        self.root = root
+        self.inside = 0 if root else 1   # open elements within the root, counting the root
+        self.skip = 0                    # open elements within a skipped subtree
+        self.found = root is None
+
+    def start(self, tag, attrib):
+        if self.skip:
+            self.skip += 1
+            return
+        attrs = dict(attrib)
+        if 'class' in attrs:
+            attrs['class'] = attrs['class'].split()
+        if not self.inside:
+            if self.root(tag, attrs):
+                self.inside = 1
+                self.found = True
+            return
+        if self.emitter.start(tag, attrs):
+            self.inside += 1
+        else:
+            self.skip = 1
+
+    def end(self, tag):
+        if self.skip:
+            self.skip -= 1
+            return
+        if not self.inside:
+            return
+        self.inside -= 1
+        if self.inside:
+            self.emitter.end(tag)
+
+    def data(self, text):
+        if self.inside and not self.skip:
+            self.emitter.data(text)
+
+    def close(self):
+        self.emitter.close()
+        return self.found
+
+
+def stream_markdown(fileobj, converter, write, root=None, chunk_size=STREAM_CHUNK_SIZE):
+    """Converts an HTML file to Markdown with lxml's event parser, without building a tree.
+
+    The file is fed to the parser in `chunk_size` pieces and every finished
+    block is handed to `write`, so memory stays bounded by the largest single
+    block rather than by the document. Returns False if `root` never matched.
+    Raises ImportError if lxml is not installed.
+    """
+    from lxml import etree
+
+    emitter = MarkdownEmitter(converter, write)
+    target = _LxmlTarget(emitter, root)
+    parser = etree.HTMLParser(target=target, encoding='utf-8', remove_comments=True)
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        parser.feed(chunk)
+    return parser.close()
@@ -0,0 +1,373 @@
+"""OpenAPI/Swagger spec to llms.txt sections, shared by the API converters.
+
+``OpenApi`` wraps either a decoded spec dict (``convert_seer.py``) or a
+``JsonDocument`` (the streamed Emby/Jellyfin/Sonarr/Radarr specs) and renders
+one Markdown section per operation::
+
+    api = OpenApi(JsonDocument("v3.json"), operation_ids=True)
+    for path, path_item in api.paths():
+        for section in api.endpoint_sections(path, path_item):
+            f.write("\\n" + "\\n".join(section))
+
+Request bodies and responses get a compact summary of their schema: the type
+expression plus the fields of the model it names, e.g.
+``SeriesResource[] — SeriesResource {id: integer, title*: string, ...}``
+(``*`` marks required fields). Fields that refer to other models show the
+model's name rather than expanding it, so recursive schemas stay finite.
+
+With ``appendix=True`` endpoints only carry the type expression
+(``SeriesResource[]``) and ``appendix_sections()`` then lists every schema
+referenced so far, and the schemas those refer to, once each under
+``## Schemas``. ``savings()`` compares that with the inline rendering.
+
+``$ref`` targets are looked up once and memoized: with a ``JsonDocument`` the
+component schemas are indexed by byte range up front and each one is decoded
+the first time it's referenced. Model summaries are memoized by name too, so
+a schema used by hundreds of endpoints is only rendered once.
+"""
+from collections import Counter
+
+from llmstxt.jsonstream import JsonDocument
+from llmstxt.tokens import count_tokens
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+SCHEMA_PREFIXES = ('#/components/schemas/', '#/definitions/')
+STRING_FORMATS = {'date', 'date-time', 'uuid', 'uri', 'email', 'binary', 'byte'}
+
+MAX_ENUM = 8            # enum values shown before "|…"
+MAX_INLINE_DEPTH = 2    # nesting of anonymous objects expanded inside a summary
+
+
+def clean_text(text):
+    if not text: return ""
+    return " ".join(str(text).split())
+
+
+def ref_name(ref):
+    """`SeriesResource` from `#/components/schemas/SeriesResource`."""
+    return _unescape(ref.rsplit('/', 1)[-1])
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _enum(values):
+    shown = '|'.join(str(v) for v in values[:MAX_ENUM])
+    return shown + '|…' if len(values) > MAX_ENUM else shown
+
+
+def _schema_refs(schema):
+    """Names of the component schemas referenced anywhere inside `schema`."""
+    stack = [schema]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref.startswith(SCHEMA_PREFIXES):
+                yield ref_name(ref)
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _media_schema(content):
+    """(media type, schema) from an OpenAPI 3 `content` map, preferring JSON."""
+    if not isinstance(content, dict) or not content:
+        return None, None
+    media = next((m for m in content if 'json' in m), next(iter(content)))
+    entry = content[media]
+    return media, entry.get('schema') if isinstance(entry, dict) else None
+
+
+class OpenApi:
+    """Renders the operations of one spec; see the module docstring."""
+
+    def __init__(self, spec, operation_ids=False, appendix=False):
+        self.spec = spec
+        self.operation_ids = operation_ids
+        self.appendix = appendix
+        self.referenced = {}    # schema names used by the rendered endpoints, in first-use order
+        self._inline = Counter()    # model name -> times it would have been expanded inline
+        self._appendix_text = []
+        self.streamed = isinstance(spec, JsonDocument)
+        self._refs = {}         # local $ref -> decoded target
+        self._spans = {}        # '#/components/schemas/' -> {name: byte span}, when streamed
+        self._models = {}       # schema name -> rendered model summary
+
+    # --- spec access ---
+
+    def info(self):
+        if self.streamed:
+            return self.spec.get('info', default={})
+        return self.spec.get('info', {})
+
+    def paths(self):
+        """Yields (path, path item), decoding one path item at a time when streamed."""
+        if self.streamed:
+            return self.spec.items('paths')
+        return iter(self.spec.get('paths', {}).items())
+
+    def schema(self, name):
+        """The component schema called `name`, or None."""
+        for prefix in SCHEMA_PREFIXES:
+            schema = self.lookup(prefix + name)
+            if schema is not None:
+                return schema
+        return None
+
+    def lookup(self, ref):
+        """Target of a local `$ref`, decoded once; None for external or dangling refs."""
+        if ref not in self._refs:
+            self._refs[ref] = self._pointer(ref) if ref.startswith('#/') else None
+        return self._refs[ref]
+
+    def _pointer(self, ref):
+        prefix, name = ref.rsplit('/', 1)
+        keys = [_unescape(part) for part in prefix[2:].split('/')]
+        if self.streamed:
+            # One scan per container (e.g. components/schemas) indexes every member;
+            # the members themselves are only decoded when referenced
+            if prefix not in self._spans:
+                self._spans[prefix] = {key: (start, end) for key, start, end in self.spec.spans(*keys)}
+            span = self._spans[prefix].get(_unescape(name))
+            return self.spec.decode(*span) if span else None
+        node = self.spec
+        for key in keys + [_unescape(name)]:
+            node = node.get(key) if isinstance(node, dict) else None
+        return node
+
+    def deref(self, obj):
+        """Follows a chain of `$ref`s (parameters, responses, bodies); stops on a cycle."""
+        seen = set()
+        while isinstance(obj, dict) and '$ref' in obj and obj['$ref'] not in seen:
+            seen.add(obj['$ref'])
+            obj = self.lookup(obj['$ref'])
+        return obj if isinstance(obj, dict) else {}
+
+    # --- schema summaries ---
+
+    def type_name(self, schema, depth=0):
+        """Short type expression: `string`, `SeriesResource[]`, `{id: integer}`, `A|B`..."""
+        if not isinstance(schema, dict) or not schema:
+            return 'any'
+        if '$ref' in schema:
+            return ref_name(schema['$ref'])
+        for key in ('oneOf', 'anyOf'):
+            if schema.get(key):
+                return '|'.join(dict.fromkeys(self.type_name(s, depth) for s in schema[key]))
+        if schema.get('allOf'):
+            # `allOf: [{$ref}]` is how nullable references are usually written
+            if not schema.get('properties') and all('$ref' in s for s in schema['allOf']):
+                return ' & '.join(ref_name(s['$ref']) for s in schema['allOf'])
+            return self.fields(schema, depth + 1) if depth < MAX_INLINE_DEPTH else 'object'
+        if 'enum' in schema:
+            return _enum(schema['enum'])
+
+        kind = schema.get('type')
+        if isinstance(kind, list):
+            kind = '|'.join(k for k in kind if k != 'null') or 'null'
+        if kind == 'array':
+            return self.type_name(schema.get('items'), depth) + '[]'
+        if kind == 'object' or 'properties' in schema:
+            if schema.get('properties') and depth < MAX_INLINE_DEPTH:
+                return self.fields(schema, depth + 1)
+            extra = schema.get('additionalProperties')
+            if isinstance(extra, dict) and extra:
+                return f"map<{self.type_name(extra, depth)}>"
+            return 'object'
+        if kind == 'string' and schema.get('format') in STRING_FORMATS:
+            return f"string({schema['format']})"
+        return kind or 'any'
+
+    def _properties(self, schema, seen):
+        """(properties, required names) of an object schema, merged across `allOf`."""
+        props, required = {}, set()
+        for part in schema.get('allOf') or ():
+            if not isinstance(part, dict):
+                continue
+            if '$ref' in part:
+                ref = part['$ref']
+                if ref in seen:
+                    continue
+                seen = seen | {ref}
+                part = self.lookup(ref) or {}
+            part_props, part_required = self._properties(part, seen)
+            props.update(part_props)
+            required.update(part_required)
+        props.update(schema.get('properties') or {})
+        if isinstance(schema.get('required'), list):
+            required.update(schema['required'])
+        return props, required
+
+    def fields(self, schema, depth=1, seen=frozenset()):
+        """`{name*: type, ...}` for an object schema."""
+        props, required = self._properties(schema, seen)
+        return '{' + ', '.join(
+            f"{name}{'*' if name in required else ''}: {self.type_name(sub, depth)}"
+            for name, sub in props.items()
+        ) + '}'
+
+    def model(self, name):
+        """Summary of the component schema `name`, rendered once."""
+        if name not in self._models:
+            schema = self.schema(name) or {}
+            if schema.get('properties') or schema.get('allOf'):
+                seen = frozenset(prefix + name for prefix in SCHEMA_PREFIXES)
+                self._models[name] = self.fields(schema, seen=seen)
+            else:
+                self._models[name] = self.type_name(schema, depth=1)
+        return self._models[name]
+
+    def core_model(self, schema):
+        """Name of the component schema a body/response is built around, if any."""
+        while isinstance(schema, dict):
+            if '$ref' in schema:
+                ref = schema['$ref']
+                return ref_name(ref) if ref.startswith(SCHEMA_PREFIXES) else None
+            if schema.get('type') == 'array':
+                schema = schema.get('items')
+                continue
+            parts = schema.get('allOf') or schema.get('oneOf') or schema.get('anyOf')
+            if parts and len(parts) == 1 and not schema.get('properties'):
+                schema = parts[0]
+                continue
+            return None
+        return None
+
+    def describe(self, schema):
+        """Type of a body/response schema plus the fields of the model it names."""
+        text = self.type_name(schema)
+        name = self.core_model(schema)
+        if name and self.model(name) not in ('any', name):
+            if not self.appendix:
+                return text + self._expansion(name)
+            self._inline[name] += 1
+        self._note_refs(schema)
+        return text
+
+    def _expansion(self, name):
+        return f" — {name} {self.model(name)}"
+
+    def _note_refs(self, schema):
+        """Records the component schemas `schema` refers to, for the appendix."""
+        if not self.appendix:
+            return
+        for name in _schema_refs(schema):
+            self.referenced.setdefault(name, None)
+
+    # --- schema appendix ---
+
+    def appendix_sections(self):
+        """Yields the `## Schemas` heading and one section per referenced schema.
+
+        Schemas referenced only from other schemas are appended as they're found,
+        so every name used in the output is defined exactly once.
+        """
+        if not self.referenced:
+            return
+        yield self._appendix_section(["## Schemas", "Models referenced by the endpoints above, each listed once.", ""])
+        listed = dict(self.referenced)
+        queue = list(listed)
+        for name in queue:      # grows while we iterate
+            schema = self.schema(name)
+            if schema is None:
+                continue
+            yield self._appendix_section([f"### {name}", self.model(name), ""])
+            for ref in _schema_refs(schema):
+                if ref not in listed:
+                    listed[ref] = None
+                    queue.append(ref)
+
+    def _appendix_section(self, section):
+        self._appendix_text.append("\n" + "\n".join(section))
+        return section
+
+    def savings(self):
+        """Size of the appendix against expanding every body/response model inline.
+
+        Returns (inline bytes, inline tokens, appendix bytes, appendix tokens,
+        number of schemas); call it after `appendix_sections()` has been written.
+        """
+        inline_bytes = inline_tokens = 0
+        for name, uses in self._inline.items():
+            text = self._expansion(name)
+            inline_bytes += uses * len(text.encode('utf-8'))
+            inline_tokens += uses * count_tokens(text)
+        appendix = "".join(self._appendix_text)
+        return (inline_bytes, inline_tokens, len(appendix.encode('utf-8')),
+                count_tokens(appendix), max(len(self._appendix_text) - 1, 0))
+
+    def savings_report(self):
+        inline_bytes, inline_tokens, appendix_bytes, appendix_tokens, schemas = self.savings()
+        return (f"Schema appendix: {schemas} schemas in {appendix_bytes:,} bytes / {appendix_tokens:,} tokens "
+                f"instead of {inline_bytes:,} bytes / {inline_tokens:,} tokens inline "
+                f"(saved {inline_bytes - appendix_bytes:,} bytes, {inline_tokens - appendix_tokens:,} tokens)")
+
+    # --- rendering ---
+
+    def parameters(self, path_item, details):
+        """Path-level and operation parameters, operation ones winning (resolved)."""
+        params = {}
+        for p in list(path_item.get('parameters') or ()) + list(details.get('parameters') or ()):
+            p = self.deref(p)
+            if p:
+                params[(p.get('name'), p.get('in'))] = p
+        return list(params.values())
+
+    def endpoint_sections(self, path, path_item):
+        """Yields the lines of one section per operation of `path`."""
+        for method_name, details in path_item.items():
+            if method_name.lower() not in HTTP_METHODS or not isinstance(details, dict):
+                continue
+            yield self.operation(method_name, path, path_item, details)
+
+    def operation(self, method_name, path, path_item, details):
+        output = []
+        summary = clean_text(details.get('summary', ''))
+        description = clean_text(details.get('description', ''))
+        operation_id = details.get('operationId', '')
+
+        output.append(f"## {method_name.upper()} {path}")
+        if summary: output.append(f"**Summary**: {summary}")
+        if self.operation_ids and operation_id: output.append(f"**ID**: {operation_id}")
+        if description and description != summary:
+            output.append(f"**Details**: {description}")
+
+        body = None
+        params = self.parameters(path_item, details)
+        listed = [p for p in params if p.get('in') not in ('body', 'formData')]
+        if listed:
+            output.append("**Parameters**:")
+            for p in listed:
+                name = p.get('name', '?')
+                loc = p.get('in', '?')
+                req = "*" if p.get('required') else ""
+                # Swagger 2 puts the type on the parameter itself
+                type_hint = self.type_name(p.get('schema', p))
+                self._note_refs(p.get('schema'))
+                desc = clean_text(p.get('description', ''))
+                output.append(f"- `{name}`{req} ({loc} {type_hint}): {desc}")
+
+        # Request body: OpenAPI 3 requestBody, or a Swagger 2 `in: body` parameter
+        if 'requestBody' in details:
+            media, body = _media_schema(self.deref(details['requestBody']).get('content'))
+        else:
+            media = None
+            body = next((p.get('schema') for p in params if p.get('in') == 'body'), None)
+        if body:
+            label = f" ({media})" if media and 'json' not in media else ""
+            output.append(f"**Body**{label}: {self.describe(body)}")
+
+        for code, response in (details.get('responses') or {}).items():
+            response = self.deref(response)
+            if 'content' in response:
+                media, schema = _media_schema(response['content'])
+            else:
+                media, schema = None, response.get('schema')
+            if schema:
+                label = f" ({media})" if media and 'json' not in media else ""
+                output.append(f"**Response** {code}{label}: {self.describe(schema)}")
+
+        output.append("")
+        return output
@@ -0,0 +1,126 @@
+"""Build several sites at once.
+
+Crawling is network-bound and converting is CPU-bound, so the two phases are
+scheduled separately:
+
+* crawl: one thread per host, all hosts at the same time. Sites that share a
+  host (``react-reference`` and ``react-learn``) are crawled one after the
+  other so the per-host rate limit still holds.
+* convert: as soon as a site's crawl finishes, its pages are handed to a
+  process pool sized to the CPU count, so BeautifulSoup parsing runs on every
+  core while the other sites are still downloading. Crawled pages go to a
+  compressed spool file one at a time (``llmstxt.pagestore.spool_pages``)
+  and the worker streams them back, so no site is ever held in memory whole.
+
+At the end a table of per-site wall time, failures and the tokens saved by
+deduplication is printed.
+"""
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from llmstxt.cache import HttpCache
+from llmstxt.engine import write_output
+from llmstxt.pagestore import read_spool, spool_pages
+from llmstxt.sites import PROFILES, get_profile
+from llmstxt.summary import DEFAULT_MAX_TOKENS as LLMS_TXT_TOKENS
+
+SiteResult = namedtuple('SiteResult', ['name', 'pages', 'failed', 'crawl_seconds', 'convert_seconds',
+                                       'wall_seconds', 'output_file', 'error', 'tokens_saved'])
+
+
+def _crawl(profile):
+    """Fetches every page of `profile` into a spool file; returns (path, page count, seconds)."""
+    start = time.perf_counter()
+    _, pages = profile.discovery.pages(profile, HttpCache())
+    path, count = spool_pages(pages)
+    return path, count, time.perf_counter() - start
+
+
+def _crawl_host(profiles, on_crawled):
+    """Crawls sites sharing a host one after the other."""
+    for profile in profiles:
+        try:
+            path, count, seconds = _crawl(profile)
+        except Exception as e:
+            on_crawled(profile, None, 0, 0.0, e)
+        else:
+            on_crawled(profile, path, count, seconds, None)
+
+
+def _convert(name, path, count, output_dir, llms_txt_tokens, compact):
+    """Process pool worker: converts and writes one site from its spool file.
+
+    Returns (output path, failed, tokens saved, seconds).
+    """
+    start = time.perf_counter()
+    output_file, failed, saved = write_output(get_profile(name), read_spool(path), count, output_dir,
+                                              llms_txt_tokens=llms_txt_tokens, compact=compact)
+    return output_file, failed, saved, time.perf_counter() - start
+
+
+def build_all(names=None, output_dir='.', jobs=None, llms_txt_tokens=LLMS_TXT_TOKENS, compact=False):
+    """Builds the registered sites `names` (default: all). Returns a list of `SiteResult`."""
+    names = list(names or sorted(PROFILES))
+    profiles = [get_profile(name) for name in names]
+    jobs = jobs or os.cpu_count() or 1
+
+    by_host = {}
+    for profile in profiles:
+        by_host.setdefault(urlparse(profile.discovery.source).netloc, []).append(profile)
+
+    started = time.perf_counter()
+    results = {}
+    converting = {}
+    lock = threading.Lock()   # crawl threads fill `results` and `converting` concurrently
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        def on_crawled(profile, path, count, seconds, error):
+            # Runs on the crawl threads
+            if error is not None or not count:
+                if path:
+                    os.remove(path)
+                result = SiteResult(profile.name, 0, 0, seconds, 0.0, time.perf_counter() - started, None,
+                                    str(error) if error else "no pages found", 0)
+                with lock:
+                    results[profile.name] = result
+                return
+            future = pool.submit(_convert, profile.name, path, count, output_dir, llms_txt_tokens, compact)
+            with lock:
+                converting[future] = (profile.name, path, count, seconds)
+
+        with ThreadPoolExecutor(max_workers=len(by_host) or 1) as crawlers:
+            for host_profiles in by_host.values():
+                crawlers.submit(_crawl_host, host_profiles, on_crawled)
+
+        for future in as_completed(list(converting)):
+            name, path, count, crawl_seconds = converting[future]
+            try:
+                output_file, failed, saved, convert_seconds = future.result()
+                error = None
+            except Exception as e:
+                output_file, failed, saved, convert_seconds, error = None, 0, 0, 0.0, str(e)
+            finally:
+                os.remove(path)
+            results[name] = SiteResult(name, count, failed, crawl_seconds, convert_seconds,
+                                       time.perf_counter() - started, output_file, error, saved)
+
+    ordered = [results[name] for name in names]
+    print_report(ordered, time.perf_counter() - started)
+    return ordered
+
+
+def print_report(results, total_seconds):
+    print()
+    print(f"{'site':<20} {'pages':>6} {'failed':>6} {'crawl':>8} {'convert':>8} {'wall':>8} "
+          f"{'saved':>9}  status")
+    for r in results:
+        status = f"ERROR: {r.error}" if r.error else "ok"
+        print(f"{r.name:<20} {r.pages:>6} {r.failed:>6} {r.crawl_seconds:>7.1f}s "
+              f"{r.convert_seconds:>7.1f}s {r.wall_seconds:>7.1f}s {r.tokens_saved:>9,}  {status}")
+    failures = sum(1 for r in results if r.error)
+    print(f"\n{len(results)} sites in {total_seconds:.1f}s, {failures} failed; "
+          f"deduplication saved {sum(r.tokens_saved for r in results):,} tokens.")
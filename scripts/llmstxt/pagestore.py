@@ -0,0 +1,115 @@
+"""Bounded-memory store for pages kept between a crawl and its conversion.
+
+A deep crawl has to hold every page until discovery is finished, because the
+output is written in sorted URL order. ``PageStore`` keeps at most
+``max_pages`` bodies in memory; the rest are zlib-compressed and appended to
+an anonymous temporary segment file, with an in-memory index of
+``url -> (offset, length)``. ``items()`` streams the pages back in sorted
+order, reading spilled ones one at a time, so memory stays flat no matter
+how large the site is.
+
+``spool_pages``/``read_spool`` do the same for a crawl handed to another
+process (``build-all``): the pages are written to a file in crawl order, one
+at a time, and the converting process reads them back one at a time.
+"""
+import os
+import pickle
+import tempfile
+import zlib
+
+from llmstxt.fetch import Page
+
+DEFAULT_MAX_PAGES = 256
+COMPRESS_LEVEL = 1   # HTML shrinks ~5x even at level 1; higher levels mostly cost CPU
+
+
+class PageStore:
+    """URL -> page body mapping that spills to a compressed segment file."""
+
+    def __init__(self, max_pages=DEFAULT_MAX_PAGES, directory=None):
+        self.max_pages = max_pages
+        self.directory = directory
+        self.memory = {}
+        self.spilled = {}   # url -> (offset, length) in the segment file
+        self.segment = None
+        self.segment_size = 0
+
+    def __contains__(self, url):
+        return url in self.memory or url in self.spilled
+
+    def __len__(self):
+        return len(self.memory) + len(self.spilled)
+
+    def add(self, url, content):
+        if url in self:
+            return
+        if len(self.memory) < self.max_pages:
+            self.memory[url] = content
+            return
+        if self.segment is None:
+            self.segment = tempfile.TemporaryFile(prefix='llmstxt-pages-', dir=self.directory)
+        data = zlib.compress(content, COMPRESS_LEVEL)
+        self.segment.seek(self.segment_size)
+        self.segment.write(data)
+        self.spilled[url] = (self.segment_size, len(data))
+        self.segment_size += len(data)
+
+    def get(self, url):
+        if url in self.memory:
+            return self.memory[url]
+        offset, length = self.spilled[url]
+        self.segment.seek(offset)
+        return zlib.decompress(self.segment.read(length))
+
+    def urls(self):
+        """All stored URLs, sorted."""
+        return sorted(list(self.memory) + list(self.spilled))
+
+    def items(self):
+        """Yields (url, content) in sorted URL order, one spilled page in memory at a time."""
+        for url in self.urls():
+            yield url, self.get(url)
+
+    def close(self):
+        if self.segment is not None:
+            self.segment.close()
+            self.segment = None
+        self.memory.clear()
+        self.spilled.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def spool_pages(pages, directory=None):
+    """Writes the `Page`s of an iterable to a temporary file; returns (path, count).
+
+    The caller deletes the file (after `read_spool`).
+    """
+    fd, path = tempfile.mkstemp(prefix='llmstxt-crawl-', dir=directory)
+    count = 0
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for page in pages:
+                content = zlib.compress(page.content, COMPRESS_LEVEL) if page.content else page.content
+                pickle.dump((page.url, page.status, content, page.error, page.cached), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                count += 1
+    except BaseException:
+        os.remove(path)
+        raise
+    return path, count
+
+
+def read_spool(path):
+    """Yields the `Page`s written by `spool_pages`, in the same order."""
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                url, status, content, error, cached = pickle.load(f)
+            except EOFError:
+                return
+            yield Page(url, status, zlib.decompress(content) if content else content, error, cached)
@@ -0,0 +1,73 @@
+"""Declarative description of one documentation site.
+
+A ``SiteProfile`` holds everything that used to differ between the
+copy-pasted ``convert_*.py`` crawlers: how pages are discovered, which URLs
+are kept, where the content lives on each page, what noise to strip and how
+to render it. The engine in ``llmstxt.engine`` does the rest, so every
+fetching or conversion improvement applies to every site at once.
+"""
+from urllib.parse import urlparse
+
+from llmstxt.fetch import DEFAULT_CONCURRENCY, DEFAULT_RATE
+from llmstxt.markdown import MarkdownConverter
+
+DEFAULT_NOISE = "nav, footer, script, style, button"
+DEFAULT_SEPARATOR = "-" * 80
+
+
+class SiteProfile:
+    """One site: discovery strategy, URL filters, content selectors and converter.
+
+    URL filters (all optional):
+
+    * `base_url`: only URLs on this origin (and below this path) are kept.
+    * `include_prefixes`: the URL or its path must start with one of these.
+    * `include_patterns`: the URL must contain one of these substrings.
+    * `exclude_patterns`: the URL must contain none of these substrings.
+
+    `content_selectors` are tried in order on each page; `noise` is a CSS
+    selector for elements removed from the content before conversion.
+
+    `concurrency` is the initial number of in-flight requests; the fetch
+    scheduler raises it up to `max_concurrency` (default 4x) while the host
+    keeps up and backs off when it throttles. `rate` caps requests per second.
+    """
+
+    def __init__(self, name, title, output_file, discovery, converter=None,
+                 base_url=None, include_prefixes=(), include_patterns=(), exclude_patterns=(),
+                 content_selectors=("article", "main"), noise=DEFAULT_NOISE,
+                 separator=DEFAULT_SEPARATOR, headers=None,
+                 rate=DEFAULT_RATE, concurrency=DEFAULT_CONCURRENCY, max_concurrency=None):
+        self.name = name
+        self.title = title
+        self.output_file = output_file
+        self.discovery = discovery
+        self.converter = converter or MarkdownConverter(headings={'h2': 2, 'h3': 3})
+        self.base_url = base_url
+        self.include_prefixes = tuple(include_prefixes)
+        self.include_patterns = tuple(include_patterns)
+        self.exclude_patterns = tuple(exclude_patterns)
+        self.content_selectors = tuple(content_selectors)
+        self.noise = noise
+        self.separator = separator
+        self.headers = headers
+        self.rate = rate
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+
+    def accepts(self, url):
+        """True if `url` passes the profile's URL filters."""
+        if self.base_url and not url.startswith(self.base_url):
+            return False
+        if self.include_prefixes:
+            path = urlparse(url).path
+            if not any(url.startswith(p) or path.startswith(p) for p in self.include_prefixes):
+                return False
+        if self.include_patterns and not any(p in url for p in self.include_patterns):
+            return False
+        if any(p in url for p in self.exclude_patterns):
+            return False
+        return True
+
+    def __repr__(self):
+        return f"SiteProfile({self.name!r}, output_file={self.output_file!r})"
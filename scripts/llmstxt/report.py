@@ -0,0 +1,125 @@
+"""Per-section token report for an llms output file.
+
+Every conversion writes ``<output>.tokens.json`` next to its output, and
+``python scripts/llms.py tokens llms/`` (re)writes it for existing files::
+
+    {
+      "file": "effect-llms-full.txt", "bytes": 1608146, "tokens": 402037,
+      "tokenizer": "cl100k_base",
+      "pages": [{"source": "https://...", "title": "...", "offset": 0, "length": 5123, "tokens": 1270}, ...],
+      "sections": [{"page": 0, "offset": 0, "length": 812, "tokens": 203, "headings": [...]}, ...],
+      "heaviest": [17, 4, ...]
+    }
+
+Pages are found the way ``llmstxt.chunk`` finds them; a section is a page's
+run of text up to the next ``#`` or ``##`` heading (an endpoint, in the
+OpenAPI outputs). Section texts are handed to the tokenizer in batches of
+``BATCH_SIZE`` as the file is scanned, and page and file totals are the sums
+of their sections. ``heaviest`` lists the indexes of the largest sections,
+largest first; the printed summary names them.
+"""
+import json
+import os
+import time
+
+from llmstxt.chunk import input_files, scan_blocks
+from llmstxt.tokens import default_tokenizer, get_tokenizer
+from llmstxt.util import atomic_write
+
+REPORT_SUFFIX = '.tokens.json'
+BATCH_SIZE = 512
+SECTION_LEVEL = 2       # headings of this level or above start a section
+TOP_SECTIONS = 10
+
+
+def _sections(data):
+    """Yields (page index, start, end, source, heading path) for each section of `data`."""
+    page = -1
+    current = None
+    for block in scan_blocks(data):
+        if block.page or page < 0:
+            page += 1
+        elif not (0 < block.level <= SECTION_LEVEL):
+            current[2] = block.end
+            continue
+        if current:
+            yield tuple(current)
+        current = [page, block.start, block.end, block.source, block.path]
+    if current:
+        yield tuple(current)
+
+
+def _counted(data, tokenizer):
+    """Yields (section, tokens), counting the sections a batch at a time."""
+    batch = []
+    for section in _sections(data):
+        batch.append(section)
+        if len(batch) == BATCH_SIZE:
+            yield from _count(data, batch, tokenizer)
+            batch = []
+    yield from _count(data, batch, tokenizer)
+
+
+def _count(data, batch, tokenizer):
+    if not batch:
+        return []
+    return zip(batch, tokenizer.count_batch([data[start:end].decode('utf-8', 'replace')
+                                             for _, start, end, _, _ in batch]))
+
+
+def token_report(path, tokenizer=None, top=TOP_SECTIONS):
+    """The report for the output file at `path` (see the module docstring)."""
+    tokenizer = tokenizer or default_tokenizer()
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    pages, sections = [], []
+    for (page, start, end, source, headings), tokens in _counted(data, tokenizer):
+        if page == len(pages):
+            pages.append({'source': source, 'title': headings[0] if headings else None,
+                          'offset': start, 'length': 0, 'tokens': 0})
+        pages[page]['length'] = end - pages[page]['offset']
+        pages[page]['tokens'] += tokens
+        sections.append({'page': page, 'offset': start, 'length': end - start, 'tokens': tokens,
+                         'headings': list(headings)})
+
+    heaviest = sorted(range(len(sections)), key=lambda i: -sections[i]['tokens'])[:top]
+    return {
+        'file': os.path.basename(path),
+        'bytes': len(data),
+        'tokens': sum(section['tokens'] for section in sections),
+        'tokenizer': tokenizer.name,
+        'pages': pages,
+        'sections': sections,
+        'heaviest': heaviest,
+    }
+
+
+def format_summary(report, top=5):
+    lines = [f"{report['file']}: {report['tokens']:,} tokens ({report['tokenizer']}) "
+             f"in {len(report['pages'])} pages, {len(report['sections'])} sections"]
+    total = report['tokens'] or 1
+    for i in report['heaviest'][:top]:
+        section = report['sections'][i]
+        where = report['pages'][section['page']]['source'] or f"offset {section['offset']}"
+        lines.append(f"  {section['tokens']:>8,} tokens ({section['tokens'] / total:>4.0%})  "
+                     f"{where} :: {' > '.join(section['headings'])}")
+    return "\n".join(lines)
+
+
+def write_report(path, tokenizer=None, top=TOP_SECTIONS):
+    """Writes `<path>.tokens.json`, prints the summary and returns the report."""
+    report = token_report(path, tokenizer, top)
+    atomic_write(path + REPORT_SUFFIX, json.dumps(report, indent=1, ensure_ascii=False).encode('utf-8'))
+    print(format_summary(report))
+    return report
+
+
+def report_paths(paths, tokenizer_spec=None, top=TOP_SECTIONS):
+    """Writes the report of every output file under `paths`."""
+    tokenizer = get_tokenizer(tokenizer_spec) if tokenizer_spec else None
+    start = time.perf_counter()
+    reports = [write_report(path, tokenizer, top) for path in input_files(paths)]
+    print(f"\n{sum(r['tokens'] for r in reports):,} tokens in {len(reports)} files "
+          f"({time.perf_counter() - start:.1f}s)")
+    return reports
@@ -0,0 +1,237 @@
+"""BM25 full-text index over the sections of the llms output files.
+
+Build it once after the outputs change, then query it::
+
+    python scripts/llms.py index llms/                    # writes llms/search.idx
+    python scripts/llms.py search "useEffect cleanup" -k 5
+
+Sections are the shards ``llmstxt.chunk`` would produce with a small budget
+(``SECTION_TOKENS``): a page, or a heading-delimited part of one, each keyed
+by its page ``Source:`` URL, heading path, file and byte range. Heading
+words count twice.
+
+``search.idx`` is a single binary file laid out as flat arrays so it can be
+memory-mapped and queried without loading it:
+
+* a JSON header (files, counts, section offsets, average section length);
+* the sorted term dictionary (term bytes + offsets), searched by bisection;
+* per term, a run of (section id, term frequency) postings;
+* per section, its length, file and a small JSON metadata record.
+
+A query only touches the dictionary pages it bisects, the postings of its
+own terms and the metadata of the hits, and reads the hit text straight from
+the original output files by offset.
+"""
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from collections import Counter, namedtuple
+
+from llmstxt.chunk import input_files, split_shards
+
+INDEX_NAME = 'search.idx'
+MAGIC = b'LLMSIDX2'
+SECTION_TOKENS = 600
+K1 = 1.2
+B = 0.75
+MAX_TF = 0xFFFF
+
+WORD = re.compile(r'[a-z0-9][a-z0-9_]*')
+STOPWORDS = frozenset(
+    'a an and are as at be but by can do does for from has have how if in into is it its '
+    'of on or so such that the their then there these this to was were will with you your'.split()
+)
+
+# Array sections of the index file: (name, array typecode)
+ARRAYS = (
+    ('doc_len', 'I'),       # tokens per section
+    ('doc_file', 'H'),      # index into the header's file list
+    ('meta_off', 'Q'),      # section i's metadata is meta[meta_off[i]:meta_off[i + 1]]
+    ('term_off', 'I'),      # term i is terms[term_off[i]:term_off[i + 1]]
+    ('post_off', 'I'),      # term i's postings are post_doc/post_tf[post_off[i]:post_off[i + 1]]
+    ('post_doc', 'I'),
+    ('post_tf', 'H'),
+)
+
+Hit = namedtuple('Hit', 'id score file source headings offset length')
+
+
+def tokenize(text):
+    return [word for word in WORD.findall(text.lower()) if len(word) > 1 and word not in STOPWORDS]
+
+
+def build_index(paths, index_path=None, section_tokens=SECTION_TOKENS):
+    """Indexes the output files under `paths`; returns the index path."""
+    files = input_files(paths)
+    if index_path is None:
+        index_path = os.path.join(paths[0] if os.path.isdir(paths[0]) else os.path.dirname(paths[0]), INDEX_NAME)
+    index_dir = os.path.dirname(os.path.abspath(index_path))
+    start = time.perf_counter()
+
+    postings = {}       # term -> [(section id, tf)]
+    doc_len = array('I')
+    doc_file = array('H')
+    metas = []
+    file_records = []
+    for file_id, path in enumerate(files):
+        with open(path, 'rb') as f:
+            data = f.read()
+        file_records.append({'path': os.path.relpath(os.path.abspath(path), index_dir), 'size': len(data)})
+        for shard in split_shards(data, section_tokens):
+            words = tokenize(data[shard.start:shard.end].decode('utf-8', 'replace'))
+            words += tokenize(' '.join(shard.path)) * 2
+            doc_id = len(doc_len)
+            doc_len.append(len(words))
+            doc_file.append(file_id)
+            for term, tf in Counter(words).items():
+                postings.setdefault(term, []).append((doc_id, min(tf, MAX_TF)))
+            metas.append(json.dumps({'f': file_id, 'o': shard.start, 'n': shard.end - shard.start,
+                                     's': shard.source, 'h': list(shard.path)}).encode('utf-8'))
+
+    encoded = sorted((term.encode('utf-8'), term) for term in postings)
+    arrays = {name: array(code) for name, code in ARRAYS}
+    arrays['doc_len'] = doc_len
+    arrays['doc_file'] = doc_file
+    meta = b''.join(metas)
+    offset = 0
+    for blob in metas:
+        arrays['meta_off'].append(offset)
+        offset += len(blob)
+    arrays['meta_off'].append(offset)
+    terms = bytearray()
+    for raw, term in encoded:
+        arrays['term_off'].append(len(terms))
+        arrays['post_off'].append(len(arrays['post_doc']))
+        terms += raw
+        for doc_id, tf in postings[term]:
+            arrays['post_doc'].append(doc_id)
+            arrays['post_tf'].append(tf)
+    arrays['term_off'].append(len(terms))
+    arrays['post_off'].append(len(arrays['post_doc']))
+
+    _write(index_path, files=file_records, arrays=arrays, blobs={'terms': bytes(terms), 'meta': meta},
+           avgdl=sum(doc_len) / max(len(doc_len), 1))
+    print(f"Indexed {len(doc_len)} sections from {len(files)} files ({len(encoded):,} terms) "
+          f"in {time.perf_counter() - start:.1f}s -> {index_path}")
+    return index_path
+
+
+def _write(index_path, files, arrays, blobs, avgdl):
+    # Every section is 8-byte aligned so it can be cast in place from the mmap
+    sections, body = {}, bytearray()
+    for name, data in [(name, arrays[name].tobytes()) for name, _ in ARRAYS] + list(blobs.items()):
+        body += b'\0' * (-len(body) % 8)
+        sections[name] = (len(body), len(data))
+        body += data
+    header = json.dumps({'files': files, 'sections': sections, 'docs': len(arrays['doc_len']),
+                         'terms': len(arrays['term_off']) - 1, 'avgdl': avgdl}).encode('utf-8')
+    prefix_len = len(MAGIC) + 4 + len(header)
+    pad = -prefix_len % 8
+    tmp = index_path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header) + pad) + header + b' ' * pad)
+        f.write(body)
+    os.replace(tmp, index_path)
+
+
+class SearchIndex:
+    """Read-only, memory-mapped view of a ``search.idx`` file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.dir = os.path.dirname(os.path.abspath(path))
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.mm[:len(MAGIC)] != MAGIC:
+            self.mm.close()
+            raise ValueError(f"{path} is not a search index (rebuild it with 'llms.py index')")
+        (header_len,) = struct.unpack_from('<I', self.mm, len(MAGIC))
+        base = len(MAGIC) + 4
+        self.header = json.loads(self.mm[base:base + header_len])
+        base += header_len
+        self.files = self.header['files']
+        self.docs = self.header['docs']
+        self.avgdl = self.header['avgdl'] or 1.0
+
+        self._views = []
+        view = memoryview(self.mm)
+        self._views.append(view)
+        for name, code in ARRAYS:
+            offset, length = self.header['sections'][name]
+            arr = view[base + offset:base + offset + length].cast(code)
+            self._views.append(arr)
+            setattr(self, name, arr)
+        for name in ('terms', 'meta'):
+            offset, length = self.header['sections'][name]
+            blob = view[base + offset:base + offset + length]
+            self._views.append(blob)
+            setattr(self, name, blob)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _term(self, i):
+        return bytes(self.terms[self.term_off[i]:self.term_off[i + 1]])
+
+    def term_id(self, term):
+        """Bisects the sorted dictionary; None if `term` isn't indexed."""
+        key = term.encode('utf-8')
+        lo, hi = 0, len(self.term_off) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.term_off) - 1 and self._term(lo) == key:
+            return lo
+        return None
+
+    def search(self, query, k=10, files=None):
+        """Top `k` sections for `query` by BM25, best first; `files` limits it to those file ids."""
+        scores = {}
+        doc_file = self.doc_file
+        for term in dict.fromkeys(tokenize(query)):
+            i = self.term_id(term)
+            if i is None:
+                continue
+            start, end = self.post_off[i], self.post_off[i + 1]
+            idf = math.log(1 + (self.docs - (end - start) + 0.5) / (end - start + 0.5))
+            # tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avgdl)), with the constants hoisted
+            norm = K1 * (1 - B)
+            scale = K1 * B / self.avgdl
+            doc_len = self.doc_len
+            for doc, tf in zip(self.post_doc[start:end], self.post_tf[start:end]):
+                if files is not None and doc_file[doc] not in files:
+                    continue
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / (tf + norm + scale * doc_len[doc])
+        return [self.hit(doc, score) for doc, score in heapq.nlargest(k, scores.items(), key=lambda item: item[1])]
+
+    def hit(self, doc, score=0.0):
+        meta = json.loads(bytes(self.meta[self.meta_off[doc]:self.meta_off[doc + 1]]))
+        return Hit(doc, score, self.files[meta['f']]['path'], meta['s'], meta['h'], meta['o'], meta['n'])
+
+    def text(self, hit):
+        """The section's text, read from its output file."""
+        record = next(f for f in self.files if f['path'] == hit.file)
+        path = os.path.join(self.dir, hit.file)
+        if os.path.getsize(path) != record['size']:
+            raise ValueError(f"{path} changed since it was indexed; rebuild with 'llms.py index'")
+        with open(path, 'rb') as f:
+            f.seek(hit.offset)
+            return f.read(hit.length).decode('utf-8', 'replace')
@@ -0,0 +1,273 @@
+"""Local doc-search server over the llms outputs, speaking MCP tools.
+
+Build the index first (``python scripts/llms.py index llms/``), then::
+
+    python scripts/llms.py serve                      # MCP over stdio
+    python scripts/llms.py serve --http 8765          # JSON-RPC on POST /mcp, plus
+                                                      # GET /search?q=..&library=.. and /section/<id>
+
+Tools:
+
+* ``list_libraries()`` — the indexed output files (library = file name
+  without ``.txt``);
+* ``search(query, library=None, k=5)`` — BM25 top-k sections, optionally
+  restricted to the libraries whose name contains ``library``;
+* ``get_section(id)`` — the full text of a section returned by ``search``.
+
+Nothing is parsed per request: the index is memory-mapped
+(``llmstxt.search``), and section text is sliced out of the memory-mapped
+output files by byte offset. Output files are mapped on first use, so
+memory stays flat however many libraries the index covers (mapped pages
+belong to the page cache, not the process heap). Requests are served by one
+asyncio loop; each search takes milliseconds, so they are answered inline.
+"""
+import asyncio
+import inspect
+import json
+import mmap
+import os
+import sys
+from urllib.parse import parse_qs, urlparse
+
+from llmstxt.search import SearchIndex
+
+PROTOCOL_VERSION = '2024-11-05'
+SERVER_INFO = {'name': 'llmstxt-docs', 'version': '1.0'}
+SNIPPET_CHARS = 300
+MAX_K = 50
+
+TOOLS = [
+    {
+        'name': 'list_libraries',
+        'description': 'List the documentation libraries that can be searched.',
+        'inputSchema': {'type': 'object', 'properties': {}},
+    },
+    {
+        'name': 'search',
+        'description': 'Full-text search of the documentation. Returns the best matching sections '
+                       'with their source URL, heading path and a snippet; fetch one with get_section.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'query': {'type': 'string'},
+                'library': {'type': 'string', 'description': 'library name or part of it, e.g. "supabase"'},
+                'k': {'type': 'integer', 'description': f'number of results (default 5, max {MAX_K})'},
+            },
+            'required': ['query'],
+        },
+    },
+    {
+        'name': 'get_section',
+        'description': 'Full text of a section, by the id returned from search.',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {'id': {'type': 'integer'}},
+            'required': ['id'],
+        },
+    },
+]
+
+
+class ToolError(Exception):
+    pass
+
+
+class DocServer:
+    """The tools, independent of the transport."""
+
+    def __init__(self, index_path):
+        self.index = SearchIndex(index_path)
+        self.libraries = {os.path.splitext(os.path.basename(f['path']))[0]: i
+                          for i, f in enumerate(self.index.files)}
+        self._maps = {}     # file id -> mmap of the output file
+
+    def close(self):
+        for mm in self._maps.values():
+            mm.close()
+        self.index.close()
+
+    def _file_ids(self, library):
+        if not library:
+            return None
+        needle = library.lower()
+        ids = {i for name, i in self.libraries.items() if needle in name.lower()}
+        if not ids:
+            raise ToolError(f"No library matches {library!r}; known: {', '.join(sorted(self.libraries))}")
+        return ids
+
+    def _text(self, hit):
+        file_id = next(i for i, f in enumerate(self.index.files) if f['path'] == hit.file)
+        mm = self._maps.get(file_id)
+        if mm is None:
+            path = os.path.join(self.index.dir, hit.file)
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(mm) != self.index.files[file_id]['size']:
+                mm.close()
+                raise ToolError(f"{path} changed since it was indexed; rebuild with 'llms.py index'")
+            self._maps[file_id] = mm
+        return mm[hit.offset:hit.offset + hit.length].decode('utf-8', 'replace')
+
+    def _library(self, hit):
+        return os.path.splitext(os.path.basename(hit.file))[0]
+
+    # --- tools ---
+
+    def list_libraries(self):
+        return [{'library': name, 'bytes': self.index.files[i]['size']} for name, i in sorted(self.libraries.items())]
+
+    def search(self, query, library=None, k=5):
+        k = max(1, min(int(k or 5), MAX_K))
+        results = []
+        for hit in self.index.search(query, k=k, files=self._file_ids(library)):
+            snippet = " ".join(self._text(hit)[:SNIPPET_CHARS * 2].split())[:SNIPPET_CHARS]
+            results.append({'id': hit.id, 'score': round(hit.score, 3), 'library': self._library(hit),
+                            'source': hit.source, 'headings': hit.headings, 'snippet': snippet})
+        return results
+
+    def get_section(self, id):
+        id = int(id)
+        if not 0 <= id < self.index.docs:
+            raise ToolError(f"No section {id}")
+        hit = self.index.hit(id)
+        return {'id': id, 'library': self._library(hit), 'source': hit.source,
+                'headings': hit.headings, 'text': self._text(hit)}
+
+    def call(self, name, arguments):
+        if name not in ('list_libraries', 'search', 'get_section'):
+            raise ToolError(f"Unknown tool {name!r}")
+        tool = getattr(self, name)
+        arguments = arguments or {}
+        if not isinstance(arguments, dict):
+            raise ToolError(f"Bad arguments for {name}: expected an object")
+        # Only a mismatch with the tool's signature is the caller's fault; errors inside the tool are not
+        try:
+            bound = inspect.signature(tool).bind(**arguments)
+        except TypeError as e:
+            raise ToolError(f"Bad arguments for {name}: {e}")
+        return tool(*bound.args, **bound.kwargs)
+
+    # --- JSON-RPC (MCP) ---
+
+    def handle(self, message):
+        """Response to one JSON-RPC message, or None for notifications."""
+        method = message.get('method')
+        msg_id = message.get('id')
+        if msg_id is None:
+            return None
+        try:
+            if method == 'initialize':
+                result = {'protocolVersion': PROTOCOL_VERSION, 'serverInfo': SERVER_INFO,
+                          'capabilities': {'tools': {}}}
+            elif method == 'ping':
+                result = {}
+            elif method == 'tools/list':
+                result = {'tools': TOOLS}
+            elif method == 'tools/call':
+                params = message.get('params') or {}
+                try:
+                    value = self.call(params.get('name'), params.get('arguments'))
+                    result = {'content': [{'type': 'text', 'text': json.dumps(value, ensure_ascii=False)}]}
+                except ToolError as e:
+                    result = {'content': [{'type': 'text', 'text': str(e)}], 'isError': True}
+            else:
+                return {'jsonrpc': '2.0', 'id': msg_id,
+                        'error': {'code': -32601, 'message': f"Method not found: {method}"}}
+        except Exception as e:
+            return {'jsonrpc': '2.0', 'id': msg_id, 'error': {'code': -32603, 'message': str(e)}}
+        return {'jsonrpc': '2.0', 'id': msg_id, 'result': result}
+
+    def handle_raw(self, data):
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32700, 'message': 'Parse error'}}
+        if isinstance(message, list):
+            return [r for r in (self.handle(m) for m in message) if r is not None] or None
+        return self.handle(message)
+
+
+# --- transports ---
+
+async def serve_stdio(server):
+    """Newline-delimited JSON-RPC on stdin/stdout (the MCP stdio transport)."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        if not line.strip():
+            continue
+        response = server.handle_raw(line)
+        if response is not None:
+            sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+
+async def _http_connection(server, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0) or 0))
+
+            status, payload = _route(server, method, target, body)
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b''
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(data)}\r\n\r\n".encode('latin-1') + data)
+            await writer.drain()
+            if headers.get('connection', '').lower() == 'close':
+                break
+    except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+def _route(server, method, target, body):
+    url = urlparse(target)
+    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    try:
+        if method == 'POST' and url.path in ('/', '/mcp'):
+            response = server.handle_raw(body)
+            return ('200 OK', response) if response is not None else ('202 Accepted', None)
+        if method == 'GET' and url.path == '/libraries':
+            return '200 OK', server.list_libraries()
+        if method == 'GET' and url.path == '/search':
+            return '200 OK', server.search(query.get('q', ''), query.get('library'), query.get('k', 5))
+        if method == 'GET' and url.path.startswith('/section/'):
+            return '200 OK', server.get_section(url.path.rsplit('/', 1)[-1])
+    except (ToolError, ValueError) as e:
+        return '400 Bad Request', {'error': str(e)}
+    return '404 Not Found', {'error': f"No route for {method} {url.path}"}
+
+
+async def serve_http(server, host='127.0.0.1', port=8765):
+    http = await asyncio.start_server(lambda r, w: _http_connection(server, r, w), host, port)
+    print(f"Doc search server on http://{host}:{port} ({len(server.libraries)} libraries)", file=sys.stderr)
+    async with http:
+        await http.serve_forever()
+
+
+def serve(index_path, http_port=None, host='127.0.0.1'):
+    server = DocServer(index_path)
+    try:
+        if http_port:
+            asyncio.run(serve_http(server, host, http_port))
+        else:
+            asyncio.run(serve_stdio(server))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
@@ -0,0 +1,257 @@
+"""Registry of the documentation sites we build llms files for.
+
+Adding a site is a matter of registering a ``SiteProfile``::
+
+    register(SiteProfile(
+        name="example",
+        title="Example Docs",
+        output_file="example_llms.txt",
+        discovery=Sitemap("https://example.com/sitemap.xml"),
+        include_prefixes=["/docs/"],
+    ))
+
+Docusaurus sites (React Native and most other OSS docs) only need the
+``docusaurus()`` shortcut.
+"""
+from llmstxt.discovery import DeepCrawl, SidebarLinks, Sitemap, TocJson
+from llmstxt.markdown import MarkdownConverter
+from llmstxt.profiles import DEFAULT_NOISE, SiteProfile
+
+PROFILES = {}
+
+
+def register(profile):
+    PROFILES[profile.name] = profile
+    return profile
+
+
+def get_profile(name):
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise KeyError(f"Unknown site '{name}'. Known sites: {', '.join(sorted(PROFILES))}") from None
+
+
+# --- Callout detectors ---
+
+def admonition_callout(name, attrs):
+    """Docusaurus admonitions: <div class="theme-admonition theme-admonition-tip ...">."""
+    if name != 'div':
+        return None
+    for cls in attrs.get('class', []):
+        for prefix in ('theme-admonition-', 'admonition-'):
+            if cls.startswith(prefix) and cls[len(prefix):].isalpha():
+                return cls[len(prefix):]
+    return None
+
+
+def admonition_title(name, attrs):
+    # The heading div ("admonitionHeading_xyz") holds the icon and the label text
+    return any(cls.startswith('admonitionHeading') or cls == 'admonition-heading'
+               for cls in attrs.get('class', [])) or None
+
+
+def note_callout(name, attrs):
+    """React docs "Note"/"Pitfall" callouts are divs with 'note' somewhere in their classes."""
+    if name == 'div' and 'note' in str(attrs.get('class', '')).lower():
+        return "NOTE"
+    return None
+
+
+def aside_callout(name, attrs):
+    """"Recap" and "Deep Dive" boxes are <aside> elements; render them as plain quotes."""
+    if name == 'aside':
+        return ""
+    return None
+
+
+def custom_block(name, attrs):
+    """VuePress Tip/Warning/Danger custom blocks."""
+    classes = attrs.get('class', [])
+    if name != 'div' or 'custom-block' not in classes:
+        return None
+    block_type = "NOTE"
+    if 'tip' in classes: block_type = "TIP"
+    elif 'warning' in classes: block_type = "WARNING"
+    elif 'danger' in classes: block_type = "DANGER"
+    return block_type
+
+
+def custom_block_title(name, attrs):
+    # <p class="custom-block-title">TIP</p> becomes the label rather than quoted text
+    return 'custom-block-title' in attrs.get('class', []) or None
+
+
+def alert_callout(name, attrs):
+    """MS Learn alerts: <div class="alert is-info"><p class="alert-title">Note</p>...</div>"""
+    if name == 'div' and 'alert' in attrs.get('class', []):
+        return "NOTE"
+    return None
+
+
+def alert_title(name, attrs):
+    # The title text becomes the label instead of being repeated in the quote
+    return 'alert-title' in attrs.get('class', []) or None
+
+
+# --- Shortcuts ---
+
+def docusaurus(name, sitemap_url, output_file, title, include_prefixes=("/docs/",), exclude_patterns=(),
+               code_lang='', **kwargs):
+    """Profile for a Docusaurus site: sitemap discovery, <article> content, admonitions as callouts."""
+    kwargs.setdefault('converter', MarkdownConverter(headings={'h2': 2, 'h3': 3}, code_lang=code_lang,
+                                                     callout=admonition_callout, callout_title=admonition_title))
+    kwargs.setdefault('content_selectors', ("article", ".theme-doc-markdown", "main"))
+    kwargs.setdefault('noise', DEFAULT_NOISE + ", .hash-link, .theme-doc-toc-mobile, .pagination-nav")
+    return SiteProfile(
+        name=name,
+        title=title,
+        output_file=output_file,
+        discovery=Sitemap(sitemap_url),
+        include_prefixes=include_prefixes,
+        exclude_patterns=("/docs/next/", "/blog/", "/tags/") + tuple(exclude_patterns),
+        **kwargs,
+    )
+
+
+# --- Sites ---
+
+register(SiteProfile(
+    name="docs",
+    title="Documentation Dump",
+    output_file="llms-full.txt",
+    discovery=Sitemap("https://supabase.com/docs/sitemap.xml"),
+    # Generic template: point it at any sitemap and adjust the selector
+    content_selectors=("main", "body"),
+    noise="script, style, nav, footer",
+    separator="\n" + "-" * 80 + "\n",
+    rate=2,
+))
+
+register(SiteProfile(
+    name="lit",
+    title="Lit Documentation",
+    output_file="lit_full.txt",
+    # Lit.dev's drawer class names change often, so every /docs/ link on the start page is used
+    discovery=SidebarLinks("https://lit.dev/docs/"),
+    base_url="https://lit.dev",
+    include_prefixes=["/docs/"],
+    exclude_patterns=[
+        "/v1/",           # Legacy docs
+        "/playground/",   # Interactive tools
+        "/api/",          # API reference (optional: keep if you want raw class references)
+    ],
+    content_selectors=("article", "main"),
+    noise="nav, footer, script, style, .toc, .edit-page-link",
+    # Header permalinks ('#') are dropped by the converter; code language comes from 'language-*'
+    converter=MarkdownConverter(headings={'h2': 2, 'h3': 2}),
+    rate=5,
+))
+
+register(SiteProfile(
+    name="react-reference",
+    title="React API Reference",
+    output_file="react_api_reference_llms.txt",
+    discovery=SidebarLinks("https://react.dev/reference/react"),
+    base_url="https://react.dev",
+    include_prefixes=["/reference/"],
+    converter=MarkdownConverter(headings={'h2': 2, 'h3': 3, 'h4': 4}, code_lang="jsx", callout=note_callout),
+    rate=4,
+))
+
+register(SiteProfile(
+    name="react-learn",
+    title="React Learning Curriculum",
+    output_file="react_learn_llms.txt",
+    # Keep the sidebar order: it is the curriculum order
+    discovery=SidebarLinks("https://react.dev/learn", selectors=["nav[aria-label='Sidebar']", "aside nav"],
+                           sort=False),
+    base_url="https://react.dev",
+    include_prefixes=["/learn"],
+    converter=MarkdownConverter(headings={'h2': 2, 'h3': 3, 'h4': 4}, code_lang="jsx", callout=aside_callout),
+    rate=5,
+))
+
+register(docusaurus(
+    name="react-native",
+    title="React Native Documentation",
+    sitemap_url="https://reactnative.dev/sitemap.xml",
+    output_file="react_native_llms.txt",
+    include_prefixes=["https://reactnative.dev/docs/", "https://reactnative.dev/architecture/"],
+    exclude_patterns=[
+        "/docs/0.",       # Exclude old versions (e.g., /docs/0.70/)
+        "/showcase",      # Exclude showcase
+    ],
+    separator="=" * 80,
+    rate=5,
+))
+
+register(SiteProfile(
+    name="supabase",
+    title="Supabase JavaScript Reference & Guides",
+    output_file="supabase_js_context.txt",
+    discovery=Sitemap("https://supabase.com/docs/sitemap.xml"),
+    include_patterns=[
+        "/docs/reference/javascript",  # JS Client Library
+        "/docs/guides/auth",           # Auth Guides (highly relevant to JS)
+        "/docs/guides/database",       # DB Guides
+        "/docs/guides/functions",      # Edge Functions
+        "/docs/guides/realtime",       # Realtime
+        "/docs/guides/storage",        # Storage
+    ],
+    exclude_patterns=[
+        "/docs/reference/javascript/v0",  # Exclude old versions
+        "/docs/reference/javascript/v1",  # Exclude old versions
+        "mobile", "flutter", "kotlin",    # Exclude non-JS platforms
+    ],
+    # Sections are flattened to ### under the page title; unlabeled code is JS
+    converter=MarkdownConverter(headings={'h2': 3, 'h3': 3, 'h4': 3}, code_lang="javascript"),
+    separator="=" * 80,
+    rate=5,
+))
+
+register(SiteProfile(
+    name="typescript",
+    title="TypeScript Documentation",
+    output_file="typescript_full.txt",
+    discovery=SidebarLinks("https://www.typescriptlang.org/docs/handbook/intro.html",
+                           selectors=["nav[aria-label='Sidebar']", "nav.toc", "#sidebar"]),
+    base_url="https://www.typescriptlang.org",
+    include_patterns=["/docs/"],
+    exclude_patterns=["/ja/", "/es/"],
+    content_selectors=("#handbook-content", "article", "main", ".container"),
+    noise="nav, footer, script, style, .on-page-nav",
+    converter=MarkdownConverter(headings={'h2': 2, 'h3': 2}),
+    rate=10,
+))
+
+register(SiteProfile(
+    name="chartjs",
+    title="Chart.js Documentation",
+    output_file="chartjs_full_llms.txt",
+    # The VuePress sidebar only renders the links of the current section
+    discovery=DeepCrawl("https://www.chartjs.org/docs/latest/"),
+    base_url="https://www.chartjs.org",
+    include_prefixes=["/docs/latest/"],
+    content_selectors=(".theme-default-content", "main.page", "main"),
+    noise=".table-of-contents, .page-edit, .page-nav, a.header-anchor",
+    # VuePress puts the 'language-*' class on the div wrapping each pre
+    converter=MarkdownConverter(headings={'h2': 2, 'h3': 3, 'h4': 4}, code_lang="javascript",
+                                callout=custom_block, callout_title=custom_block_title),
+    rate=6,
+))
+
+register(SiteProfile(
+    name="ms-agent-framework",
+    title="Microsoft Agent Framework Docs",
+    output_file="ms_agent_framework_llms.txt",
+    discovery=TocJson("https://learn.microsoft.com/en-us/agent-framework/toc.json",
+                      base_url="https://learn.microsoft.com/en-us/agent-framework/"),
+    content_selectors=("main", "#main-column"),
+    noise=".metadata, .page-metadata, .feedback-section, #action-panel, .page-actions, nav, footer, script, style",
+    # Code language comes from the 'lang-*' class on <code>
+    converter=MarkdownConverter(headings={'h2': 2, 'h3': 3}, callout=alert_callout, callout_title=alert_title),
+    # MS Learn sometimes 403s python user-agents, so we fake it
+    headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'},
+    rate=3,
+))
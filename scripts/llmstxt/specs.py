@@ -0,0 +1,175 @@
+"""Find an OpenAPI/Swagger spec over plain HTTP, without a browser.
+
+Swagger UI pages only render a spec they download from somewhere, so in most
+deployments that spec can be fetched directly. ``discover_spec`` tries, in
+order:
+
+1. the URL itself (it may already be the JSON/YAML spec);
+2. the Swagger UI configuration: ``url:``/``urls:`` in inline scripts and in
+   ``swagger-initializer.js``/``swagger-ui-init.js``, including the
+   ``swaggerDoc`` object that swagger-ui-express embeds in its init script;
+3. the standard spec locations next to the page and at the site root.
+
+Only if all of that fails does a caller need to start a headless browser.
+A host that refuses the connection or times out is not probed any further.
+"""
+import json
+import re
+from urllib.parse import urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from llmstxt.client import get_client, httpx
+from llmstxt.fetch import DEFAULT_HEADERS
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+PROBE_TIMEOUT = 5   # seconds; a missing spec location should fail fast
+
+# Relative to the Swagger UI page, then to the site root
+SPEC_PATHS = (
+    "openapi.json",
+    "swagger.json",
+    "api-docs.json",
+    "swagger-ui-init.js",
+    "swagger-initializer.js",
+    "v3/api-docs",
+    "v2/api-docs",
+    "openapi.yaml",
+    "swagger.yaml",
+    "/openapi.json",
+    "/swagger.json",
+    "/api-docs",
+    "/v3/api-docs",
+    "/v2/api-docs",
+    "/swagger/v1/swagger.json",
+    "/api/swagger.json",
+    "/openapi.yaml",
+)
+
+CONFIG_SCRIPTS = ("swagger-initializer.js", "swagger-ui-init.js", "swagger-config")
+URL_PATTERN = re.compile(r"""\burl\s*:\s*["']([^"']+)["']""")
+EMBEDDED_SPEC_KEYS = ('"swaggerDoc"', '"spec"', 'spec:')
+
+# The host can't be reached: every other location would fail the same way
+UNREACHABLE = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    UNREACHABLE += (httpx.ConnectError, httpx.TimeoutException)
+
+
+def _get(url):
+    try:
+        resp = get_client().get(url, headers=DEFAULT_HEADERS, timeout=PROBE_TIMEOUT)
+    except UNREACHABLE:
+        raise
+    except Exception:
+        return None
+    return resp if resp.status_code == 200 else None
+
+
+def parse_spec(content):
+    """Returns the spec dict if `content` is a JSON (or YAML) OpenAPI/Swagger document."""
+    text = content.decode('utf-8', 'replace') if isinstance(content, bytes) else content
+    spec = None
+    stripped = text.lstrip()
+    if stripped.startswith('{'):
+        try:
+            spec = json.loads(text)
+        except ValueError:
+            return None
+    elif yaml is not None and re.match(r"(openapi|swagger)\s*:", stripped):
+        try:
+            spec = yaml.safe_load(text)
+        except yaml.YAMLError:
+            return None
+    if isinstance(spec, dict) and ('openapi' in spec or 'swagger' in spec) and 'paths' in spec:
+        return spec
+    return None
+
+
+def _embedded_spec(script):
+    """A spec object literal embedded in a Swagger UI init script (swagger-ui-express)."""
+    decoder = json.JSONDecoder()
+    for key in EMBEDDED_SPEC_KEYS:
+        start = script.find(key)
+        while start != -1:
+            brace = script.find('{', start)
+            if brace != -1:
+                try:
+                    obj, _ = decoder.raw_decode(script, brace)
+                except ValueError:
+                    obj = None
+                if isinstance(obj, dict) and ('openapi' in obj or 'swagger' in obj):
+                    return obj
+            start = script.find(key, start + 1)
+    return None
+
+
+def _config_candidates(page_url, html):
+    """Yields (kind, value): embedded specs and spec URLs found in the Swagger UI config."""
+    soup = BeautifulSoup(html, 'html.parser')
+    scripts = []
+    for tag in soup.find_all('script'):
+        if tag.get('src'):
+            src = urljoin(page_url, tag['src'])
+            if any(name in src for name in CONFIG_SCRIPTS):
+                resp = _get(src)
+                if resp:
+                    scripts.append((src, resp.content.decode('utf-8', 'replace')))
+        elif tag.string:
+            scripts.append((page_url, tag.string))
+
+    for base, script in scripts:
+        spec = _embedded_spec(script)
+        if spec:
+            yield 'spec', (spec, base)
+        for match in URL_PATTERN.finditer(script):
+            yield 'url', urljoin(base, match.group(1))
+
+
+def discover_spec(url):
+    """Returns (spec dict, where it came from) for a Swagger UI or spec URL, or (None, None)."""
+    print(f"Looking for the API spec over HTTP at {url}...")
+    try:
+        return _discover(url)
+    except UNREACHABLE as e:
+        print(f"  {urlparse(url).netloc} is unreachable ({type(e).__name__}); not probing further")
+        return None, None
+
+
+def _discover(url):
+    resp = _get(url)
+    if resp:
+        spec = parse_spec(resp.content)
+        if spec:
+            return spec, url
+
+        for kind, value in _config_candidates(resp.url, resp.content):
+            if kind == 'spec':
+                return value
+            candidate = _get(value)
+            spec = parse_spec(candidate.content) if candidate else None
+            if spec:
+                return spec, value
+
+    page = url if url.endswith('/') else url + '/'
+    root = f"{urlparse(url).scheme}://{urlparse(url).netloc}/"
+    tried = set()
+    for path in SPEC_PATHS:
+        candidate_url = urljoin(root, path.lstrip('/')) if path.startswith('/') else urljoin(page, path)
+        if candidate_url in tried:
+            continue
+        tried.add(candidate_url)
+        candidate = _get(candidate_url)
+        if not candidate:
+            continue
+        spec = parse_spec(candidate.content)
+        if spec is None and candidate_url.endswith('.js'):
+            spec = _embedded_spec(candidate.content.decode('utf-8', 'replace'))
+        if spec:
+            return spec, candidate_url
+    return None, None
@@ -0,0 +1,238 @@
+"""llms.txt index of an output file, with extractive page summaries.
+
+Next to every crawled output the build writes ``<output stem>.llms.txt`` in
+the llmstxt.org format: the library title, a one-line description, then one
+``- [Title](source URL): summary`` line per page, grouped into ``##``
+sections by the first URL path segment the pages don't share. An agent can
+load the index and fetch only the pages it needs. ``python scripts/llms.py
+llmstxt llms/`` writes them for existing outputs.
+
+The index is derived from the output file, so it costs no extra requests.
+Pages are found by their ``Source:`` lines and page headings (see
+``read_pages``). A page's summary is
+one sentence from its prose (code, headings, tables and images are skipped):
+the early sentence with the most distinctive words, scored by TF-IDF over
+the pages of the file with a bias towards the start of the page. Sentences
+that recur on many pages ("Was this page helpful?") are never picked.
+
+The index must fit ``max_tokens``: summaries are cut to the largest word
+count that fits (found by bisection), or left out if fewer than
+``MIN_SUMMARY_WORDS`` would fit.
+"""
+import math
+import os
+import re
+from collections import Counter
+from urllib.parse import urlparse
+
+from llmstxt.chunk import FENCE, HEADING, LLMS_TXT_SUFFIX, PAGE_HEADING, SEPARATOR, SOURCE_LINE, input_files
+from llmstxt.search import tokenize
+from llmstxt.tokens import count_tokens
+from llmstxt.util import atomic_write
+
+DEFAULT_MAX_TOKENS = 8000
+MAX_SUMMARY_WORDS = 40
+MIN_SUMMARY_WORDS = 6    # below this, bare links read better than a cut sentence
+CANDIDATES = 8          # sentences considered per page, from its start
+MIN_WORDS = 4
+POSITION_DECAY = 0.25
+BOILERPLATE_PAGES = 0.2  # sentences on more than this share of the pages are boilerplate
+MAX_GROUPS = 30
+
+LINK = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+EMPHASIS = re.compile(r'\*\*|__|(?<!\w)[*_](?=\S)|(?<=\S)[*_](?!\w)')
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9`"(\[])')
+SKIP_LINE = re.compile(r'\s*(?:\||!\[|<|import\s|export\s|Source:|URL:)')
+
+
+def clean_markdown(text):
+    """Plain text of a line of Markdown: link text only, no emphasis or zero-width characters."""
+    text = LINK.sub(lambda m: m.group(1), text).replace('​', '')
+    return " ".join(EMPHASIS.sub('', text).split())
+
+
+def _sentences(lines):
+    """The first `CANDIDATES` prose sentences of a page."""
+    sentences = []
+    paragraph = []
+    fence = None
+
+    def flush():
+        text = clean_markdown(" ".join(paragraph))
+        paragraph.clear()
+        sentences.extend(s for s in SENTENCE_END.split(text) if len(s.split()) >= MIN_WORDS)
+
+    for line in lines:
+        if fence:
+            if line.lstrip().startswith(fence):
+                fence = None
+            continue
+        if FENCE.match(line):
+            fence = FENCE.match(line).group(1)[:3]
+            flush()
+        elif not line.strip() or HEADING.match(line) or SEPARATOR.match(line) or SOURCE_LINE.match(line):
+            flush()
+        elif not SKIP_LINE.match(line.decode('utf-8', 'replace')):
+            paragraph.append(line.decode('utf-8', 'replace').strip().lstrip('-*> ').strip())
+        if len(sentences) >= CANDIDATES:
+            break
+    flush()
+    return sentences[:CANDIDATES]
+
+
+def read_pages(data):
+    """(file title, file source, [(title, source URL, candidate sentences)]) of an output file.
+
+    A page starts at a heading followed by a ``Source: <url>`` line, at a
+    ``# [Title](<url>)`` heading, or at ``# Page: <url>`` (titled by the
+    heading after it). The first heading of the file, if it isn't one of
+    these, is the title the converters write at the top.
+    """
+    lines = data.splitlines(keepends=True)
+    title = source = None
+    pages = []          # [title, url, first line]
+    first = True
+    fence = None
+    for i, line in enumerate(lines):
+        if fence:
+            if line.lstrip().startswith(fence):
+                fence = None
+            continue
+        if FENCE.match(line):
+            fence = FENCE.match(line).group(1)[:3]
+            continue
+        heading = HEADING.match(line)
+        if not heading:
+            continue
+        text = clean_markdown(heading.group(2).decode('utf-8', 'replace'))
+        page_url = PAGE_HEADING.match(line)
+        source_line = SOURCE_LINE.match(lines[i + 1]) if i + 1 < len(lines) else None
+        if first and not page_url:
+            title = text
+            source = source_line.group(1).decode() if source_line else None
+        elif page_url:
+            url = (page_url.group(1) or page_url.group(2)).decode()
+            pages.append([None if page_url.group(1) else text, url, i + 1])
+        elif source_line:
+            pages.append([text, source_line.group(1).decode(), i + 2])
+        elif pages and pages[-1][0] is None:
+            pages[-1][0] = text
+        first = False
+
+    result = []
+    for n, (page_title, url, start) in enumerate(pages):
+        end = pages[n + 1][2] if n + 1 < len(pages) else len(lines)
+        page_title = page_title or urlparse(url).path.rstrip('/').rsplit('/', 1)[-1] or url
+        result.append((page_title, url, _sentences(lines[start:end])))
+    return title, source, _strip_site_suffix(result)
+
+
+def _strip_site_suffix(pages):
+    """Drops a " | Site name" suffix that every page title shares."""
+    suffixes = {title.rpartition(' | ')[2] for title, _, _ in pages if ' | ' in title}
+    if len(suffixes) != 1 or not all(' | ' in title for title, _, _ in pages):
+        return pages
+    return [(title.rpartition(' | ')[0], url, sentences) for title, url, sentences in pages]
+
+
+def summarize(pages):
+    """One extractive summary sentence (or '') per page of `read_pages`."""
+    sentence_df = Counter(s for _, _, sentences in pages for s in set(sentences))
+    boilerplate = max(2, BOILERPLATE_PAGES * len(pages))
+    words = [[tokenize(s) for s in sentences] for _, _, sentences in pages]
+    word_df = Counter(w for page in words for w in set(w for sentence in page for w in sentence))
+    idf = {w: math.log(len(pages) / df) + 1 for w, df in word_df.items()}
+
+    summaries = []
+    for (_, _, sentences), page_words in zip(pages, words):
+        tf = Counter(w for sentence in page_words for w in sentence)
+        best, best_score = '', 0.0
+        for i, (sentence, sentence_words) in enumerate(zip(sentences, page_words)):
+            if sentence_df[sentence] > boilerplate or not sentence_words:
+                continue
+            unique = set(sentence_words)
+            score = sum(tf[w] * idf[w] for w in unique) / math.sqrt(len(sentence_words)) / (1 + POSITION_DECAY * i)
+            if score > best_score:
+                best, best_score = sentence, score
+        summaries.append(best)
+    return summaries
+
+
+def _groups(pages):
+    """[(section name, [page indexes])] by the first URL path segment the pages don't share."""
+    paths = [[part for part in urlparse(source).path.split('/') if part] for _, source, _ in pages]
+    prefix = 0
+    while paths and all(len(path) > prefix and path[prefix] == paths[0][prefix] for path in paths):
+        prefix += 1
+    groups = {}
+    for i, path in enumerate(paths):
+        key = path[prefix] if len(path) > prefix + 1 else ''
+        groups.setdefault(key, []).append(i)
+    if not 1 < len(groups) <= MAX_GROUPS:
+        return [('Pages', list(range(len(pages))))]
+    return [(key.replace('-', ' ').replace('_', ' ').capitalize() if key else 'Overview', members)
+            for key, members in groups.items()]
+
+
+def _cut(summary, words):
+    parts = summary.split()
+    if len(parts) <= words:
+        return summary
+    return " ".join(parts[:words]).rstrip(',;:') + '...' if words else ''
+
+
+def render(title, description, pages, summaries, words):
+    lines = [f"# {title}", "", f"> {description}", ""]
+    for name, members in _groups(pages):
+        lines += [f"## {name}", ""]
+        for i in members:
+            page_title, source, _ = pages[i]
+            summary = _cut(summaries[i], words)
+            lines.append(f"- [{page_title}]({source})" + (f": {summary}" if summary else ""))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def llms_txt(path, max_tokens=DEFAULT_MAX_TOKENS):
+    """(text, tokens) of the index of the output file at `path`, or None if it has no page URLs."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    title, source, pages = read_pages(data)
+    if not pages:
+        return None
+    name = os.path.basename(path)
+    title = title or os.path.splitext(name)[0]
+    description = (f"Index of the {len(pages)} pages in [{name}]({name})"
+                   + (f", crawled from {source}" if source else "")
+                   + ". Each entry links to the page's source, with a sentence from it.")
+    summaries = summarize(pages)
+
+    # Largest summary length that fits the budget
+    lo, hi = 0, MAX_SUMMARY_WORDS
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(render(title, description, pages, summaries, mid)) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    text = render(title, description, pages, summaries, lo if lo >= MIN_SUMMARY_WORDS else 0)
+    return text, count_tokens(text)
+
+
+def write_llms_txt(path, max_tokens=DEFAULT_MAX_TOKENS):
+    """Writes `<stem>.llms.txt` next to the output file at `path`; returns its path, or None."""
+    result = llms_txt(path, max_tokens)
+    if result is None:
+        print(f"{os.path.basename(path)}: no page URLs, no llms.txt index written")
+        return None
+    text, tokens = result
+    index_path = os.path.splitext(path)[0] + LLMS_TXT_SUFFIX
+    atomic_write(index_path, text.encode('utf-8'))
+    over = f" (over the {max_tokens:,}-token budget even without summaries)" if tokens > max_tokens else ""
+    print(f"{os.path.basename(index_path)}: {text.count(chr(10) + '- [')} pages, {tokens:,} tokens{over}")
+    return index_path
+
+
+def write_paths(paths, max_tokens=DEFAULT_MAX_TOKENS):
+    """Writes the index of every output file under `paths`."""
+    return [write_llms_txt(path, max_tokens) for path in input_files(paths)]
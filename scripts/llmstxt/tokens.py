@@ -0,0 +1,91 @@
+"""Token counts for the size reports printed by the converters.
+
+Tokenizers are pluggable (``get_tokenizer``); the default comes from the
+``LLMSTXT_TOKENIZER`` environment variable, else tiktoken's ``cl100k_base``
+when tiktoken is installed:
+
+* ``estimate`` — one token per four bytes of UTF-8, which is close enough
+  for English Markdown to compare two renderings of the same text;
+* ``tiktoken:<encoding>`` — e.g. ``tiktoken:o200k_base``;
+* ``hf:<name or tokenizer.json path>`` — a Hugging Face ``tokenizers``
+  tokenizer, e.g. ``hf:bert-base-uncased``.
+
+Every tokenizer counts a whole batch of texts per call (``count_batch``):
+tiktoken and ``tokenizers`` encode a batch on several threads in native
+code, so counting thousands of sections costs one call instead of thousands.
+"""
+import os
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+BYTES_PER_TOKEN = 4
+TOKENIZER_ENV = 'LLMSTXT_TOKENIZER'
+
+
+class ByteEstimate:
+    name = f'~{BYTES_PER_TOKEN} bytes/token estimate'
+
+    def count_batch(self, texts):
+        return [-(-len(text.encode('utf-8')) // BYTES_PER_TOKEN) for text in texts]
+
+
+class TiktokenTokenizer:
+    def __init__(self, encoding='cl100k_base'):
+        if tiktoken is None:
+            raise ValueError("The tiktoken tokenizer needs tiktoken: pip install tiktoken")
+        self.name = encoding
+        self.encoding = tiktoken.get_encoding(encoding)
+
+    def count_batch(self, texts):
+        # Special-token text counts as ordinary text, as it does in the documents
+        return [len(ids) for ids in self.encoding.encode_ordinary_batch(list(texts))]
+
+
+class HuggingFaceTokenizer:
+    def __init__(self, name):
+        from tokenizers import Tokenizer
+        self.name = f'hf:{name}'
+        self.tokenizer = Tokenizer.from_file(name) if os.path.isfile(name) else Tokenizer.from_pretrained(name)
+        self.tokenizer.no_truncation()
+
+    def count_batch(self, texts):
+        return [len(encoding.ids) for encoding in self.tokenizer.encode_batch(list(texts), add_special_tokens=False)]
+
+
+def get_tokenizer(spec=None):
+    """`estimate`, `tiktoken:<encoding>` or `hf:<name>`; None for the default."""
+    if spec is None:
+        spec = os.environ.get(TOKENIZER_ENV) or ('tiktoken:cl100k_base' if tiktoken is not None else 'estimate')
+    kind, _, name = spec.partition(':')
+    if kind == 'estimate':
+        return ByteEstimate()
+    if kind == 'tiktoken':
+        return TiktokenTokenizer(name or 'cl100k_base')
+    if kind == 'hf' and name:
+        return HuggingFaceTokenizer(name)
+    raise ValueError(f"Unknown tokenizer {spec!r}: use estimate, tiktoken:<encoding> or hf:<name>")
+
+
+_default = None
+
+
+def default_tokenizer():
+    global _default
+    if _default is None:
+        _default = get_tokenizer()
+    return _default
+
+
+def count_tokens(text):
+    return default_tokenizer().count_batch([text])[0]
+
+
+def count_batch(texts):
+    return default_tokenizer().count_batch(texts)
+
+
+def tokenizer_name():
+    return default_tokenizer().name
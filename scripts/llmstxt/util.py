@@ -0,0 +1,65 @@
+"""Small helpers shared across the llmstxt modules."""
+import contextlib
+import hashlib
+import os
+import tempfile
+
+
+def sha256_hex(data):
+    """Hex sha256 of bytes or a str (encoded as UTF-8)."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_umask():
+    """The process umask, from /proc on Linux so it is never changed, even briefly."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import, before any fetch threads exist: os.umask() sets the mask for the whole process
+_UMASK = _read_umask()
+
+
+def _file_mode(path):
+    """Mode for a rewrite of `path`: the existing file's, else what open() would give a new file."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode='wb', **kwargs):
+    """Yields a temp file next to `path` that replaces it only if the block succeeds.
+
+    For output written piece by piece; see `atomic_write`.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def atomic_write(path, data):
+    """Writes bytes via a temp file + rename so readers never see a partial file.
+
+    The file keeps its permissions (mkstemp would leave it owner-only).
+    """
+    with atomic_open(path) as f:
+        f.write(data)
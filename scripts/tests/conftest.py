@@ -0,0 +1,100 @@
+"""Fixtures shared by the tests: a local HTTP server standing in for a docs site."""
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class Site(ThreadingHTTPServer):
+    """Serves `/page/<n>` as a small HTML page and records each request.
+
+    `/slow/<seconds>/<n>` answers the same page after `seconds`, and
+    `/throttled/<status>/<seconds>/<n>` first answers `status` with a
+    `Retry-After` of `seconds`, then the page. `/pixel.png` is an image the
+    pages embed; every other path is a 404. `started` holds the monotonic
+    start time of each request and `peak` the most requests handled at once.
+    """
+
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), Handler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.throttled = set()
+        self.started = []
+        self.active = 0
+        self.peak = 0
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_port}{path}"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive, like a real server
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.started.append(time.monotonic())
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            self.respond()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def respond(self):
+        kind = self.path.split('/')[1]
+        if kind == 'throttled' and self.path not in self.server.throttled:
+            self.server.throttled.add(self.path)
+            _, _, status, seconds, _ = self.path.split('/')
+            self.send_response(int(status))
+            self.send_header('Retry-After', seconds)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if kind == 'pixel.png':
+            self.send(b'\x89PNG\r\n\x1a\n', 'image/png')
+            return
+        if kind == 'slow':
+            time.sleep(float(self.path.split('/')[2]))
+        elif kind not in ('page', 'throttled'):
+            self.send_error(404)
+            return
+        self.send(f"<html><head><title>{self.path}</title></head><body><h1>{self.path}</h1>"
+                  f"<img src=\"/pixel.png\"></body></html>".encode(), 'text/html')
+
+    def send(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = Site()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def refused_url():
+    """A URL on a local port nothing listens on."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    return f"http://127.0.0.1:{port}/page/0"
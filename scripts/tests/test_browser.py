@@ -0,0 +1,69 @@
+"""The Playwright page pool (llmstxt.browser); the pool tests need Playwright and Chromium.
+
+    python -m pytest scripts/tests
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.browser import BrowserPool, is_blocked  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def playwright():
+    return pytest.importorskip('playwright.async_api')
+
+
+@pytest.fixture(scope='module')
+def chromium(playwright):
+    async def probe():
+        async with playwright.async_playwright() as p:
+            browser = await p.chromium.launch()
+            await browser.close()
+
+    try:
+        asyncio.run(probe())
+    except playwright.Error as e:
+        pytest.skip(f"Chromium is not installed for Playwright ('playwright install chromium'): {e}")
+
+
+def test_is_blocked():
+    assert is_blocked('image', 'https://example.com/logo.png')
+    assert is_blocked('script', 'https://www.googletagmanager.com/gtm.js')
+    assert not is_blocked('script', 'https://example.com/app.js')
+
+
+def test_pool_renders_pages_in_order(chromium, site):
+    urls = [site.url(f'/page/{n}') for n in range(5)]
+
+    async def title(page, url):
+        await page.goto(url)
+        return await page.title()
+
+    async def crawl():
+        async with BrowserPool(size=2, cdp_url='') as pool:
+            titles = await pool.map(urls, title)
+            assert len(pool.contexts) == 2
+        return pool, titles
+
+    pool, titles = asyncio.run(crawl())
+    assert titles == [f'/page/{n}' for n in range(5)]
+    # Images are aborted before they reach the server
+    assert '/pixel.png' not in site.requests
+    assert (pool.browser, pool.playwright, pool.contexts) == (None, None, [])
+
+
+def test_failed_setup_stops_playwright(playwright, refused_url):
+    pool = BrowserPool(size=1, cdp_url=refused_url)
+
+    async def enter():
+        async with pool:
+            pass
+
+    with pytest.raises(playwright.Error):
+        asyncio.run(enter())
+    assert (pool.browser, pool.playwright, pool.contexts) == (None, None, [])
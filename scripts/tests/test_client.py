@@ -0,0 +1,47 @@
+"""The pooled HTTP client (llmstxt.client) against a local server, on both backends.
+
+The httpx backend is skipped unless httpx and h2 are installed. Over plain
+http:// it speaks HTTP/1.1 (h2 needs TLS), which still covers its request,
+timing and keep-alive handling.
+
+    python -m pytest scripts/tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.client import HttpClient, TimingStats  # noqa: E402
+
+
+@pytest.fixture(params=[False, True], ids=['requests', 'httpx'])
+def client(request):
+    if request.param:
+        pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+    client = HttpClient(max_per_host=2, http2=request.param)
+    assert client.http2 == request.param
+    yield client
+    client.close()
+
+
+def test_get_reuses_the_connection(client, site):
+    stats = TimingStats()
+    for n in range(3):
+        resp = client.get(site.url(f'/page/{n}'), timeout=5)
+        assert resp.status_code == 200
+        assert resp.headers['Content-Type'] == 'text/html'
+        assert f'<h1>/page/{n}</h1>'.encode() in resp.content
+        assert resp.timing.bytes == len(resp.content)
+        assert resp.timing.http_version == 'HTTP/1.1'
+        stats.add(resp.timing)
+    assert stats.requests == 3
+    assert stats.new_connections == 1
+
+
+def test_error_status_is_returned(client, site):
+    resp = client.get(site.url('/missing'), timeout=5)
+    assert resp.status_code == 404
+    assert resp.url == site.url('/missing')
@@ -0,0 +1,68 @@
+"""The Proxmox guide converter (scripts/convert.py) on a fixture of the guide's markup.
+
+    python -m pytest scripts/tests
+"""
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import convert  # noqa: E402
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'proxmox.html')
+
+# The differences from the original tree walk listed in convert.py's docstring
+EXPECTED = """\
+## 1. Introduction
+
+Proxmox VE is a platform to run virtual machines and containers. It is based on Debian Linux, and completely open source.
+
+Unique Multi-Master Design
+
+The integrated web-based management interface gives you a clean overview of all your KVM guests.
+
+### 1.1. Adding the nomodeset Kernel Parameter
+
+It can be added after installation with the following command:
+
+```
+# zpool add <pool-name> log </dev/path_to_fast_ssd>
+```
+
+1. Log in using the root (realm PAM) username and the password chosen during installation.
+2. Check your Firewall settings.
+
+- Complete operating system (Debian Linux, 64-bit)
+
+acl: <boolean>
+
+Explicitly enable or disable ACL support.
+
+> **NOTE:** Do not use UNetbootin. It does not work with the Proxmox VE installation image.
+
+| Release | enterprise |
+| Squid | yes |"""
+
+
+def test_tree_backend():
+    assert convert.convert_tree(FIXTURE) == EXPECTED
+
+
+def test_stream_backend_matches_tree():
+    pytest.importorskip('lxml')
+    out = io.StringIO()
+    convert.convert_stream(FIXTURE, out)
+    assert out.getvalue() == EXPECTED
+
+
+def test_missing_input_keeps_existing_output(tmp_path, monkeypatch):
+    output = tmp_path / 'llms-full.txt'
+    output.write_text("previous run\n")
+    monkeypatch.setattr(sys, 'argv', ['convert.py', '--parser', 'html.parser',
+                                      str(tmp_path / 'missing.html'), str(output)])
+    convert.main()
+    assert output.read_text() == "previous run\n"
+    assert os.listdir(tmp_path) == ['llms-full.txt']
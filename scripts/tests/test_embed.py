@@ -0,0 +1,70 @@
+"""Semantic search (llmstxt.embed) end to end, with each encoder.
+
+The sentence-transformers and fastembed cases are skipped unless the package
+is installed and huggingface.co is reachable: without network, loading an
+uncached model retries for a long time before it fails.
+
+    python -m pytest scripts/tests
+"""
+import os
+import socket
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.embed import VectorStore, embed_index, get_encoder  # noqa: E402
+from llmstxt.search import SearchIndex, build_index  # noqa: E402
+
+DOCS = """\
+# Demo
+
+# Install
+Source: https://example.com/install
+
+Add the client library to your project with npm install demo-js.
+
+# Realtime
+Source: https://example.com/realtime
+
+Subscribe to row changes in a table and receive every insert, update and delete.
+
+# Storage
+Source: https://example.com/storage
+
+Upload files to a bucket and serve them from the CDN.
+"""
+
+
+def load(spec, package):
+    if package:
+        pytest.importorskip(package)
+        try:
+            socket.create_connection(('huggingface.co', 443), timeout=3).close()
+        except OSError as e:
+            pytest.skip(f"cannot reach huggingface.co for {spec}: {e}")
+    return get_encoder(spec)
+
+
+@pytest.mark.parametrize('spec, package', [
+    ('hash', None),
+    ('st:sentence-transformers/all-MiniLM-L6-v2', 'sentence_transformers'),
+    ('fastembed:BAAI/bge-small-en-v1.5', 'fastembed'),
+], ids=['hash', 'sentence-transformers', 'fastembed'])
+def test_semantic_search(tmp_path, spec, package):
+    encoder = load(spec, package)
+    (tmp_path / 'demo.txt').write_text(DOCS)
+    index_path = build_index([str(tmp_path)])
+
+    vectors = encoder.encode(["first text", "second text"])
+    assert vectors.shape == (2, encoder.dim)
+
+    embed_index(index_path, encoder, jobs=1)
+    store = VectorStore(str(tmp_path))
+    store._encoder = encoder
+    with SearchIndex(index_path) as index:
+        store.check(index)
+        [(ids, scores)] = store.search(["subscribe to row changes"], k=2)
+        assert index.hit(ids[0]).source == 'https://example.com/realtime'
+    assert scores[0] >= scores[1]
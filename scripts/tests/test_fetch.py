@@ -0,0 +1,79 @@
+"""The fetch engine (llmstxt.fetch) against a local HTTP server.
+
+    python -m pytest scripts/tests
+"""
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.fetch import HostScheduler, iter_pages  # noqa: E402
+
+
+def test_pages_are_yielded_in_url_order(site):
+    # Earlier pages answer more slowly, so they finish last
+    urls = [site.url(f'/slow/{0.05 * (8 - n):.2f}/{n}') for n in range(8)]
+    pages = list(iter_pages(urls, concurrency=8, rate=0))
+    assert [page.url for page in pages] == urls
+    assert all(page.status == 200 and urlparse(page.url).path.encode() in page.content for page in pages)
+
+
+def test_concurrency_limit(site):
+    urls = [site.url(f'/slow/0.1/{n}') for n in range(12)]
+    pages = list(iter_pages(urls, concurrency=3, max_concurrency=3, rate=0))
+    assert len(pages) == 12
+    assert site.peak == 3
+
+
+def test_rate_limit(site):
+    urls = [site.url(f'/page/{n}') for n in range(6)]
+    list(iter_pages(urls, concurrency=6, rate=10))
+    # One token up front, then one every 100 ms
+    assert site.started[-1] - site.started[0] >= 0.45
+
+
+def test_failures_are_returned_as_pages(site, refused_url):
+    urls = [site.url('/page/0'), site.url('/missing'), refused_url]
+    pages = list(iter_pages(urls, rate=0, retries=0))
+    assert [page.url for page in pages] == urls
+    assert (pages[0].status, pages[0].error) == (200, None)
+    assert (pages[1].status, pages[1].error) == (404, None)
+    assert pages[2].status is None and pages[2].error and pages[2].content is None
+
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_retry_after_pauses_the_host(site, status):
+    # 1.2s is longer than the first retry's own backoff (at most 1s): only the header explains the pause
+    urls = [site.url(f'/throttled/{status}/1.2/0')] + [site.url(f'/page/{n}') for n in range(1, 5)]
+    pages = list(iter_pages(urls, concurrency=1, max_concurrency=1, rate=0, retries=1))
+    assert [page.status for page in pages] == [200] * 5
+    assert len(site.requests) == 6
+    # Nothing, not even the other pages, went to the host until Retry-After had passed
+    assert site.started[1] - site.started[0] >= 1.2
+    # ... and then the rest went through without further waiting
+    assert site.started[-1] - site.started[1] < 0.5
+
+
+def test_scheduler_backs_off_and_recovers():
+    scheduler = HostScheduler(4, 8, rate=8)
+    scheduler.throttled(2.0)
+    assert scheduler.limit == 2 and scheduler.bucket.rate == 4
+    assert scheduler.resume_at > time.monotonic() + 1.9
+    for _ in range(100):
+        scheduler.succeeded(0.01)
+    assert scheduler.limit == 8 and scheduler.bucket.rate == 8
+
+
+def test_fetch_ahead_is_bounded_while_consumer_stalls(site):
+    urls = [site.url(f'/page/{n}') for n in range(30)]
+    pages = iter_pages(urls, concurrency=4, rate=0, ahead=3)
+    assert next(pages).url == urls[0]
+    time.sleep(0.5)
+    # Page 0 was yielded; only pages 1-3 may have been fetched since
+    assert len(site.requests) <= 4
+    assert [page.url for page in pages] == urls[1:]
+    assert len(site.requests) == 30
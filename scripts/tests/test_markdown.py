@@ -0,0 +1,39 @@
+"""Code block conversion in llmstxt.markdown.
+
+    python -m pytest scripts/tests
+"""
+import os
+import sys
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.markdown import MarkdownConverter  # noqa: E402
+
+
+def convert(html, **kwargs):
+    return MarkdownConverter(**kwargs).convert(BeautifulSoup(f"<div>{html}</div>", 'html.parser').div)
+
+
+def test_shiki_lines_separated_by_newlines():
+    html = ('<pre class="shiki"><code><span class="line">a()</span>\n<span class="line">b()</span>\n'
+            '<span class="line"></span>\n<span class="line">c()</span></code></pre>')
+    assert convert(html) == "```\na()\nb()\n\nc()\n```\n\n"
+
+
+def test_twoslash_line_divs():
+    html = ('<pre class="shiki twoslash"><div class="language-id">ts</div><div class="code-container"><code>'
+            '<div class="line">a()</div><div class="line">b()</div><div class="line"></div>'
+            '<div class="line">c()</div></code><a class="playground-link">Try</a></div></pre>')
+    assert convert(html) == "```ts\na()\nb()\n\nc()\n```\n\n"
+
+
+def test_plain_pre_is_unchanged():
+    assert convert('<pre><code class="language-py">x = 1\n\ny = 2</code></pre>', code_lang='jsx') == \
+        "```py\nx = 1\n\ny = 2\n```\n\n"
+
+
+def test_unlabeled_json_and_shell():
+    assert convert('<pre>npm install react</pre>', code_lang='jsx') == "```bash\nnpm install react\n```\n\n"
+    assert convert('<pre>{"a": 1}</pre>', code_lang='jsx') == '```json\n{"a": 1}\n```\n\n'
@@ -0,0 +1,41 @@
+"""Tool dispatch of the doc-search server (llmstxt.server).
+
+    python -m pytest scripts/tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt.search import build_index  # noqa: E402
+from llmstxt.server import DocServer, ToolError  # noqa: E402
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / 'demo.txt').write_text(
+        "# Demo\n\n# Install\nSource: https://example.com/install\n\nRun npm install demo to get started.\n")
+    server = DocServer(build_index([str(tmp_path)]))
+    yield server
+    server.close()
+
+
+def test_search(server):
+    hits = server.call('search', {'query': 'install', 'k': 1})
+    assert [hit['library'] for hit in hits] == ['demo']
+
+
+@pytest.mark.parametrize('arguments', [{}, {'query': 'x', 'limit': 3}, ['install']])
+def test_bad_arguments_are_tool_errors(server, arguments):
+    with pytest.raises(ToolError, match="Bad arguments for search"):
+        server.call('search', arguments)
+
+
+def test_type_errors_inside_a_tool_propagate(server, monkeypatch):
+    def broken(*args, **kwargs):
+        raise TypeError("bug in search")
+    monkeypatch.setattr(server.index, 'search', broken)
+    with pytest.raises(TypeError, match="bug in search"):
+        server.call('search', {'query': 'install'})
@@ -0,0 +1,34 @@
+"""File helpers in llmstxt.util.
+
+    python -m pytest scripts/tests
+"""
+import os
+import stat
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llmstxt import util  # noqa: E402
+
+
+def test_umask_is_read_without_changing_it():
+    umask = os.umask(0o027)
+    try:
+        assert util._read_umask() == 0o027
+        assert os.umask(0o027) == 0o027
+    finally:
+        os.umask(umask)
+
+
+def test_atomic_write_keeps_permissions(tmp_path):
+    new = tmp_path / 'new.txt'
+    util.atomic_write(str(new), b"one")
+    assert stat.S_IMODE(new.stat().st_mode) == 0o666 & ~util._UMASK
+
+    existing = tmp_path / 'existing.txt'
+    existing.write_bytes(b"old")
+    existing.chmod(0o640)
+    util.atomic_write(str(existing), b"two")
+    assert existing.read_bytes() == b"two"
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+    assert sorted(os.listdir(tmp_path)) == ['existing.txt', 'new.txt']